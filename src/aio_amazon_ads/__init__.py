@@ -1,14 +1,32 @@
 """aio-amazon-ads: Unofficial native async Python client for Amazon Advertising API."""
 
 from .base import COUNTRY_TO_MARKETPLACE, Marketplace
+from .bulk import BulkItem, BulkResult
 from .client import AmazonAdsClient
+from .coalescing import WriteBuffer
+from .crawler import EntityEvent
 from .exceptions import (
     AmazonAPIError,
     AuthenticationError,
+    NotFoundError,
+    PayloadTooLargeError,
+    ReportError,
+    ReportTimeoutError,
     ServerError,
     ThrottlingError,
     ValidationError,
 )
+from .index import EntityIndex
+from .journal import WriteJournal
+from .keyword_index import KeywordIndex, PreflightResult, normalize_keyword_text
+from .pagination import Cursor, Page, shard_by_ids, shard_by_values
+from .quota import QuotaStatus, QuotaTracker
+from .report_tracker import ReportResult, ReportTracker
+from .reporting import ReportProgress, ReportTimings
+from .sizing import BatchSizer
+from .snapshot import RefreshResult, SnapshotStore
+from .sync import SyncResult
+from .upsert import UpsertResult
 
 __version__ = "0.1.0"
 __all__ = [
@@ -17,7 +35,35 @@ __all__ = [
     "COUNTRY_TO_MARKETPLACE",
     "AmazonAPIError",
     "AuthenticationError",
+    "NotFoundError",
+    "PayloadTooLargeError",
+    "ReportError",
+    "ReportTimeoutError",
     "ServerError",
     "ThrottlingError",
     "ValidationError",
+    "BatchSizer",
+    "BulkItem",
+    "BulkResult",
+    "Cursor",
+    "EntityEvent",
+    "EntityIndex",
+    "KeywordIndex",
+    "Page",
+    "PreflightResult",
+    "QuotaStatus",
+    "QuotaTracker",
+    "RefreshResult",
+    "ReportProgress",
+    "ReportResult",
+    "ReportTimings",
+    "ReportTracker",
+    "SnapshotStore",
+    "SyncResult",
+    "UpsertResult",
+    "WriteBuffer",
+    "WriteJournal",
+    "normalize_keyword_text",
+    "shard_by_ids",
+    "shard_by_values",
 ]
@@ -8,32 +8,146 @@ Supports multiple marketplaces:
 
 import asyncio
 import logging
+import math
+import re
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+)
+from contextlib import aclosing
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 import httpx
 from tenacity import (
+    RetryCallState,
     before_sleep_log,
     retry,
-    retry_if_exception_type,
     stop_after_attempt,
     wait_exponential_jitter,
 )
 
+from .batching import GetBatcher
+from .bulk import (
+    DEFAULT_BULK_BACKOFF,
+    DEFAULT_BULK_RETRIES,
+    SUCCESS,
+    BulkItem,
+    BulkResult,
+    StateChangeProgress,
+    is_retryable,
+    request_failure,
+    run_bulk_write,
+)
+from .coalescing import DEFAULT_FLUSH_INTERVAL, DEFAULT_MAX_PENDING, WriteBuffer
 from .exceptions import (
+    TRANSIENT_ERRORS,
     AmazonAPIError,
     AuthenticationError,
+    NotFoundError,
+    PayloadTooLargeError,
     ServerError,
     ThrottlingError,
     ValidationError,
 )
+from .journal import WriteJournal
+from .pagination import DEFAULT_ID_CHUNK_SIZE, Cursor, Page, chunk_ids, shard_by_ids
+from .quota import QuotaStatus, QuotaTracker, parse_retry_after
+from .sizing import DEFAULT_TARGET_WRITE_LATENCY, BatchSizer
+from .streaming import DEFAULT_STREAM_IN_FLIGHT, apply_stream
+from .sync import SyncResult, diff_entity
+from .upsert import NaturalKey, UpsertResult
+from .validation import VALID_CAMPAIGN_STATES
 
 logger = logging.getLogger(__name__)
 
 TOKEN_URL = "https://api.amazon.com/auth/o2/token"
 
+# Pages the paginator fetches ahead of the consumer
+DEFAULT_PREFETCH_PAGES = 1
+
+# Requests a client keeps in flight at once
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Shards a sharded listing crawls at once
+DEFAULT_SHARD_CONCURRENCY = 4
+
+# Items requested per page from startIndex/count endpoints
+DEFAULT_INDEX_PAGE_SIZE = 1000
+
+# ID chunks a batched get fetches at once
+DEFAULT_GET_MANY_CONCURRENCY = 4
+
+# Items requested per page from v3 POST list endpoints
+DEFAULT_V3_MAX_RESULTS = 5000
+
+# Entities sent per create/edit request unless a service allows more
+DEFAULT_WRITE_CHUNK_SIZE = 100
+
+# Create/edit chunks a bulk write sends at once
+DEFAULT_WRITE_CONCURRENCY = 4
+
+# IDs per request of a v3 bulk delete endpoint
+DEFAULT_DELETE_CHUNK_SIZE = 1000
+
+# 400 responses whose message blames the request size rather than its content
+_SIZE_ERROR = re.compile(
+    r"too large|too many (items|entities|elements|records)|maximum (number|size)|size limit",
+    re.IGNORECASE,
+)
+
+# Errors after which a smaller chunk may succeed
+_CHUNK_SIZE_ERRORS = (PayloadTooLargeError, httpx.TimeoutException)
+
+
+def _is_retried(retry_state: RetryCallState) -> bool:
+    """Retry transient errors, except timeouts of requests sent with retry_timeouts=False."""
+    outcome = retry_state.outcome
+    if outcome is None or not outcome.failed:
+        return False
+    error = outcome.exception()
+    if isinstance(error, httpx.TimeoutException) and not retry_state.kwargs.get(
+        "retry_timeouts", True
+    ):
+        return False
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+def _normalize_state(state: str) -> str:
+    """Validate an entity state and return it in the lowercase form v2 endpoints use."""
+    if state.upper() not in VALID_CAMPAIGN_STATES:
+        raise ValueError(f"Invalid state: {state}. Must be one of: {VALID_CAMPAIGN_STATES}")
+    return state.lower()
+
+
+def v3_list_body(max_results: int, **filters: str | Iterable[str | int] | None) -> dict[str, Any]:
+    """Build the request body of a v3 POST list endpoint.
+
+    Args:
+        max_results: Page size (maxResults)
+        **filters: v3 filter names mapped to an ID/state or iterable of them.
+            Comma-separated strings are split. None values are omitted.
+
+    Returns:
+        Body with each filter wrapped as ``{"include": [...]}``
+    """
+    if max_results < 1:
+        raise ValueError("max_results must be at least 1")
+    body: dict[str, Any] = {"maxResults": max_results}
+    for name, values in filters.items():
+        if values is None:
+            continue
+        if isinstance(values, str):
+            values = values.split(",")
+        body[name] = {"include": [str(value) for value in values]}
+    return body
+
 
 class Marketplace(Enum):
     """Amazon Advertising API marketplaces."""
@@ -87,6 +201,8 @@ class BaseClient:
         client_id: str,
         client_secret: str,
         marketplace: Marketplace = Marketplace.NA,
+        quota_tracker: QuotaTracker | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """Initialize Amazon Ads client.
 
@@ -96,6 +212,10 @@ class BaseClient:
             client_id: LWA client ID
             client_secret: LWA client secret
             marketplace: API marketplace (NA, EU, FE). Defaults to NA.
+            quota_tracker: Quota telemetry tracker, share one across clients to
+                compare headroom between profiles. Defaults to a private tracker.
+            max_concurrency: Maximum number of requests in flight at once. Bounds
+                every concurrent helper (sharded listing, bulk writes, crawls).
         """
         self.refresh_token = refresh_token
         self.profile_id = profile_id
@@ -109,6 +229,8 @@ class BaseClient:
         self._token_lock = asyncio.Lock()
         self._access_token: str | None = None
         self._token_expires_at: float = 0
+        self.quota = quota_tracker if quota_tracker is not None else QuotaTracker()
+        self._request_slots = asyncio.Semaphore(max_concurrency)
 
     async def _get_http(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -146,6 +268,17 @@ class BaseClient:
         """Async context manager exit."""
         await self.close()
 
+    def quota_status(self, ad_product: str | None = None) -> list[QuotaStatus]:
+        """Return rate-limit telemetry for this client's profile.
+
+        Args:
+            ad_product: Only include this ad product (sp, sb, sd, common)
+
+        Returns:
+            List of QuotaStatus snapshots, one per ad product seen so far
+        """
+        return self.quota.status(profile_id=self.profile_id, ad_product=ad_product)
+
     async def _get_access_token(self) -> str:
         """Get valid access token, refresh if expired."""
         if self._access_token and time.time() < self._token_expires_at - 300:
@@ -198,8 +331,14 @@ class BaseClient:
                 f"Rate limit exceeded: {response_text}",
                 retry_after=60,
             )
+        elif status_code == 413:
+            return PayloadTooLargeError(f"Payload too large: {response_text}")
+        elif status_code == 400 and _SIZE_ERROR.search(response_text):
+            return PayloadTooLargeError(f"Validation error: {response_text}")
         elif status_code == 400:
             return ValidationError(f"Validation error: {response_text}")
+        elif status_code == 404:
+            return NotFoundError(f"Not found: {response_text}")
         elif status_code >= 500:
             return ServerError(f"Server error {status_code}: {response_text}")
         else:
@@ -208,9 +347,7 @@ class BaseClient:
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential_jitter(initial=1, max=60),
-        retry=retry_if_exception_type(
-            (ThrottlingError, ServerError, httpx.NetworkError, httpx.TimeoutException)
-        ),
+        retry=_is_retried,
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )
@@ -220,31 +357,49 @@ class BaseClient:
         path: str,
         params: dict | None = None,
         json_data: Any | None = None,
+        headers: dict[str, str] | None = None,
+        retry_timeouts: bool = True,
+        follow_redirects: bool = False,
     ) -> httpx.Response:
-        """Make HTTP request with automatic retry via tenacity."""
+        """Make HTTP request with automatic retry via tenacity.
+
+        ``headers`` are merged over the defaults, e.g. to send the versioned
+        media types the v3 endpoints require. With ``retry_timeouts`` off a
+        timeout is raised at once, for callers that resend a smaller request.
+        ``follow_redirects`` follows redirects such as the one from a report
+        location to its pre-signed file URL.
+        """
         logger.debug(f"Request: {method} {path} params={params}")
 
         http = await self._get_http()
         access_token = await self._get_access_token()
 
-        headers = {
+        request_headers = {
             "Authorization": f"Bearer {access_token}",
+            "Amazon-Advertising-API-ClientId": self.client_id,
             "Amazon-Advertising-API-Scope": self.profile_id,
             "Content-Type": "application/json",
         }
+        if headers:
+            request_headers.update(headers)
 
-        response = await http.request(
-            method=method,
-            url=path,
-            params=params,
-            json=json_data,
-            headers=headers,
-        )
+        async with self._request_slots:
+            response = await http.request(
+                method=method,
+                url=path,
+                params=params,
+                json=json_data,
+                headers=request_headers,
+                follow_redirects=follow_redirects,
+            )
 
         # Log request ID for debugging
         request_id = response.headers.get("X-Amzn-Request-Id")
         logger.debug(f"Response: {response.status_code} (X-Amzn-Request-Id: {request_id})")
 
+        retry_after_seconds = parse_retry_after(response.headers.get("Retry-After"))
+        self.quota.record(self.profile_id, path, response.status_code, retry_after_seconds)
+
         # Handle 401 - invalidate token and let tenacity retry
         if response.status_code == 401:
             logger.error(
@@ -255,7 +410,7 @@ class BaseClient:
 
         # Handle 429 - raise ThrottlingError for tenacity to catch
         if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", 60))
+            retry_after = retry_after_seconds if retry_after_seconds is not None else 60
             logger.warning(
                 f"Rate limited (X-Amzn-Request-Id: {request_id}), retry after {retry_after}s"
             )
@@ -274,5 +429,1124 @@ class BaseClient:
 class BaseService:
     """Base service for API endpoints."""
 
+    id_key: str | None = None
+    """Entity field holding the ID, e.g. keywordId"""
+
+    campaign_filter: str | None = None
+    """list_pages() argument taking comma-separated campaign IDs"""
+
+    write_chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE
+    """Maximum entities the endpoint accepts per create/edit request"""
+
+    natural_key: NaturalKey | None = None
+    """Fields matching entities without their ID, enables upsert()"""
+
     def __init__(self, request: Callable[..., Any]):
         self._request: Callable[..., Any] = request
+        self.prefetch_pages: int = DEFAULT_PREFETCH_PAGES
+        self.write_concurrency: int = DEFAULT_WRITE_CONCURRENCY
+        self._get_batcher: GetBatcher | None = None
+        self.write_sizer: BatchSizer | None = None
+        """Adapts the create/edit chunk size when set, see enable_adaptive_writes()"""
+        self.journal: WriteJournal | None = None
+        """Records create/edit outcomes and skips confirmed items when set"""
+
+    def enable_get_batching(
+        self,
+        window: float = 0.0,
+        max_batch_size: int = DEFAULT_ID_CHUNK_SIZE,
+    ) -> None:
+        """Send concurrent get() calls of this service as batched get_many() requests.
+
+        Calls arriving within ``window`` seconds are combined into one list
+        request with a multi-ID filter. Call sites stay unchanged; an entity
+        missing from the batch raises NotFoundError like a 404 would.
+
+        Args:
+            window: Seconds to collect calls, 0 batches calls of one event loop iteration
+            max_batch_size: Number of distinct IDs that sends a batch immediately
+
+        Raises:
+            TypeError: If the service has no get_many()
+        """
+        get_many = getattr(self, "get_many", None)
+        if get_many is None:
+            raise TypeError(f"{type(self).__name__} does not support batched gets")
+        self._get_batcher = GetBatcher(get_many, window, max_batch_size)
+
+    def disable_get_batching(self) -> None:
+        """Send every get() call as its own request again."""
+        self._get_batcher = None
+
+    def enable_adaptive_writes(
+        self,
+        target_latency: float = DEFAULT_TARGET_WRITE_LATENCY,
+        min_size: int = 1,
+        initial_size: int | None = None,
+    ) -> BatchSizer:
+        """Let create() and edit() adapt their chunk size to observed outcomes.
+
+        A chunk that times out or is rejected as too large is split and
+        resent at a smaller size, and the size for later chunks shrinks.
+        Chunks finishing within ``target_latency`` let the size grow back up
+        to ``write_chunk_size``. The size carries over between calls.
+
+        Args:
+            target_latency: Seconds a create/edit request should take at most
+            min_size: Smallest chunk size; chunks this small are not split further
+            initial_size: Starting chunk size, defaults to write_chunk_size
+
+        Returns:
+            The sizer, whose ``size`` and ``history`` show the chosen chunk sizes
+
+        Raises:
+            TypeError: If the service has neither create() nor edit()
+        """
+        if not hasattr(self, "create") and not hasattr(self, "edit"):
+            raise TypeError(f"{type(self).__name__} does not support bulk writes")
+        self.write_sizer = BatchSizer(
+            self.write_chunk_size,
+            min_size=min_size,
+            initial_size=initial_size,
+            target_latency=target_latency,
+        )
+        return self.write_sizer
+
+    def disable_adaptive_writes(self) -> None:
+        """Send create/edit chunks of write_chunk_size again."""
+        self.write_sizer = None
+
+    async def bulk_create(
+        self,
+        items: list[dict],
+        max_retries: int = DEFAULT_BULK_RETRIES,
+        backoff: float = DEFAULT_BULK_BACKOFF,
+    ) -> BulkResult:
+        """Create entities and resend only the items that failed transiently.
+
+        Args:
+            items: Entities to create
+            max_retries: Rounds of selective retries after the first write
+            backoff: Seconds before the first retry, doubled for each further retry
+
+        Returns:
+            BulkResult with succeeded, failed and retryable items by input index
+
+        Raises:
+            TypeError: If the service has no create()
+        """
+        return await run_bulk_write(self._write_method("create"), items, max_retries, backoff)
+
+    async def bulk_edit(
+        self,
+        items: list[dict],
+        max_retries: int = DEFAULT_BULK_RETRIES,
+        backoff: float = DEFAULT_BULK_BACKOFF,
+    ) -> BulkResult:
+        """Edit entities and resend only the items that failed transiently.
+
+        Args:
+            items: Entities to update
+            max_retries: Rounds of selective retries after the first write
+            backoff: Seconds before the first retry, doubled for each further retry
+
+        Returns:
+            BulkResult with succeeded, failed and retryable items by input index
+
+        Raises:
+            TypeError: If the service has no edit()
+        """
+        return await run_bulk_write(self._write_method("edit"), items, max_retries, backoff)
+
+    async def sync_desired_state(
+        self,
+        desired: list[dict],
+        current: Mapping[str, dict | None] | None = None,
+    ) -> SyncResult:
+        """Edit only the entities and fields that differ from their current state.
+
+        Each desired entity is compared with its known state. Entities already
+        in the desired state are dropped, and the rest are sent with only
+        their changed fields. The known state comes from ``current``, e.g. a
+        cache or snapshot. IDs missing from it are fetched with batched
+        get_many() requests.
+
+        Args:
+            desired: Desired entities, each holding the ID and the fields to set
+            current: Known entities by ID; None fetches every entity
+
+        Returns:
+            SyncResult with the sent deltas, their results, and the unchanged
+            and missing entities
+
+        Raises:
+            TypeError: If the service has no edit()
+            ValueError: If a desired entity has no ID
+        """
+        edit = self._write_method("edit")
+        id_key = self.id_key
+        if id_key is None:
+            raise TypeError(f"{type(self).__name__} does not support diff-based edits")
+        ids = []
+        for entity in desired:
+            if entity.get(id_key) is None:
+                raise ValueError(f"Desired entity has no {id_key}")
+            ids.append(str(entity[id_key]))
+
+        known: dict[str, dict | None] = {}
+        if current is not None:
+            known.update((str(key), value) for key, value in current.items())
+        unknown = [entity_id for entity_id in dict.fromkeys(ids) if entity_id not in known]
+        get_many = getattr(self, "get_many", None)
+        if unknown and get_many is not None:
+            known.update(await get_many(unknown))
+
+        result = SyncResult()
+        for entity_id, entity in zip(ids, desired, strict=True):
+            state = known.get(entity_id)
+            if state is None:
+                result.missing.append(entity)
+                continue
+            delta = diff_entity(entity, state, id_key)
+            if delta is None:
+                result.unchanged.append(entity_id)
+            else:
+                result.changes.append(delta)
+        logger.debug(
+            f"Syncing {len(result.changes)} of {len(desired)} entities, "
+            f"{len(result.unchanged)} unchanged, {len(result.missing)} unknown"
+        )
+        if result.changes:
+            result.results = await edit(result.changes)
+        return result
+
+    async def upsert(
+        self,
+        entities: list[dict],
+        existing: Iterable[dict] | None = None,
+    ) -> UpsertResult:
+        """Create entities that do not exist yet and edit the ones that do.
+
+        Entities are matched to existing ones by their natural key, e.g. the
+        ad group, keyword text and match type of a keyword. Archived entities
+        never match. Natural key and other create-only fields are not sent
+        in edits. Existing entities come from ``existing``, e.g. a local
+        index or snapshot. Without it they are listed with batched requests,
+        filtered by the parents of the input. Matched entities are edited with
+        only their changed fields, and unchanged ones are skipped. Creates and
+        edits are sent concurrently in chunked bulk calls. Inputs with the same
+        natural key are merged, and later fields win.
+
+        Args:
+            entities: Desired entities, each holding its natural key fields
+            existing: Known entities of this type; None lists them
+
+        Returns:
+            UpsertResult with the sent creates and edits and their results
+
+        Raises:
+            TypeError: If the service does not support upserts
+            ValueError: If an entity lacks a natural key field
+        """
+        key = self.natural_key
+        id_key = self.id_key
+        if key is None or id_key is None:
+            raise TypeError(f"{type(self).__name__} does not support upserts")
+        create = self._write_method("create")
+        edit = self._write_method("edit")
+
+        desired: dict[tuple, dict] = {}
+        for entity in entities:
+            entity_key = key(entity)
+            desired[entity_key] = {**desired.get(entity_key, {}), **entity}
+        if existing is None:
+            existing = await self._upsert_candidates(key, desired.values())
+        matches = {
+            key(entity): entity
+            for entity in existing
+            if str(entity.get("state", "")).lower() != "archived"
+        }
+
+        result = UpsertResult()
+        for entity_key, entity in desired.items():
+            match = matches.get(entity_key)
+            if match is None:
+                result.creates.append(entity)
+                continue
+            fixed = (*key.fields, *key.create_only)
+            changes = {name: value for name, value in entity.items() if name not in fixed}
+            changes[id_key] = match[id_key]
+            delta = diff_entity(changes, match, id_key)
+            if delta is None:
+                result.unchanged.append(str(match[id_key]))
+            else:
+                result.edits.append(delta)
+        logger.debug(
+            f"Upserting {len(desired)} entities: {len(result.creates)} creates, "
+            f"{len(result.edits)} edits, {len(result.unchanged)} unchanged"
+        )
+
+        async def send(write: Callable[..., Any], items: list[dict]) -> list[dict]:
+            return await write(items) if items else []
+
+        result.created, result.edited = await asyncio.gather(
+            send(create, result.creates), send(edit, result.edits)
+        )
+        return result
+
+    async def _upsert_candidates(self, key: NaturalKey, entities: Iterable[dict]) -> list[dict]:
+        """List the existing entities an upsert may match."""
+        service: Any = self
+        if key.parent_key is None or key.parent_filter is None:
+            return [entity async for entity in service.list()]
+        parents = list(dict.fromkeys(str(entity[key.parent_key]) for entity in entities))
+        if not parents:
+            return []
+        shards = shard_by_ids(key.parent_filter, parents)
+        return [entity async for entity in service.list_sharded(shards)]
+
+    async def apply_stream(
+        self,
+        changes: AsyncIterable[dict],
+        operation: Literal["create", "edit"] = "edit",
+        batch_size: int | None = None,
+        max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT,
+        linger: float | None = None,
+    ) -> AsyncGenerator[BulkItem, None]:
+        """Write a stream of changes in batches and yield results as batches complete.
+
+        Changes are read only while fewer than ``max_in_flight`` batches are
+        being written and their results have been consumed, so memory stays
+        bounded and the producer is slowed down to the API's pace. See
+        streaming.apply_stream().
+
+        Args:
+            changes: Async iterable of entities, e.g. rows from a DB cursor
+            operation: create or edit
+            batch_size: Maximum items per batch, defaults to write_chunk_size
+            max_in_flight: Maximum batches being written at once
+            linger: Seconds to wait for more changes before sending a partial batch
+
+        Yields:
+            BulkItem per change in completion order, ``index`` being its stream position
+
+        Raises:
+            TypeError: If the service does not support the operation
+        """
+        if operation not in ("create", "edit"):
+            raise ValueError(f"Unknown operation: {operation}")
+        write = self._write_method(operation)
+        size = batch_size if batch_size is not None else self.write_chunk_size
+        async with aclosing(apply_stream(write, changes, size, max_in_flight, linger)) as stream:
+            async for item in stream:
+                yield item
+
+    async def set_state_where(
+        self,
+        predicate: Callable[[dict], bool],
+        state: str,
+        campaign_ids: Iterable[str | int] | None = None,
+        max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT,
+        on_progress: Callable[[StateChangeProgress], None] | None = None,
+    ) -> BulkResult:
+        """Change the state of every entity matching a predicate.
+
+        Entities are streamed from the listing and matched as they arrive.
+        Matches are sent as chunked edits while the listing continues.
+        Entities already in the target state, or archived, are skipped.
+
+        Example:
+            result = await client.sp.keywords.set_state_where(
+                lambda kw: acos.get(kw["keywordId"], 0) > 0.4, "paused", campaign_ids=ids
+            )
+
+        Args:
+            predicate: Returns True for entities to change
+            state: enabled, paused or archived
+            campaign_ids: Only scan entities of these campaigns; None scans the account
+            max_in_flight: Maximum edit batches in flight at once
+            on_progress: Called with running counts after every written entity
+
+        Returns:
+            BulkResult of the edits
+
+        Raises:
+            TypeError: If the service has no edit() or cannot filter by campaign
+        """
+        state = _normalize_state(state)
+        id_key = self._require_id_key()
+        service: Any = self
+        if campaign_ids is None:
+            source = service.list()
+        elif self.campaign_filter is None:
+            raise TypeError(f"{type(self).__name__} cannot be scoped to campaigns")
+        else:
+            source = service.list_sharded(shard_by_ids(self.campaign_filter, campaign_ids))
+        progress = StateChangeProgress()
+
+        async def changes() -> AsyncGenerator[dict, None]:
+            async with aclosing(source) as entities:
+                async for entity in entities:
+                    progress.scanned += 1
+                    current = str(entity.get("state", "")).lower()
+                    if current in (state, "archived") or not predicate(entity):
+                        continue
+                    progress.matched += 1
+                    yield {id_key: entity[id_key], "state": state}
+
+        return await self._apply_states(changes(), max_in_flight, progress, on_progress)
+
+    async def set_state_many(
+        self,
+        ids: Iterable[str | int],
+        state: str,
+        max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT,
+        on_progress: Callable[[StateChangeProgress], None] | None = None,
+    ) -> BulkResult:
+        """Change the state of many entities with chunked, concurrent edits.
+
+        Args:
+            ids: Entity IDs
+            state: enabled, paused or archived
+            max_in_flight: Maximum edit batches in flight at once
+            on_progress: Called with running counts after every written entity
+
+        Returns:
+            BulkResult of the edits
+
+        Raises:
+            TypeError: If the service has no edit()
+        """
+        state = _normalize_state(state)
+        id_key = self._require_id_key()
+        progress = StateChangeProgress()
+
+        async def changes() -> AsyncGenerator[dict, None]:
+            for entity_id in ids:
+                progress.scanned += 1
+                progress.matched += 1
+                yield {id_key: entity_id, "state": state}
+
+        return await self._apply_states(changes(), max_in_flight, progress, on_progress)
+
+    async def archive_many(
+        self,
+        ids: Iterable[str | int],
+        max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT,
+        on_progress: Callable[[StateChangeProgress], None] | None = None,
+    ) -> BulkResult:
+        """Archive many entities with chunked edits, see set_state_many()."""
+        return await self.set_state_many(ids, "archived", max_in_flight, on_progress)
+
+    async def delete_many(
+        self,
+        ids: Iterable[str | int],
+        max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT,
+    ) -> dict[str, dict]:
+        """Delete many entities by archiving them with chunked, concurrent edits.
+
+        Services with a bulk delete endpoint override this to use it.
+
+        Args:
+            ids: Entity IDs
+            max_in_flight: Maximum edit batches in flight at once
+
+        Returns:
+            Mapping of every requested ID (as string, in input order) to its
+            per-item result, e.g. {"code": "SUCCESS", "keywordId": ...}
+
+        Raises:
+            TypeError: If the service has no edit()
+        """
+        unique = self._unique_ids(ids)
+        result = await self.archive_many(unique.values(), max_in_flight)
+        keys = list(unique)
+        outcomes = {
+            keys[item.index]: item.result
+            for item in (*result.succeeded, *result.failed, *result.retryable)
+        }
+        return {entity_id: outcomes[entity_id] for entity_id in unique}
+
+    async def _delete_many_v3(
+        self,
+        ids: Iterable[str | int],
+        path: str,
+        id_filter: str,
+        result_key: str,
+        media_type: str,
+        max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT,
+    ) -> dict[str, dict]:
+        """Delete many entities through a v3 bulk delete endpoint.
+
+        Unique IDs are sent in chunks of up to DEFAULT_DELETE_CHUNK_SIZE,
+        ``max_in_flight`` chunks at once. A chunk that still fails after
+        the request retries reports a REQUEST_FAILED result for each of its
+        IDs so the other chunks' results are kept. IDs missing from a response
+        get a retryable REQUEST_FAILED result.
+
+        Args:
+            ids: Entity IDs
+            path: Delete endpoint path, e.g. /sp/keywords/delete
+            id_filter: Body field holding the IDs, e.g. keywordIdFilter
+            result_key: Response field holding the outcomes, e.g. keywords
+            media_type: v3 media type of the entity
+            max_in_flight: Maximum chunks being deleted at once
+
+        Returns:
+            Mapping of every requested ID (as string, in input order) to its result
+
+        Raises:
+            AmazonAPIError: If every chunk failed
+        """
+        unique = list(self._unique_ids(ids))
+        size = DEFAULT_DELETE_CHUNK_SIZE
+        chunks = [unique[start : start + size] for start in range(0, len(unique), size)]
+        slots = asyncio.Semaphore(max_in_flight)
+
+        async def send(chunk: list[str]) -> Any:
+            async with slots:
+                response = await self._request(
+                    "POST",
+                    path,
+                    json_data={id_filter: {"include": chunk}},
+                    headers={"Content-Type": media_type, "Accept": media_type},
+                )
+                return response.json()
+
+        responses = await asyncio.gather(*(send(chunk) for chunk in chunks), return_exceptions=True)
+        failures = [response for response in responses if isinstance(response, BaseException)]
+        if chunks and len(failures) == len(chunks):
+            raise failures[0]
+
+        outcomes: dict[str, dict] = {}
+        for chunk, response in zip(chunks, responses, strict=True):
+            if isinstance(response, BaseException):
+                if not isinstance(response, Exception):
+                    raise response
+                logger.warning(f"POST {path}: chunk of {len(chunk)} IDs failed: {response}")
+                outcomes.update((entity_id, request_failure(response)) for entity_id in chunk)
+                continue
+            data = response.get(result_key, {})
+            for entry in data.get("success", []):
+                result = {key: value for key, value in entry.items() if key != "index"}
+                outcomes[chunk[entry["index"]]] = {"code": SUCCESS, **result}
+            for entry in data.get("error", []):
+                errors = entry.get("errors", [])
+                code = errors[0].get("errorType", "ERROR") if errors else "ERROR"
+                outcomes[chunk[entry["index"]]] = {"code": code, "errors": errors}
+
+        # IDs the response left out were not confirmed either way, so deleting
+        # them again is safe and worth a try
+        missing = "No result returned"
+        return {
+            entity_id: outcomes.get(entity_id) or request_failure(missing, retryable=True)
+            for entity_id in unique
+        }
+
+    async def _delete_each(
+        self,
+        ids: Iterable[str | int],
+        delete: Callable[[Any], Awaitable[dict]],
+        max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT,
+    ) -> dict[str, dict]:
+        """Delete many entities with concurrent single-ID requests.
+
+        For endpoints without a bulk delete or archive. A failed request
+        reports a REQUEST_FAILED result for its ID.
+
+        Args:
+            ids: Entity IDs
+            delete: Deletes one entity, e.g. client.portfolios.delete
+            max_in_flight: Maximum requests at once
+
+        Returns:
+            Mapping of every requested ID (as string, in input order) to its result
+        """
+        slots = asyncio.Semaphore(max_in_flight)
+
+        async def send(entity_id: str | int) -> dict:
+            async with slots:
+                try:
+                    response = await delete(entity_id)
+                except (AmazonAPIError, *TRANSIENT_ERRORS) as e:
+                    logger.warning(f"Deleting {entity_id} failed: {e}")
+                    return request_failure(e)
+            return response if isinstance(response, dict) else {"code": SUCCESS}
+
+        unique = self._unique_ids(ids)
+        results = await asyncio.gather(*(send(entity_id) for entity_id in unique.values()))
+        return dict(zip(unique, results, strict=True))
+
+    @staticmethod
+    def _unique_ids(ids: Iterable[str | int]) -> dict[str, str | int]:
+        """Map each distinct ID, as string, to its first input value, keeping order."""
+        unique: dict[str, str | int] = {}
+        for entity_id in ids:
+            key = str(entity_id)
+            if not key:
+                raise ValueError("IDs must not be empty")
+            unique.setdefault(key, entity_id)
+        return unique
+
+    async def _apply_states(
+        self,
+        changes: AsyncGenerator[dict, None],
+        max_in_flight: int,
+        progress: StateChangeProgress,
+        on_progress: Callable[[StateChangeProgress], None] | None,
+    ) -> BulkResult:
+        result = BulkResult(attempts=1)
+        async with aclosing(self.apply_stream(changes, "edit", None, max_in_flight)) as stream:
+            async for item in stream:
+                if item.code == SUCCESS:
+                    result.succeeded.append(item)
+                    progress.succeeded += 1
+                else:
+                    target = result.retryable if is_retryable(item.result) else result.failed
+                    target.append(item)
+                    progress.failed += 1
+                if on_progress is not None:
+                    on_progress(progress)
+        for outcomes in (result.succeeded, result.failed, result.retryable):
+            outcomes.sort(key=lambda outcome: outcome.index)
+        logger.info(
+            f"{type(self).__name__}: state changed for {progress.succeeded} of "
+            f"{progress.matched} entities, {progress.failed} failed"
+        )
+        return result
+
+    def _require_id_key(self) -> str:
+        self._write_method("edit")
+        if self.id_key is None:
+            raise TypeError(f"{type(self).__name__} does not support bulk state changes")
+        return self.id_key
+
+    def write_buffer(
+        self,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        flush_interval: float | None = DEFAULT_FLUSH_INTERVAL,
+        max_retries: int = DEFAULT_BULK_RETRIES,
+        on_failure: Callable[[list[BulkItem]], None] | None = None,
+    ) -> WriteBuffer:
+        """Create a write-behind buffer in front of edit().
+
+        Updates put into the buffer are merged per entity ID and flushed as
+        chunked bulk edits, see WriteBuffer.
+
+        Args:
+            max_pending: Number of distinct buffered entities that triggers a flush
+            flush_interval: Seconds after the first buffered update that trigger a
+                flush, None to flush only on size or flush()
+            max_retries: Times a transiently failed update is sent again
+            on_failure: Called after a flush with the updates that failed for good
+
+        Raises:
+            TypeError: If the service has no edit()
+        """
+        edit = self._write_method("edit")
+        if self.id_key is None:
+            raise TypeError(f"{type(self).__name__} does not support write buffering")
+        return WriteBuffer(edit, self.id_key, max_pending, flush_interval, max_retries, on_failure)
+
+    def _write_method(self, name: str) -> Callable[[list[dict]], Any]:
+        write = getattr(self, name, None)
+        if write is None:
+            raise TypeError(f"{type(self).__name__} does not support {name}()")
+        return write
+
+    async def _fetch_page(
+        self,
+        path: str,
+        items_key: str,
+        params: dict[str, Any],
+        token: str | None,
+        index: int,
+        media_type: str | None = None,
+    ) -> Page:
+        """Fetch one page of a list endpoint.
+
+        Accepts both a bare JSON list (single page, no token) and an object
+        holding the items under ``items_key`` plus an optional ``nextToken``.
+        With a ``media_type`` the page is requested from a v3 POST list
+        endpoint, sending ``params`` and the token in the JSON body.
+        """
+        query = {**params, "nextToken": token} if token else params
+        started = time.monotonic()
+        if media_type is None:
+            response = await self._request("GET", path, params=query)
+        else:
+            response = await self._request(
+                "POST",
+                path,
+                json_data=query,
+                headers={"Content-Type": media_type, "Accept": media_type},
+            )
+        latency = time.monotonic() - started
+        data = response.json()
+        if isinstance(data, list):
+            items, next_token = data, None
+        else:
+            items, next_token = data.get(items_key, []), data.get("nextToken")
+        return Page(
+            items=items,
+            index=index,
+            next_token=next_token,
+            latency=latency,
+            size_bytes=len(response.content),
+            cursor=Cursor(path, dict(params), next_token, index + 1) if next_token else None,
+        )
+
+    async def _paginate(
+        self,
+        path: str,
+        items_key: str,
+        params: dict[str, Any] | None = None,
+        resume_from: Cursor | None = None,
+        media_type: str | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """Iterate all pages of a nextToken-paginated endpoint.
+
+        While the caller processes page N, up to ``prefetch_pages`` following
+        pages are fetched in the background so network latency overlaps
+        consumer work. Set ``prefetch_pages`` to 0 to fetch strictly on demand.
+
+        Args:
+            path: Endpoint path
+            items_key: Response key holding the page items
+            params: Query parameters (or v3 request body) sent with every page
+            resume_from: Cursor of a previous listing to continue from
+            media_type: Versioned media type of a v3 POST list endpoint. When
+                set, pages are requested with POST and ``params`` as JSON body.
+
+        Yields:
+            Pages in API order
+
+        Raises:
+            ValueError: If the cursor belongs to another endpoint or filter set
+        """
+        params = dict(params) if params else {}
+        token: str | None = None
+        index = 0
+        if resume_from is not None:
+            if resume_from.path != path:
+                raise ValueError(f"Cursor for {resume_from.path} cannot resume {path}")
+            if params and params != resume_from.params:
+                raise ValueError("Filters do not match the filters stored in the cursor")
+            params = dict(resume_from.params)
+            token = resume_from.next_token
+            index = resume_from.page_index
+
+        depth = self.prefetch_pages
+
+        if depth <= 0:
+            while True:
+                page = await self._fetch_page(path, items_key, params, token, index, media_type)
+                yield page
+                if not page.next_token:
+                    return
+                token = page.next_token
+                index += 1
+
+        pages: asyncio.Queue[Page | BaseException] = asyncio.Queue()
+        slots = asyncio.Semaphore(depth)
+
+        async def produce(token: str | None, index: int) -> None:
+            try:
+                while True:
+                    await slots.acquire()
+                    page = await self._fetch_page(path, items_key, params, token, index, media_type)
+                    pages.put_nowait(page)
+                    if not page.next_token:
+                        return
+                    token = page.next_token
+                    index += 1
+                    # Let the consumer start on the page before the next fetch
+                    await asyncio.sleep(0)
+            except Exception as e:
+                pages.put_nowait(e)
+
+        producer = asyncio.create_task(produce(token, index))
+        try:
+            while True:
+                page_or_error = await pages.get()
+                if isinstance(page_or_error, BaseException):
+                    raise page_or_error
+                slots.release()
+                yield page_or_error
+                if not page_or_error.next_token:
+                    return
+        finally:
+            producer.cancel()
+
+    async def _fetch_index_page(
+        self, path: str, params: dict[str, Any], start_index: int, page_size: int, index: int
+    ) -> Page:
+        """Fetch one page of a startIndex/count paginated endpoint."""
+        started = time.monotonic()
+        response = await self._request(
+            "GET", path, params={**params, "startIndex": start_index, "count": page_size}
+        )
+        latency = time.monotonic() - started
+        items = response.json()
+        # A short page is the last one
+        next_token = str(start_index + page_size) if len(items) >= page_size else None
+        return Page(
+            items=items,
+            index=index,
+            next_token=next_token,
+            latency=latency,
+            size_bytes=len(response.content),
+            cursor=Cursor(path, dict(params), next_token, index + 1) if next_token else None,
+        )
+
+    async def _paginate_index(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """Iterate all pages of a startIndex/count paginated GET endpoint.
+
+        Pages are fetched sequentially by default. With ``concurrency`` above 1
+        up to that many consecutive pages are requested at once and yielded in
+        order. ``total`` is a hint for the expected number of items: pages up
+        to it are fetched concurrently, anything beyond one page at a time.
+        Without a hint the window speculates ahead and stops at the first
+        short page, discarding requests past the end.
+
+        Args:
+            path: Endpoint path
+            params: Query parameters sent with every page
+            page_size: Items requested per page (count)
+            total: Known or estimated number of items
+            concurrency: Maximum number of pages requested at once
+            resume_from: Cursor of a previous listing to continue from
+
+        Yields:
+            Pages in index order
+
+        Raises:
+            ValueError: If arguments are out of range or the cursor does not match
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        params = dict(params) if params else {}
+        start = 0
+        first_index = 0
+        if resume_from is not None:
+            if resume_from.path != path:
+                raise ValueError(f"Cursor for {resume_from.path} cannot resume {path}")
+            if params and params != resume_from.params:
+                raise ValueError("Filters do not match the filters stored in the cursor")
+            params = dict(resume_from.params)
+            start = int(resume_from.next_token)
+            first_index = resume_from.page_index
+
+        last_known: float
+        if total is not None:
+            last_known = max(math.ceil((total - start) / page_size) - 1, 0)
+        elif concurrency > 1:
+            last_known = math.inf
+        else:
+            last_known = 0
+
+        pending: deque[asyncio.Task[Page]] = deque()
+        next_page = 0
+        try:
+            while True:
+                while len(pending) < concurrency and next_page <= last_known:
+                    pending.append(
+                        asyncio.create_task(
+                            self._fetch_index_page(
+                                path,
+                                params,
+                                start + next_page * page_size,
+                                page_size,
+                                first_index + next_page,
+                            )
+                        )
+                    )
+                    next_page += 1
+                page = await pending.popleft()
+                yield page
+                if not page.next_token:
+                    return
+                if next_page > last_known:
+                    # Past the hint: keep going one page at a time
+                    last_known = next_page
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _list_sharded(
+        self,
+        list_pages: Callable[..., AsyncGenerator[Page, None]],
+        shards: Iterable[dict[str, Any]],
+        id_key: str,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict, None]:
+        """Crawl independent shards of a listing concurrently.
+
+        Each shard is a set of ``list_pages`` keyword arguments. Up to
+        ``concurrency`` shards are paginated at once and their items merged
+        into one stream in arrival order. Items are deduplicated by
+        ``id_key`` since shards built from overlapping filters may return the
+        same entity twice.
+
+        Args:
+            list_pages: Page iterator factory of the service
+            shards: Keyword arguments for list_pages, one dict per shard
+            id_key: Item field used for deduplication
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Item dictionaries
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        shard_args = [dict(shard) for shard in shards]
+        if not shard_args:
+            return
+
+        done = object()
+        results: asyncio.Queue[Any] = asyncio.Queue(maxsize=concurrency * 2)
+        slots = asyncio.Semaphore(concurrency)
+
+        async def crawl(shard: dict[str, Any]) -> None:
+            try:
+                async with slots, aclosing(list_pages(**shard)) as pages:
+                    async for page in pages:
+                        await results.put(page.items)
+            except Exception as e:
+                await results.put(e)
+                return
+            await results.put(done)
+
+        tasks = [asyncio.create_task(crawl(shard)) for shard in shard_args]
+        seen: set[str] = set()
+        remaining = len(tasks)
+        try:
+            while remaining:
+                result = await results.get()
+                if result is done:
+                    remaining -= 1
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                for item in result:
+                    item_id = item.get(id_key)
+                    if item_id is not None:
+                        if str(item_id) in seen:
+                            continue
+                        seen.add(str(item_id))
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _get_many(
+        self,
+        ids: Iterable[str | int],
+        list_pages: Callable[[str], AsyncGenerator[Page, None]],
+        id_key: str,
+        concurrency: int = DEFAULT_GET_MANY_CONCURRENCY,
+    ) -> dict[str, dict | None]:
+        """Fetch many entities by ID with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL
+        length and filter limits, and the chunks are listed concurrently.
+
+        Args:
+            ids: Entity IDs to fetch
+            list_pages: Lists the entities matching one comma-separated ID chunk
+            id_key: Item field holding the entity ID
+            concurrency: Maximum number of chunks fetched at once
+
+        Returns:
+            Mapping of every requested ID (as string, in input order) to its
+            entity, or None if the API did not return it
+        """
+        requested = [str(entity_id) for entity_id in ids]
+        if any(not entity_id for entity_id in requested):
+            raise ValueError("IDs must not be empty")
+
+        found: dict[str, dict] = {}
+        slots = asyncio.Semaphore(concurrency)
+
+        async def fetch(chunk: list[str]) -> None:
+            async with slots, aclosing(list_pages(",".join(chunk))) as pages:
+                async for page in pages:
+                    for item in page.items:
+                        found[str(item.get(id_key))] = item
+
+        await asyncio.gather(*(fetch(chunk) for chunk in chunk_ids(requested)))
+        missing = [entity_id for entity_id in dict.fromkeys(requested) if entity_id not in found]
+        if missing:
+            logger.debug(f"get_many: {len(missing)} of {len(requested)} IDs not found")
+        return {entity_id: found.get(entity_id) for entity_id in requested}
+
+    async def _write_chunked(self, method: str, path: str, items: list[dict]) -> list[dict]:
+        """Send a bulk create or edit in chunks the endpoint accepts.
+
+        Inputs above ``write_chunk_size`` are split into chunks that are sent
+        concurrently, up to ``write_concurrency`` at once, and their per-item
+        results are merged back in input order. Each chunk is retried on its
+        own. A chunk that still fails reports a REQUEST_FAILED result for each
+        of its items so the other chunks' results are kept.
+
+        With a ``journal`` attached, items whose success an earlier run recorded
+        are not sent again and their recorded results are returned.
+
+        Args:
+            method: POST for create, PUT for edit
+            path: Endpoint path
+            items: Entities to write
+
+        Returns:
+            One result dictionary per input item, in input order
+
+        Raises:
+            AmazonAPIError: If every chunk failed
+        """
+        journal = self.journal
+        done = journal.confirmed(method, path, items) if journal is not None else {}
+        if not done:
+            return await self._write_chunks(method, path, items)
+
+        logger.info(f"{method} {path}: {len(done)} of {len(items)} items confirmed by the journal")
+        todo = [item for index, item in enumerate(items) if index not in done]
+        sent = iter(await self._write_chunks(method, path, todo) if todo else [])
+        return [done[index] if index in done else next(sent) for index in range(len(items))]
+
+    async def _write_chunks(self, method: str, path: str, items: list[dict]) -> list[dict]:
+        """Send items in fixed or adaptive chunks, see _write_chunked()."""
+        if self.write_sizer is not None:
+            return await self._write_adaptive(method, path, items, self.write_sizer)
+
+        size = self.write_chunk_size
+        if len(items) <= size:
+            return await self._send_chunk(method, path, items)
+
+        chunks = [items[start : start + size] for start in range(0, len(items), size)]
+        slots = asyncio.Semaphore(self.write_concurrency)
+
+        async def send(chunk: list[dict]) -> list[dict]:
+            async with slots:
+                return await self._send_chunk(method, path, chunk)
+
+        results = await asyncio.gather(*(send(chunk) for chunk in chunks), return_exceptions=True)
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if len(failures) == len(chunks):
+            raise failures[0]
+
+        merged: list[dict] = []
+        for chunk, result in zip(chunks, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning(f"{method} {path}: chunk of {len(chunk)} items failed: {result}")
+                merged.extend(request_failure(result) for _ in chunk)
+            else:
+                merged.extend(result)
+        return merged
+
+    async def _write_adaptive(
+        self, method: str, path: str, items: list[dict], sizer: BatchSizer
+    ) -> list[dict]:
+        """Send a bulk create or edit in chunks sized by ``sizer``.
+
+        Each chunk takes the sizer's current size. A chunk that times out or
+        is too large is split at the reduced size and its pieces are queued
+        again, unless it is already at the sizer's minimum. Timeouts of chunks
+        above the minimum are not retried at the same size. Other failures
+        report REQUEST_FAILED results like in _write_chunked().
+        """
+        # Per-item results of each finished span, keyed by its start
+        finished: dict[int, list[dict]] = {}
+        # (start, end) spans of items that still have to be sent
+        spans: deque[tuple[int, int]] = deque()
+        cursor = 0
+        errors: list[Exception] = []
+        succeeded = False
+
+        def next_span() -> tuple[int, int]:
+            nonlocal cursor
+            if spans:
+                start, end = spans.popleft()
+                if end - start > sizer.size:
+                    spans.appendleft((start + sizer.size, end))
+                    end = start + sizer.size
+                return start, end
+            start, cursor = cursor, min(cursor + sizer.size, len(items))
+            return start, cursor
+
+        async def send(span: tuple[int, int]) -> tuple[float, list[dict]]:
+            started = time.monotonic()
+            # A timed out chunk is split right away instead of resent at the same size
+            results = await self._send_chunk(
+                method,
+                path,
+                items[span[0] : span[1]],
+                retry_timeouts=span[1] - span[0] <= sizer.min_size,
+            )
+            return time.monotonic() - started, results
+
+        tasks: dict[asyncio.Task, tuple[int, int]] = {}
+        try:
+            while spans or cursor < len(items) or tasks:
+                while len(tasks) < self.write_concurrency and (spans or cursor < len(items)):
+                    span = next_span()
+                    tasks[asyncio.ensure_future(send(span))] = span
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    start, end = tasks.pop(task)
+                    count = end - start
+                    error = task.exception()
+                    if error is None:
+                        latency, chunk_results = task.result()
+                        sizer.record_success(count, latency)
+                        finished[start] = chunk_results
+                        succeeded = True
+                        continue
+                    if not isinstance(error, Exception):
+                        raise error
+                    if isinstance(error, _CHUNK_SIZE_ERRORS) and count > sizer.min_size:
+                        sizer.record_failure(count)
+                        spans.appendleft((start, end))
+                        continue
+                    logger.warning(f"{method} {path}: chunk of {count} items failed: {error}")
+                    errors.append(error)
+                    finished[start] = [request_failure(error) for _ in range(count)]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if errors and not succeeded:
+            raise errors[0]
+        return [result for start in sorted(finished) for result in finished[start]]
+
+    async def _send_chunk(
+        self, method: str, path: str, chunk: list[dict], retry_timeouts: bool = True
+    ) -> Any:
+        """Send one create/edit request, journaling it when a journal is attached."""
+        journal = self.journal
+        token = await journal.begin(method, path, chunk) if journal is not None else None
+        try:
+            response = await self._request(
+                method, path, json_data=chunk, retry_timeouts=retry_timeouts
+            )
+        except AmazonAPIError as e:
+            # Transient failures may have been applied and stay in doubt
+            if journal is not None and token is not None and not isinstance(e, TRANSIENT_ERRORS):
+                await journal.reject(token, e)
+            raise
+        results = response.json()
+        if journal is not None and token is not None:
+            await journal.record(token, results)
+        return results
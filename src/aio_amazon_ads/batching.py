@@ -0,0 +1,100 @@
+"""Automatic batching of concurrent single-entity lookups."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .exceptions import NotFoundError
+from .pagination import DEFAULT_ID_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class GetBatcher:
+    """Coalesce concurrent get() calls into batched get_many() requests.
+
+    Every ``load()`` call registers a future and waits on it. Calls arriving
+    within ``window`` seconds of the first pending one are sent together as a
+    single ``get_many()`` call, and each caller receives its own entity. A
+    window of 0 collects the calls made within one event loop iteration, e.g.
+    by ``asyncio.gather()``.
+    """
+
+    def __init__(
+        self,
+        get_many: Callable[[list[str]], Awaitable[dict[str, Any]]],
+        window: float = 0.0,
+        max_batch_size: int = DEFAULT_ID_CHUNK_SIZE,
+    ):
+        """Initialize get batcher.
+
+        Args:
+            get_many: Fetches many entities, returns a mapping of ID to entity or None
+            window: Seconds to wait for more calls before sending a batch
+            max_batch_size: Number of distinct IDs that sends a batch immediately
+        """
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._get_many = get_many
+        self._pending: dict[str, list[asyncio.Future[Any]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def load(self, entity_id: str | int) -> Any:
+        """Fetch one entity as part of the next batch.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            The entity
+
+        Raises:
+            NotFoundError: If the batch did not return the entity
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.setdefault(str(entity_id), []).append(future)
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._dispatch)
+        return await future
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run(self, batch: dict[str, list[asyncio.Future[Any]]]) -> None:
+        logger.debug(f"Batching {len(batch)} get() calls into one get_many()")
+        try:
+            found = await self._get_many(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for entity_id, futures in batch.items():
+            item = found.get(entity_id)
+            for future in futures:
+                if future.done():
+                    # Caller was cancelled while waiting
+                    continue
+                if item is None:
+                    future.set_exception(NotFoundError(f"Entity {entity_id} not found"))
+                else:
+                    future.set_result(item)
@@ -0,0 +1,149 @@
+"""Structured results and selective retry for bulk writes."""
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from .exceptions import TRANSIENT_ERRORS, AmazonAPIError
+
+logger = logging.getLogger(__name__)
+
+SUCCESS = "SUCCESS"
+
+# Per-item code reported for entities whose chunk request failed
+REQUEST_FAILED = "REQUEST_FAILED"
+
+# Per-item error codes that may succeed when the item is sent again
+RETRYABLE_CODES = frozenset(
+    ["INTERNAL_ERROR", "SERVER_IS_BUSY", "THROTTLED", "TOO_MANY_REQUESTS", "SERVICE_UNAVAILABLE"]
+)
+
+DEFAULT_BULK_RETRIES = 3
+
+# Seconds before the first selective retry, doubled for each further retry
+DEFAULT_BULK_BACKOFF = 1.0
+MAX_BULK_BACKOFF = 30.0
+
+
+@dataclass(frozen=True)
+class BulkItem:
+    """Outcome of one input item of a bulk write."""
+
+    index: int
+    """Position of the item in the input list"""
+    item: dict
+    result: dict
+    """Per-item result returned by the API, e.g. {"code": "SUCCESS", "keywordId": ...}"""
+
+    @property
+    def code(self) -> str:
+        """Per-item result code."""
+        return str(self.result.get("code", SUCCESS))
+
+
+@dataclass
+class BulkResult:
+    """Per-item outcome of a bulk create or edit, mapped to input positions."""
+
+    succeeded: list[BulkItem] = field(default_factory=list)
+    failed: list[BulkItem] = field(default_factory=list)
+    """Items rejected with a permanent error"""
+    retryable: list[BulkItem] = field(default_factory=list)
+    """Items still failing with a transient error after all retries"""
+    attempts: int = 0
+    """Write rounds, 1 when nothing was retried"""
+
+    @property
+    def ok(self) -> bool:
+        """Whether every item succeeded."""
+        return not self.failed and not self.retryable
+
+    @property
+    def results(self) -> list[dict]:
+        """Per-item results in input order."""
+        outcomes = sorted(self.succeeded + self.failed + self.retryable, key=lambda o: o.index)
+        return [outcome.result for outcome in outcomes]
+
+
+@dataclass
+class StateChangeProgress:
+    """Running counts of a bulk state change, passed to progress callbacks."""
+
+    scanned: int = 0
+    """Entities listed and checked against the predicate"""
+    matched: int = 0
+    """Entities queued for the state change"""
+    succeeded: int = 0
+    failed: int = 0
+
+
+def is_retryable(result: dict) -> bool:
+    """Return whether a failed per-item result is worth sending again."""
+    return bool(result.get("retryable")) or result.get("code") in RETRYABLE_CODES
+
+
+def request_failure(error: BaseException | str, retryable: bool | None = None) -> dict:
+    """Return the per-item result of an entity whose request failed as a whole.
+
+    Args:
+        error: Exception of the failed request, or a description
+        retryable: Whether sending the entity again may succeed, by default
+            whether ``error`` is a transient error
+
+    Returns:
+        Result dictionary with code REQUEST_FAILED
+    """
+    if retryable is None:
+        retryable = isinstance(error, TRANSIENT_ERRORS)
+    return {"code": REQUEST_FAILED, "description": str(error), "retryable": retryable}
+
+
+async def run_bulk_write(
+    write: Callable[[list[dict]], Awaitable[list[dict]]],
+    items: list[dict],
+    max_retries: int = DEFAULT_BULK_RETRIES,
+    backoff: float = DEFAULT_BULK_BACKOFF,
+) -> BulkResult:
+    """Write items and resend only the items that failed transiently.
+
+    Args:
+        write: Bulk create or edit returning one result per item in input order
+        items: Entities to write
+        max_retries: Rounds of selective retries after the first write
+        backoff: Seconds before the first retry, doubled for each further retry
+
+    Returns:
+        BulkResult mapping every input item to its final outcome
+    """
+    result = BulkResult()
+    pending = list(range(len(items)))
+    while pending:
+        result.attempts += 1
+        batch = [items[index] for index in pending]
+        try:
+            responses = await write(batch)
+        except (AmazonAPIError, *TRANSIENT_ERRORS) as e:
+            # Whole-call errors are reported per item like chunk failures
+            responses = [request_failure(e) for _ in batch]
+
+        last_round = result.attempts > max_retries
+        retry = []
+        for index, response in zip(pending, responses, strict=True):
+            outcome = BulkItem(index=index, item=items[index], result=response)
+            if outcome.code == SUCCESS:
+                result.succeeded.append(outcome)
+            elif not is_retryable(response):
+                result.failed.append(outcome)
+            elif last_round:
+                result.retryable.append(outcome)
+            else:
+                retry.append(index)
+        pending = retry
+        if pending:
+            delay = min(backoff * 2 ** (result.attempts - 1), MAX_BULK_BACKOFF)
+            delay *= random.uniform(0.5, 1.0)
+            logger.info(f"Retrying {len(pending)} of {len(items)} items in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    return result
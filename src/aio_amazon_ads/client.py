@@ -1,9 +1,21 @@
 """Main Amazon Ads client with namespaced services."""
 
-from collections.abc import Callable
-from typing import Any
-
-from .base import BaseClient, Marketplace
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Iterable
+from contextlib import aclosing
+from functools import partial
+from typing import Any, Literal
+
+from .base import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_SHARD_CONCURRENCY,
+    BaseClient,
+    BaseService,
+    Marketplace,
+)
+from .bulk import BulkItem
+from .crawler import CrawlStrategy, EntityEvent, crawl
+from .journal import WriteJournal
+from .quota import QuotaStatus, QuotaTracker
 from .services.portfolios import Portfolios
 from .services.profiles import Profiles
 from .services.sb import AdGroups as SBAdGroups
@@ -19,6 +31,7 @@ from .services.sp import NegativeKeywords as SPNegativeKeywords
 from .services.sp import ProductAds as SPProductAds
 from .services.sp import Reports as SPReports
 from .services.sp import Targets as SPTargets
+from .streaming import DEFAULT_STREAM_IN_FLIGHT
 
 
 class AmazonAdsClient(BaseClient):
@@ -60,18 +73,38 @@ class AmazonAdsClient(BaseClient):
         client_id: str,
         client_secret: str,
         marketplace: Marketplace = Marketplace.NA,
+        quota_tracker: QuotaTracker | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        get_batch_window: float | None = None,
+        write_target_latency: float | None = None,
+        write_journal: WriteJournal | None = None,
     ):
-        """Initialize Amazon Ads client."""
+        """Initialize Amazon Ads client.
+
+        Args:
+            get_batch_window: If set, concurrent get() calls on the same service
+                arriving within this many seconds are sent as one batched list
+                request (see BaseService.enable_get_batching). None disables it.
+            write_target_latency: If set, create() and edit() adapt their chunk
+                size to keep requests within this many seconds and to recover
+                from timeouts and payload size errors (see
+                BaseService.enable_adaptive_writes). None keeps fixed chunks.
+            write_journal: Journal recording the outcome of every create/edit
+                chunk; items it already confirmed are skipped when a crashed
+                job is rerun (see WriteJournal)
+        """
         super().__init__(
             refresh_token=refresh_token,
             profile_id=profile_id,
             client_id=client_id,
             client_secret=client_secret,
             marketplace=marketplace,
+            quota_tracker=quota_tracker,
+            max_concurrency=max_concurrency,
         )
 
         # Sponsored Products services
-        self.sp = _SPServices(self.request)
+        self.sp = _SPServices(self.request, partial(self.quota_status, "sp"))
 
         # Sponsored Brands services
         self.sb = _SBServices(self.request)
@@ -85,18 +118,118 @@ class AmazonAdsClient(BaseClient):
         # Profiles service
         self.profiles = Profiles(self.request)
 
+        if get_batch_window is not None:
+            for service in self._services():
+                if hasattr(service, "get_many"):
+                    service.enable_get_batching(get_batch_window)
+
+        if write_target_latency is not None:
+            for service in self._services():
+                if hasattr(service, "create") or hasattr(service, "edit"):
+                    service.enable_adaptive_writes(write_target_latency)
+
+        if write_journal is not None:
+            for service in self._services():
+                if hasattr(service, "create") or hasattr(service, "edit"):
+                    service.journal = write_journal
+
+    async def crawl(
+        self,
+        ad_products: Iterable[str] | None = None,
+        entity_types: Iterable[str] | None = None,
+        campaign_ids: Iterable[str | int] | None = None,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        strategy: CrawlStrategy = "auto",
+    ) -> AsyncGenerator[EntityEvent, None]:
+        """Crawl the account hierarchy concurrently.
+
+        Walks campaigns, ad groups, keywords, targets and ads with bounded
+        fan-out and streams one EntityEvent per entity (see crawler.crawl).
+
+        Args:
+            ad_products: Ad products to crawl (sp, sb, sd), defaults to all
+            entity_types: Entity types to emit, defaults to all
+            campaign_ids: Only crawl these campaigns and their children
+            concurrency: Maximum number of listings or shards running at once
+            strategy: auto, account (whole-account listings) or parent
+                (campaign-filtered listings)
+
+        Yields:
+            EntityEvent per entity
+        """
+        async for event in crawl(
+            self, ad_products, entity_types, campaign_ids, concurrency, strategy
+        ):
+            yield event
+
+    def service(self, entity: str) -> BaseService:
+        """Return a service by dotted name, e.g. ``sp.keywords`` or ``portfolios``.
+
+        Raises:
+            ValueError: If there is no such service
+        """
+        target: Any = self
+        for part in entity.split("."):
+            if part.startswith("_"):
+                target = None
+                break
+            target = getattr(target, part, None)
+        if not isinstance(target, BaseService):
+            raise ValueError(f"Unknown service: {entity}")
+        return target
+
+    async def apply_stream(
+        self,
+        changes: AsyncIterable[dict],
+        entity: str,
+        operation: Literal["create", "edit"] = "edit",
+        batch_size: int | None = None,
+        max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT,
+        linger: float | None = None,
+    ) -> AsyncGenerator[BulkItem, None]:
+        """Write a stream of changes to one service, see BaseService.apply_stream().
+
+        Args:
+            changes: Async iterable of entities, e.g. rows from a DB cursor
+            entity: Dotted service name, e.g. sp.keywords
+            operation: create or edit
+            batch_size: Maximum items per batch, defaults to the service's write_chunk_size
+            max_in_flight: Maximum batches being written at once
+            linger: Seconds to wait for more changes before sending a partial batch
+
+        Yields:
+            BulkItem per change in completion order
+        """
+        stream = self.service(entity).apply_stream(
+            changes, operation, batch_size, max_in_flight, linger
+        )
+        async with aclosing(stream) as results:
+            async for item in results:
+                yield item
+
+    def _services(self) -> list[BaseService]:
+        """Return every service instance of the client."""
+        services: list[BaseService] = [self.portfolios, self.profiles]
+        for container in (self.sp, self.sb, self.sd):
+            services.extend(vars(container).values())
+        return services
+
 
 class _SPServices:
     """Container for Sponsored Products services."""
 
-    def __init__(self, request: Callable[..., Any]):
+    def __init__(
+        self,
+        request: Callable[..., Any],
+        quota_status: Callable[[], list[QuotaStatus]] | None = None,
+    ):
         self.campaigns: SPCampaigns = SPCampaigns(request)
         self.ad_groups: SPAdGroups = SPAdGroups(request)
         self.keywords: SPKeywords = SPKeywords(request)
         self.product_ads: SPProductAds = SPProductAds(request)
         self.negative_keywords: SPNegativeKeywords = SPNegativeKeywords(request)
         self.targets: SPTargets = SPTargets(request)
-        self.reports: SPReports = SPReports(request)
+        self.reports: SPReports = SPReports(request, quota_status)
 
 
 class _SBServices:
@@ -0,0 +1,246 @@
+"""Write-behind buffer coalescing high-frequency entity updates."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from types import TracebackType
+
+from .bulk import DEFAULT_BULK_RETRIES, SUCCESS, BulkItem, is_retryable, request_failure
+from .exceptions import TRANSIENT_ERRORS
+
+logger = logging.getLogger(__name__)
+
+# Distinct entities that trigger a flush
+DEFAULT_MAX_PENDING = 1000
+
+# Seconds an update may wait in the buffer before it is flushed
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class WriteBuffer:
+    """Merge updates per entity ID and send them as chunked bulk edits.
+
+    Updates to an entity that is still buffered are merged field by field,
+    and the last write wins. A bid changed ten times between flushes costs one
+    write. The buffer flushes when ``max_pending`` distinct entities are
+    waiting, ``flush_interval`` seconds after the first buffered update, or on
+    ``flush()``. Flushes run one at a time, so an entity's updates reach the
+    API in the order they were made.
+
+    Updates that failed transiently, per item or because the whole request
+    failed, are put back into the buffer up to ``max_retries`` times. Fields
+    updated again in the meantime keep their newer values. Other failed
+    updates are collected in ``failed`` and passed to ``on_failure``. Permanent
+    errors of background flushes are logged and raised by the next ``flush()``.
+
+    Example:
+        async with client.sp.keywords.write_buffer(flush_interval=2.0) as buffer:
+            await buffer.put({"keywordId": "1", "bid": 0.55})
+            await buffer.put({"keywordId": "1", "state": "paused"})
+            await buffer.put({"keywordId": "1", "bid": 0.60})
+        # One edit sent: {"keywordId": "1", "bid": 0.60, "state": "paused"}
+    """
+
+    def __init__(
+        self,
+        edit: Callable[[list[dict]], Awaitable[list[dict]]],
+        id_key: str,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        flush_interval: float | None = DEFAULT_FLUSH_INTERVAL,
+        max_retries: int = DEFAULT_BULK_RETRIES,
+        on_failure: Callable[[list[BulkItem]], None] | None = None,
+    ):
+        """Initialize write buffer.
+
+        Args:
+            edit: Bulk edit of the service, e.g. client.sp.keywords.edit
+            id_key: Entity field holding the ID, e.g. keywordId
+            max_pending: Number of distinct buffered entities that triggers a flush
+            flush_interval: Seconds after the first buffered update that trigger
+                a flush, None to flush only on size or flush()
+            max_retries: Times a transiently failed update is sent again
+            on_failure: Called after a flush with the updates that failed for good
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        if flush_interval is not None and flush_interval < 0:
+            raise ValueError("flush_interval must not be negative")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self.id_key = id_key
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.on_failure = on_failure
+        self.received = 0
+        """Updates put into the buffer"""
+        self.sent = 0
+        """Entity updates sent to the API"""
+        self.failed: list[BulkItem] = []
+        """Updates that failed permanently or ran out of retries, with their results"""
+        self._edit = edit
+        self._pending: dict[str, dict] = {}
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+        self._error: Exception | None = None
+        self._attempts: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def __aenter__(self) -> "WriteBuffer":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def put(self, update: dict) -> None:
+        """Buffer an update, merging it into a pending update of the same entity.
+
+        Args:
+            update: Partial entity holding the ID and the changed fields
+
+        Raises:
+            ValueError: If the update has no ID
+        """
+        entity_id = update.get(self.id_key)
+        if entity_id is None:
+            raise ValueError(f"Update has no {self.id_key}")
+        self.received += 1
+        pending = self._pending.get(str(entity_id))
+        if pending is None:
+            self._pending[str(entity_id)] = dict(update)
+        else:
+            pending.update(update)
+
+        if len(self._pending) >= self.max_pending:
+            # Waiting for the flush slows producers down to the API's pace
+            await self.flush()
+        else:
+            self._arm_timer()
+
+    async def put_many(self, updates: Iterable[dict]) -> None:
+        """Buffer many updates, see put()."""
+        for update in updates:
+            await self.put(update)
+
+    async def flush(self) -> list[dict]:
+        """Send all buffered updates now.
+
+        Returns:
+            Per-entity results of the edit, one per distinct buffered entity;
+            transiently failed updates among them are buffered again
+
+        Raises:
+            AmazonAPIError: If the edit failed with a permanent error, or a
+                background flush did since the last flush() call
+        """
+        results = await self._flush()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+        return results
+
+    async def close(self) -> list[BulkItem]:
+        """Wait for background flushes and flush until nothing is pending.
+
+        Transiently failed updates are sent again until they succeed or run
+        out of retries.
+
+        Returns:
+            Updates that failed for good, the same as ``failed``
+
+        Raises:
+            AmazonAPIError: If a flush failed with a permanent error, raised once
+                every update was sent
+        """
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        error: Exception | None = None
+        # Re-queued updates run out of retries, so this ends
+        while True:
+            try:
+                await self.flush()
+            except Exception as e:
+                error = error or e
+            if not self._pending:
+                break
+        if error is not None:
+            raise error
+        return list(self.failed)
+
+    def _arm_timer(self) -> None:
+        if self._timer is None and self.flush_interval is not None and self._pending:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.flush_interval, self._flush_later)
+
+    def _flush_later(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self._flush_in_background())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self._flush()
+        except Exception as e:
+            logger.warning(f"Background flush failed: {e}")
+            self._error = e
+
+    async def _flush(self) -> list[dict]:
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            batch, self._pending = self._pending, {}
+            if not batch:
+                return []
+            logger.debug(f"Flushing {len(batch)} buffered entity updates")
+            updates = list(batch.values())
+            self.sent += len(updates)
+            try:
+                results = await self._edit(updates)
+            except Exception as e:
+                results = [request_failure(e) for _ in updates]
+                self._settle(updates, results)
+                if not isinstance(e, TRANSIENT_ERRORS):
+                    raise
+                logger.warning(f"Flush of {len(updates)} entity updates failed: {e}")
+                return results
+            if len(results) != len(updates):
+                logger.warning(f"Got {len(results)} results for {len(updates)} updates")
+                # Results cannot be matched by position, so none is trusted
+                description = "Result count does not match the updates sent"
+                results = [request_failure(description) for _ in updates]
+            self._settle(updates, results)
+            return results
+
+    def _settle(self, updates: list[dict], results: list[dict]) -> None:
+        """Re-queue transiently failed updates and report the ones that failed for good."""
+        failed = []
+        for index, (update, result) in enumerate(zip(updates, results, strict=True)):
+            entity_id = str(update[self.id_key])
+            if result.get("code", SUCCESS) == SUCCESS:
+                self._attempts.pop(entity_id, None)
+                continue
+            attempts = self._attempts.get(entity_id, 0) + 1
+            if is_retryable(result) and attempts <= self.max_retries:
+                self._attempts[entity_id] = attempts
+                pending = self._pending.get(entity_id)
+                # Fields updated since this flush started are newer and win
+                self._pending[entity_id] = update if pending is None else {**update, **pending}
+            else:
+                self._attempts.pop(entity_id, None)
+                failed.append(BulkItem(index=index, item=update, result=result))
+        if failed:
+            logger.warning(f"{len(failed)} buffered entity updates failed")
+            self.failed.extend(failed)
+            if self.on_failure is not None:
+                self.on_failure(failed)
+        self._arm_timer()
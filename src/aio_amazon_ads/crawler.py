@@ -0,0 +1,223 @@
+"""Concurrent hierarchical account crawler."""
+
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Iterable
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from .base import DEFAULT_SHARD_CONCURRENCY
+from .pagination import shard_by_ids
+
+if TYPE_CHECKING:
+    from .client import AmazonAdsClient
+
+logger = logging.getLogger(__name__)
+
+CrawlStrategy = Literal["auto", "account", "parent"]
+
+
+@dataclass(frozen=True)
+class EntityEvent:
+    """One entity discovered by a crawl."""
+
+    ad_product: str
+    """sp, sb or sd"""
+    entity_type: str
+    """Service name, e.g. campaigns, ad_groups or keywords"""
+    entity_id: str
+    parent_id: str | None
+    """ID of the campaign or ad group the entity belongs to, None for campaigns"""
+    entity: dict = field(repr=False)
+
+
+@dataclass(frozen=True)
+class _EntitySpec:
+    entity_type: str
+    id_key: str
+    parent_key: str | None
+    campaign_filter: str
+    """list_pages() argument taking comma-separated campaign IDs"""
+
+
+_SP_CAMPAIGN_FILTER = "campaign_id_filter"
+_CAMPAIGN_FILTER = "campaignIdFilter"
+
+# Entity types per ad product, parents first
+ENTITY_SPECS: dict[str, tuple[_EntitySpec, ...]] = {
+    "sp": (
+        _EntitySpec("campaigns", "campaignId", None, _SP_CAMPAIGN_FILTER),
+        _EntitySpec("ad_groups", "adGroupId", "campaignId", _SP_CAMPAIGN_FILTER),
+        _EntitySpec("keywords", "keywordId", "adGroupId", _SP_CAMPAIGN_FILTER),
+        _EntitySpec("targets", "targetId", "adGroupId", _SP_CAMPAIGN_FILTER),
+        _EntitySpec("product_ads", "adId", "adGroupId", _SP_CAMPAIGN_FILTER),
+        _EntitySpec("negative_keywords", "keywordId", "adGroupId", _SP_CAMPAIGN_FILTER),
+    ),
+    "sb": (
+        _EntitySpec("campaigns", "campaignId", None, _CAMPAIGN_FILTER),
+        _EntitySpec("ad_groups", "adGroupId", "campaignId", _CAMPAIGN_FILTER),
+        _EntitySpec("keywords", "keywordId", "adGroupId", _CAMPAIGN_FILTER),
+        _EntitySpec("ads", "adId", "adGroupId", _CAMPAIGN_FILTER),
+    ),
+    "sd": (
+        _EntitySpec("campaigns", "campaignId", None, _CAMPAIGN_FILTER),
+        _EntitySpec("ad_groups", "adGroupId", "campaignId", _CAMPAIGN_FILTER),
+    ),
+}
+
+
+async def _gather_or_cancel(*aws: Awaitable[None]) -> None:
+    """Run awaitables concurrently, cancelling the rest as soon as one fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        for task in asyncio.as_completed(tasks):
+            await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def crawl(
+    client: "AmazonAdsClient",
+    ad_products: Iterable[str] | None = None,
+    entity_types: Iterable[str] | None = None,
+    campaign_ids: Iterable[str | int] | None = None,
+    concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    strategy: CrawlStrategy = "auto",
+) -> AsyncGenerator[EntityEvent, None]:
+    """Walk campaigns, ad groups and their children concurrently.
+
+    Two listing strategies are available per ad product:
+
+    - ``account`` lists every entity type once for the whole account, the
+      fewest requests when most of the account is wanted.
+    - ``parent`` lists children with comma-separated campaign ID filters,
+      sharded and crawled concurrently, which avoids downloading the rest of
+      a large account when only some campaigns are wanted.
+
+    ``auto`` uses ``parent`` when ``campaign_ids`` is given and ``account``
+    otherwise. All requests go through the client's request limiter.
+
+    Args:
+        client: Client to crawl with
+        ad_products: Ad products to crawl (sp, sb, sd), defaults to all
+        entity_types: Entity types to emit, e.g. ["campaigns", "keywords"],
+            defaults to all types of each ad product
+        campaign_ids: Only crawl these campaigns and their children
+        concurrency: Maximum number of listings running at once per level, and
+            of shards per sharded listing
+        strategy: auto, account or parent
+
+    Yields:
+        EntityEvent per entity in arrival order; events of different types and
+        ad products interleave
+    """
+    products = list(ad_products) if ad_products is not None else list(ENTITY_SPECS)
+    unknown = [product for product in products if product not in ENTITY_SPECS]
+    if unknown:
+        raise ValueError(f"Unknown ad products: {unknown}")
+    wanted = set(entity_types) if entity_types is not None else None
+    if wanted is not None:
+        known = {spec.entity_type for specs in ENTITY_SPECS.values() for spec in specs}
+        if wanted - known:
+            raise ValueError(f"Unknown entity types: {sorted(wanted - known)}")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if strategy not in ("auto", "account", "parent"):
+        raise ValueError(f"Unknown crawl strategy: {strategy}")
+
+    scope = list(dict.fromkeys(str(c) for c in campaign_ids)) if campaign_ids is not None else None
+    by_parent = strategy == "parent" or (strategy == "auto" and scope is not None)
+    # Parent listings are filtered server side, account listings here
+    scope_set = set(scope) if scope is not None and not by_parent else None
+
+    done = object()
+    events: asyncio.Queue[Any] = asyncio.Queue(maxsize=concurrency * 2)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def emit(
+        ad_product: str,
+        spec: _EntitySpec,
+        items: AsyncGenerator[dict, None],
+        seen: list[str] | None = None,
+    ) -> None:
+        async with slots, aclosing(items) as stream:
+            async for item in stream:
+                item_id = item.get(spec.id_key)
+                if seen is not None and item_id is not None:
+                    seen.append(str(item_id))
+                if scope_set is not None and str(item.get("campaignId")) not in scope_set:
+                    continue
+                if wanted is not None and spec.entity_type not in wanted:
+                    continue
+                parent = item.get(spec.parent_key) if spec.parent_key else None
+                await events.put(
+                    EntityEvent(
+                        ad_product=ad_product,
+                        entity_type=spec.entity_type,
+                        entity_id=str(item_id),
+                        parent_id=str(parent) if parent is not None else None,
+                        entity=item,
+                    )
+                )
+
+    async def crawl_product(ad_product: str) -> None:
+        container = getattr(client, ad_product)
+        specs = [
+            spec
+            for spec in ENTITY_SPECS[ad_product]
+            if wanted is None or spec.entity_type in wanted
+        ]
+
+        def service(spec: _EntitySpec) -> Any:
+            return getattr(container, spec.entity_type)
+
+        if not by_parent:
+            await _gather_or_cancel(
+                *(emit(ad_product, spec, service(spec).list()) for spec in specs)
+            )
+            return
+
+        parents = scope
+        if parents is None:
+            # Campaign IDs are needed to filter children, list them first
+            campaigns_spec = ENTITY_SPECS[ad_product][0]
+            parents = []
+            await emit(ad_product, campaigns_spec, service(campaigns_spec).list(), parents)
+            specs = [spec for spec in specs if spec is not campaigns_spec]
+        if not parents:
+            return
+        logger.debug(f"Crawling {ad_product} children of {len(parents)} campaigns")
+        await _gather_or_cancel(
+            *(
+                emit(
+                    ad_product,
+                    spec,
+                    service(spec).list_sharded(
+                        shard_by_ids(spec.campaign_filter, parents), concurrency
+                    ),
+                )
+                for spec in specs
+            )
+        )
+
+    async def produce() -> None:
+        try:
+            await _gather_or_cancel(*(crawl_product(product) for product in products))
+        except Exception as e:
+            await events.put(e)
+            return
+        await events.put(done)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            event = await events.get()
+            if event is done:
+                break
+            if isinstance(event, BaseException):
+                raise event
+            yield event
+    finally:
+        producer.cancel()
@@ -1,5 +1,7 @@
 """Custom exceptions for Amazon Advertising API client."""
 
+import httpx
+
 
 class AmazonAPIError(Exception):
     """Base exception for Amazon API errors."""
@@ -13,6 +15,12 @@ class AuthenticationError(AmazonAPIError):
     pass
 
 
+class NotFoundError(AmazonAPIError):
+    """Raised when the requested entity does not exist (404)."""
+
+    pass
+
+
 class ThrottlingError(AmazonAPIError):
     """Raised when API rate limit is exceeded (429)."""
 
@@ -27,7 +35,31 @@ class ValidationError(AmazonAPIError):
     pass
 
 
+class PayloadTooLargeError(ValidationError):
+    """Raised when a request is larger than the endpoint accepts (413)."""
+
+    pass
+
+
+class ReportError(AmazonAPIError):
+    """Raised when a report fails to generate."""
+
+    def __init__(self, message: str, report_id: str):
+        super().__init__(message)
+        self.report_id = report_id
+
+
+class ReportTimeoutError(ReportError):
+    """Raised when a report is not downloaded before its deadline."""
+
+    pass
+
+
 class ServerError(AmazonAPIError):
     """Raised when server error occurs (5xx)."""
 
     pass
+
+
+# Errors that may succeed when retried after a backoff
+TRANSIENT_ERRORS = (ThrottlingError, ServerError, httpx.NetworkError, httpx.TimeoutException)
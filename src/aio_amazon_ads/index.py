@@ -0,0 +1,370 @@
+"""In-memory entity graph index.
+
+Entities from any ``list()`` call are stored as tuples laid out by a per-type
+field schema instead of one dict each, and repeated values such as parent IDs,
+states and match types are interned. Hash indexes answer lookups by ID, by
+parent, by (campaignId, name) and by (adGroupId, keywordText, matchType) in
+constant time.
+"""
+
+import sys
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# Entity type -> (ID field, parent ID field)
+ENTITY_KEYS: dict[str, tuple[str, str | None]] = {
+    "portfolios": ("portfolioId", None),
+    "campaigns": ("campaignId", "portfolioId"),
+    "ad_groups": ("adGroupId", "campaignId"),
+    "keywords": ("keywordId", "adGroupId"),
+    "negative_keywords": ("keywordId", "adGroupId"),
+    "targets": ("targetId", "adGroupId"),
+    "product_ads": ("adId", "adGroupId"),
+    "ads": ("adId", "adGroupId"),
+}
+
+# Entity type -> entity types whose parent it is
+CHILD_TYPES: dict[str, tuple[str, ...]] = {
+    "portfolios": ("campaigns",),
+    "campaigns": ("ad_groups",),
+    "ad_groups": ("keywords", "negative_keywords", "targets", "product_ads", "ads"),
+}
+
+# Low-cardinality fields whose string values are shared between entities
+_INTERNED_FIELDS = frozenset(
+    [
+        "portfolioId",
+        "campaignId",
+        "adGroupId",
+        "state",
+        "matchType",
+        "servingStatus",
+        "targetingType",
+        "expressionType",
+        "campaignType",
+        "premiumBidAdjustment",
+    ]
+)
+
+_MISSING = object()
+
+
+class _Table:
+    """Rows of one entity type stored as tuples in schema order, plus its indexes."""
+
+    __slots__ = ("parent_key", "fields", "rows", "children", "names", "keywords")
+
+    def __init__(self, parent_key: str | None) -> None:
+        self.parent_key = parent_key
+        self.fields: dict[str, int] = {}
+        self.rows: dict[str, tuple] = {}
+        # Nested dicts keyed by existing strings avoid a key tuple per entity
+        self.children: dict[str, list[str]] = {}
+        # Names and keyword texts can repeat, e.g. an archived and a live copy.
+        # A key holds one ID as a plain string and a set only once shared.
+        self.names: dict[str | None, dict[str, str | set[str]]] = {}
+        self.keywords: dict[tuple[str | None, str], dict[str, str | set[str]]] = {}
+
+    def pack(self, entity: dict) -> tuple:
+        for key in entity:
+            if key not in self.fields:
+                self.fields[key] = len(self.fields)
+        values: list[Any] = [_MISSING] * len(self.fields)
+        for key, value in entity.items():
+            if key in _INTERNED_FIELDS:
+                value = _intern(value)
+            values[self.fields[key]] = value
+        return tuple(values)
+
+    def unpack(self, row: tuple) -> dict:
+        # Rows packed before the schema grew are shorter
+        return {
+            key: row[i] for key, i in self.fields.items() if i < len(row) and row[i] is not _MISSING
+        }
+
+    def value(self, row: tuple, key: str) -> Any:
+        i = self.fields.get(key)
+        if i is None or i >= len(row) or row[i] is _MISSING:
+            return None
+        return row[i]
+
+    def parent(self, row: tuple) -> str | None:
+        return _key(self.value(row, self.parent_key)) if self.parent_key else None
+
+    def scope(self, row: tuple, campaign_scoped: bool) -> str | None:
+        return _key(self.value(row, "campaignId")) if campaign_scoped else None
+
+    def link(self, entity_id: str, row: tuple, campaign_scoped: bool) -> None:
+        parent = self.parent(row)
+        if parent is not None:
+            self.children.setdefault(parent, []).append(entity_id)
+        name = self.value(row, "name")
+        if name is not None:
+            _add(self.names.setdefault(self.scope(row, campaign_scoped), {}), name, entity_id)
+        text = self.value(row, "keywordText")
+        if text is not None:
+            match_type = _intern(self.value(row, "matchType"))
+            _add(self.keywords.setdefault((parent, match_type), {}), text, entity_id)
+
+    def unlink(self, entity_id: str, campaign_scoped: bool) -> None:
+        row = self.rows[entity_id]
+        parent = self.parent(row)
+        if parent is not None:
+            _discard(self.children, parent, entity_id)
+        name = self.value(row, "name")
+        if name is not None:
+            _discard(self.names, self.scope(row, campaign_scoped), entity_id, name)
+        text = self.value(row, "keywordText")
+        if text is not None:
+            _discard(self.keywords, (parent, self.value(row, "matchType")), entity_id, text)
+
+
+def _discard(index: dict, bucket_key: Any, entity_id: str, key: str | None = None) -> None:
+    """Remove an entity from an index bucket, dropping empty buckets."""
+    bucket = index.get(bucket_key)
+    if bucket is None:
+        return
+    if key is None:
+        if entity_id in bucket:
+            bucket.remove(entity_id)
+    else:
+        ids = bucket.get(key)
+        if ids == entity_id:
+            del bucket[key]
+        elif isinstance(ids, set):
+            ids.discard(entity_id)
+            if len(ids) == 1:
+                bucket[key] = ids.pop()
+    if not bucket:
+        del index[bucket_key]
+
+
+def _add(bucket: dict[str, str | set[str]], key: str, entity_id: str) -> None:
+    """Add an entity ID under a name or keyword key that other entities may share."""
+    ids = bucket.get(key)
+    if ids is None or ids == entity_id:
+        bucket[key] = entity_id
+    elif isinstance(ids, set):
+        ids.add(entity_id)
+    else:
+        bucket[key] = {ids, entity_id}
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _key(value: Any) -> str | None:
+    return sys.intern(str(value)) if value is not None else None
+
+
+class EntityIndex:
+    """Compact in-memory index of campaigns, ad groups and their children.
+
+    Example:
+        index = EntityIndex()
+        index.add_many("ad_groups", [ag async for ag in client.sp.ad_groups.list()])
+        index.add_many("keywords", [kw async for kw in client.sp.keywords.list()])
+
+        campaign_id = index.parent_id("ad_groups", ad_group_id)
+        ad_group = index.find_by_name("ad_groups", "Shoes", campaign_id=campaign_id)
+        keyword = index.find_keyword(ad_group_id, "running shoes", "exact")
+    """
+
+    def __init__(self) -> None:
+        self._tables: dict[str, _Table] = {}
+
+    def __len__(self) -> int:
+        return sum(len(table.rows) for table in self._tables.values())
+
+    def __contains__(self, key: tuple[str, str | int]) -> bool:
+        entity_type, entity_id = key
+        table = self._tables.get(entity_type)
+        return table is not None and str(entity_id) in table.rows
+
+    def count(self, entity_type: str) -> int:
+        """Return the number of indexed entities of one type."""
+        table = self._tables.get(entity_type)
+        return len(table.rows) if table else 0
+
+    def add(self, entity_type: str, entity: dict) -> None:
+        """Index an entity, replacing a previous version with the same ID.
+
+        Args:
+            entity_type: Entity type, e.g. campaigns, ad_groups or keywords
+            entity: Entity dictionary as returned by the API
+
+        Raises:
+            ValueError: If the entity type is unknown or the entity has no ID
+        """
+        id_key, parent_key = _keys(entity_type)
+        entity_id = entity.get(id_key)
+        if entity_id is None:
+            raise ValueError(f"{entity_type} entity has no {id_key}")
+        entity_id = sys.intern(str(entity_id))
+        table = self._tables.get(entity_type)
+        if table is None:
+            table = self._tables[entity_type] = _Table(parent_key)
+        campaign_scoped = entity_type != "campaigns"
+        if entity_id in table.rows:
+            table.unlink(entity_id, campaign_scoped)
+        row = table.pack(entity)
+        table.rows[entity_id] = row
+        table.link(entity_id, row, campaign_scoped)
+
+    def add_many(self, entity_type: str, entities: Iterable[dict]) -> int:
+        """Index many entities of one type.
+
+        Returns:
+            Number of entities indexed
+        """
+        added = 0
+        for entity in entities:
+            self.add(entity_type, entity)
+            added += 1
+        return added
+
+    def update(self, entity_type: str, changes: dict) -> bool:
+        """Merge changed fields into an indexed entity.
+
+        Args:
+            entity_type: Entity type
+            changes: Partial entity holding the ID and the changed fields
+
+        Returns:
+            False if the entity is not indexed
+        """
+        id_key, _ = _keys(entity_type)
+        current = self.get(entity_type, changes.get(id_key, ""))
+        if current is None:
+            return False
+        current.update(changes)
+        self.add(entity_type, current)
+        return True
+
+    def update_many(self, entity_type: str, changes: Iterable[dict]) -> int:
+        """Merge many partial entities, see update().
+
+        Returns:
+            Number of entities updated
+        """
+        return sum(1 for change in changes if self.update(entity_type, change))
+
+    def remove(self, entity_type: str, entity_id: str | int) -> bool:
+        """Remove an entity from the index, its children stay indexed.
+
+        Returns:
+            False if the entity is not indexed
+        """
+        table = self._tables.get(entity_type)
+        entity_id = str(entity_id)
+        if table is None or entity_id not in table.rows:
+            return False
+        table.unlink(entity_id, entity_type != "campaigns")
+        del table.rows[entity_id]
+        return True
+
+    def get(self, entity_type: str, entity_id: str | int) -> dict | None:
+        """Return an indexed entity as a new dict, or None."""
+        table = self._tables.get(entity_type)
+        if table is None:
+            return None
+        row = table.rows.get(str(entity_id))
+        return table.unpack(row) if row is not None else None
+
+    def ids(self, entity_type: str) -> list[str]:
+        """Return the IDs of all indexed entities of one type."""
+        table = self._tables.get(entity_type)
+        return list(table.rows) if table else []
+
+    def parent_id(self, entity_type: str, entity_id: str | int) -> str | None:
+        """Return the ID of the entity's parent, e.g. the campaign of an ad group."""
+        table = self._tables.get(entity_type)
+        row = table.rows.get(str(entity_id)) if table else None
+        return table.parent(row) if table and row is not None else None
+
+    def children(self, entity_type: str, parent_id: str | int) -> list[dict]:
+        """Return indexed entities of one type directly below a parent.
+
+        Args:
+            entity_type: Child entity type, e.g. keywords
+            parent_id: ID of the parent, e.g. an ad group ID
+        """
+        table = self._tables.get(entity_type)
+        if table is None:
+            return []
+        ids = table.children.get(str(parent_id), ())
+        return [table.unpack(table.rows[child_id]) for child_id in ids]
+
+    def subtree(self, entity_type: str, entity_id: str | int) -> Iterator[tuple[str, dict]]:
+        """Yield every indexed descendant of an entity, parents before children.
+
+        Args:
+            entity_type: Entity type of the root, e.g. campaigns
+            entity_id: ID of the root
+
+        Yields:
+            (entity type, entity dict) tuples
+        """
+        pending = [(entity_type, str(entity_id))]
+        while pending:
+            parent_type, parent_id = pending.pop()
+            for child_type in CHILD_TYPES.get(parent_type, ()):
+                table = self._tables.get(child_type)
+                if table is None:
+                    continue
+                for child_id in table.children.get(parent_id, ()):
+                    yield child_type, table.unpack(table.rows[child_id])
+                    pending.append((child_type, child_id))
+
+    def find_by_name(
+        self, entity_type: str, name: str, campaign_id: str | int | None = None
+    ) -> dict | None:
+        """Return the entity with this exact name, preferring one that is not archived.
+
+        Args:
+            entity_type: campaigns, or a type named within a campaign such as ad_groups
+            name: Entity name
+            campaign_id: Campaign the entity belongs to, None for campaigns
+        """
+        table = self._tables.get(entity_type)
+        ids = table.names.get(_key(campaign_id), {}).get(name) if table else None
+        return self._pick(entity_type, ids)
+
+    def find_keyword(
+        self,
+        ad_group_id: str | int,
+        keyword_text: str,
+        match_type: str,
+        entity_type: str = "keywords",
+    ) -> dict | None:
+        """Return the keyword with this text and match type in an ad group, preferring live ones.
+
+        Args:
+            ad_group_id: Ad group ID
+            keyword_text: Keyword text
+            match_type: Match type, e.g. exact, phrase or broad
+            entity_type: keywords or negative_keywords
+        """
+        table = self._tables.get(entity_type)
+        bucket = table.keywords.get((_key(ad_group_id), match_type), {}) if table else {}
+        return self._pick(entity_type, bucket.get(keyword_text))
+
+    def _pick(self, entity_type: str, ids: str | set[str] | None) -> dict | None:
+        """Return one of several matching entities, preferring ones not archived."""
+        if ids is None:
+            return None
+        if isinstance(ids, str):
+            return self.get(entity_type, ids)
+        entities = [self.get(entity_type, entity_id) for entity_id in sorted(ids)]
+        matches = [entity for entity in entities if entity is not None]
+        live = [entity for entity in matches if str(entity.get("state", "")).lower() != "archived"]
+        candidates = live or matches
+        return candidates[0] if candidates else None
+
+
+def _keys(entity_type: str) -> tuple[str, str | None]:
+    try:
+        return ENTITY_KEYS[entity_type]
+    except KeyError:
+        raise ValueError(f"Unknown entity type: {entity_type}") from None
@@ -0,0 +1,186 @@
+"""Append-only journal of bulk write outcomes for resumable jobs.
+
+A bulk job that crashes halfway cannot tell which chunks went through. With a
+journal attached, every chunk is recorded before it is sent, together with the
+hash of its payload and of each item. Its per-item outcomes are recorded once
+the response arrived. A restarted job with the same journal skips the items
+whose success was recorded by an earlier run, returning the recorded result,
+and resends only the unfinished work. Each recorded success skips one write,
+so a job that sets the same value twice still sends it a second time.
+
+The journal is a JSON lines file, written and synced record by record off the
+event loop, so a crash loses at most the record being written. A torn last
+line is cut off on load.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from os import PathLike
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SUCCESS = "SUCCESS"
+
+
+def _hash(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class WriteJournal:
+    """Record bulk write chunks and their outcomes in an append-only file.
+
+    Use one journal file per job and delete it once the job has finished.
+    Only successes recorded before the journal was opened are skipped, each
+    one for a single write, so the rerun of a job replays it exactly once.
+
+    Example:
+        with WriteJournal("bid-job-2024-06-01.jsonl") as journal:
+            client.sp.keywords.journal = journal
+            await client.sp.keywords.edit(bids)  # after a crash, rerun as is
+    """
+
+    def __init__(self, path: str | PathLike[str], fsync: bool = True):
+        """Open a journal, loading the outcomes recorded by earlier runs.
+
+        Args:
+            path: Journal file, created if missing
+            fsync: Whether to sync every record to disk, off trades crash safety for speed
+        """
+        self.path = path
+        self.fsync = fsync
+        self._confirmed = 0
+        # Results confirmed by earlier runs, one entry per write they stand for
+        self._resumable: dict[str, list[dict]] = {}
+        self._open_chunks: dict[str, int] = {}
+        self._load()
+        # Each record goes out in one append-mode write() call
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def __enter__(self) -> "WriteJournal":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of confirmed items, across all runs."""
+        return self._confirmed
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def confirmed(self, method: str, path: str, items: list[dict]) -> dict[int, dict]:
+        """Return and use up the results of items confirmed by an earlier run.
+
+        Each confirmation loaded from the journal file matches one item, so
+        duplicates are only skipped as often as they succeeded before.
+
+        Args:
+            method: POST for create, PUT for edit
+            path: Endpoint path
+            items: Entities about to be written
+
+        Returns:
+            Mapping of input position to recorded result, for confirmed items only
+        """
+        found = {}
+        for index, item in enumerate(items):
+            results = self._resumable.get(_hash([method, path, item]))
+            if results:
+                found[index] = results.pop(0)
+        return found
+
+    async def begin(self, method: str, path: str, chunk: list[dict]) -> tuple[str, list[str]]:
+        """Record a chunk about to be sent.
+
+        Returns:
+            The chunk hash and item hashes, to pass to ``record()``
+        """
+        item_hashes = [_hash([method, path, item]) for item in chunk]
+        chunk_hash = _hash(item_hashes)
+        self._open_chunks[chunk_hash] = self._open_chunks.get(chunk_hash, 0) + 1
+        await self._append({"event": "sent", "chunk": chunk_hash, "op": f"{method} {path}"})
+        return chunk_hash, item_hashes
+
+    async def record(self, token: tuple[str, list[str]], results: Any) -> None:
+        """Record the per-item results of a chunk started with ``begin()``."""
+        chunk_hash, item_hashes = token
+        if not isinstance(results, list) or len(results) != len(item_hashes):
+            logger.warning(f"Cannot journal results of chunk {chunk_hash[:12]}: unexpected shape")
+            return
+        await self._append(
+            {"event": "done", "chunk": chunk_hash, "items": item_hashes, "results": results}
+        )
+        self._close_chunk(chunk_hash)
+        self._confirm(item_hashes, results)
+
+    async def reject(self, token: tuple[str, list[str]], error: Exception) -> None:
+        """Record that the API rejected a chunk started with ``begin()`` as a whole."""
+        chunk_hash, _ = token
+        await self._append({"event": "rejected", "chunk": chunk_hash, "error": str(error)})
+        self._close_chunk(chunk_hash)
+
+    def in_doubt(self) -> list[str]:
+        """Return hashes of chunks sent without a recorded outcome.
+
+        These chunks were cut off by a crash or failed with a transient error
+        such as a timeout, and may or may not have been applied.
+        """
+        return [chunk_hash for chunk_hash, count in self._open_chunks.items() if count > 0]
+
+    def _confirm(self, item_hashes: list[str], results: list[Any], resumable: bool = False) -> None:
+        for item_hash, result in zip(item_hashes, results, strict=True):
+            if isinstance(result, dict) and result.get("code", SUCCESS) == SUCCESS:
+                self._confirmed += 1
+                if resumable:
+                    self._resumable.setdefault(item_hash, []).append(result)
+
+    def _close_chunk(self, chunk_hash: str) -> None:
+        if self._open_chunks.get(chunk_hash, 0) > 0:
+            self._open_chunks[chunk_hash] -= 1
+
+    async def _append(self, record: dict) -> None:
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        await asyncio.to_thread(self._write, line.encode())
+
+    def _write(self, data: bytes) -> None:
+        os.write(self._fd, data)
+        if self.fsync:
+            os.fsync(self._fd)
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        complete = 0
+        with open(self.path, "rb") as file:
+            for number, line in enumerate(file, 1):
+                if not line.endswith(b"\n"):
+                    # Torn by a crash mid-write, cut off below so the next record starts clean
+                    logger.warning(f"Dropping torn last line {number} of {self.path}")
+                    break
+                complete += len(line)
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    logger.warning(f"Skipping unreadable journal line {number} of {self.path}")
+                    continue
+                if record.get("event") == "sent":
+                    chunk_hash = record["chunk"]
+                    self._open_chunks[chunk_hash] = self._open_chunks.get(chunk_hash, 0) + 1
+                elif record.get("event") == "done":
+                    self._close_chunk(record["chunk"])
+                    self._confirm(record["items"], record["results"], resumable=True)
+                elif record.get("event") == "rejected":
+                    self._close_chunk(record["chunk"])
+        if os.path.getsize(self.path) > complete:
+            os.truncate(self.path, complete)
+        if self._confirmed:
+            logger.info(f"Journal {self.path} holds {self._confirmed} confirmed items")
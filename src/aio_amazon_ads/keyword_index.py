@@ -0,0 +1,202 @@
+"""Normalized keyword index for duplicate and negative conflict detection.
+
+Amazon compares keyword text case-insensitively and ignores punctuation and
+repeated whitespace, so "Running-Shoes" and "running shoes" are the same
+keyword. Rows that duplicate an existing keyword, or positive keywords blocked
+by a negative keyword of their ad group or campaign, are rejected one by one
+by ``create()``. The index answers both questions with hash lookups so doomed
+rows can be dropped before they are sent.
+"""
+
+import re
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+_PUNCTUATION = re.compile(r"[^\w\s]|_")
+_WHITESPACE = re.compile(r"\s+")
+
+NEGATIVE_EXACT = "negativeexact"
+NEGATIVE_PHRASE = "negativephrase"
+
+# Amazon keywords have at most 10 words, longer text is not enumerated further
+MAX_KEYWORD_WORDS = 10
+
+
+def normalize_keyword_text(text: str) -> str:
+    """Normalize keyword text the way Amazon compares it.
+
+    Args:
+        text: Keyword text
+
+    Returns:
+        Case-folded text with punctuation replaced by spaces and whitespace collapsed
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", text)).strip()
+
+
+def _match_type(row: dict) -> str:
+    return str(row.get("matchType", "")).lower()
+
+
+def _scope(row: dict) -> tuple[str, str]:
+    """Return the ad group scope of a row, or its campaign scope without ad group."""
+    if row.get("adGroupId") is not None:
+        return ("adGroup", str(row["adGroupId"]))
+    return ("campaign", str(row.get("campaignId")))
+
+
+@dataclass
+class PreflightResult:
+    """Rows split into those worth sending and those Amazon would reject."""
+
+    accepted: list[dict] = field(default_factory=list)
+    rejected: list[tuple[dict, str]] = field(default_factory=list)
+    """(row, reason) pairs; reason is duplicate, duplicate_in_batch or negative_conflict"""
+
+
+class KeywordIndex:
+    """Index of existing keywords and negative keywords by normalized text.
+
+    Example:
+        index = KeywordIndex()
+        index.add_keywords([kw async for kw in client.sp.keywords.list()])
+        index.add_negative_keywords([nk async for nk in client.sp.negative_keywords.list()])
+
+        result = index.preflight(new_keywords)
+        created = await client.sp.keywords.create(result.accepted)
+    """
+
+    def __init__(self) -> None:
+        self._keywords: set[tuple[str, str, str]] = set()
+        self._negatives: set[tuple[str, str, str, str]] = set()
+
+    def __len__(self) -> int:
+        return len(self._keywords) + len(self._negatives)
+
+    def add_keywords(self, keywords: Iterable[dict]) -> int:
+        """Index positive keywords, archived ones are skipped.
+
+        Returns:
+            Number of keywords indexed
+        """
+        added = 0
+        for keyword in keywords:
+            if str(keyword.get("state", "")).lower() == "archived":
+                continue
+            self._keywords.add(self._keyword_key(keyword))
+            added += 1
+        return added
+
+    def add_negative_keywords(self, negatives: Iterable[dict]) -> int:
+        """Index negative keywords, archived ones are skipped.
+
+        Rows with an adGroupId are ad group negatives, rows without one are
+        campaign negatives.
+
+        Returns:
+            Number of negative keywords indexed
+        """
+        added = 0
+        for negative in negatives:
+            if str(negative.get("state", "")).lower() == "archived":
+                continue
+            self._negatives.add(self._negative_key(negative))
+            added += 1
+        return added
+
+    def is_duplicate(self, keyword: dict) -> bool:
+        """Return whether the ad group already has this keyword and match type."""
+        return self._keyword_key(keyword) in self._keywords
+
+    def is_duplicate_negative(self, negative: dict) -> bool:
+        """Return whether the ad group or campaign already has this negative keyword."""
+        return self._negative_key(negative) in self._negatives
+
+    def conflicts(self, keyword: dict) -> list[tuple[str, str, str]]:
+        """Return the negative keywords that block a positive keyword.
+
+        A negative exact keyword blocks a keyword with the same normalized
+        text. A negative phrase keyword blocks every keyword containing its
+        words in order. Negatives of the keyword's ad group and of its
+        campaign are checked.
+
+        Args:
+            keyword: Positive keyword row with adGroupId, campaignId and keywordText
+
+        Returns:
+            (scope, normalized negative text, match type) per blocking negative,
+            scope being "adGroup" or "campaign"
+        """
+        text = normalize_keyword_text(keyword.get("keywordText", ""))
+        words = text.split(" ")[:MAX_KEYWORD_WORDS]
+        phrases = {
+            " ".join(words[start:end])
+            for start in range(len(words))
+            for end in range(start + 1, len(words) + 1)
+        }
+        scopes = []
+        if keyword.get("adGroupId") is not None:
+            scopes.append(("adGroup", str(keyword["adGroupId"])))
+        if keyword.get("campaignId") is not None:
+            scopes.append(("campaign", str(keyword["campaignId"])))
+
+        found = []
+        for scope_type, scope_id in scopes:
+            if (scope_type, scope_id, text, NEGATIVE_EXACT) in self._negatives:
+                found.append((scope_type, text, NEGATIVE_EXACT))
+            for phrase in phrases:
+                if (scope_type, scope_id, phrase, NEGATIVE_PHRASE) in self._negatives:
+                    found.append((scope_type, phrase, NEGATIVE_PHRASE))
+        return found
+
+    def preflight(self, rows: Iterable[dict], negative: bool = False) -> PreflightResult:
+        """Drop rows that create() would reject.
+
+        Positive keywords are rejected when they duplicate an indexed keyword
+        or a row earlier in the batch, or when a negative keyword blocks them.
+        Negative keywords are rejected when they are duplicates. Accepted rows
+        are not added to the index; add them once they were created.
+
+        Args:
+            rows: Keyword rows about to be created
+            negative: Whether the rows are negative keywords
+
+        Returns:
+            PreflightResult with accepted rows in input order and rejected rows
+            with their reason
+        """
+        result = PreflightResult()
+        batch: set[tuple] = set()
+        existing: set = self._negatives if negative else self._keywords
+        for row in rows:
+            key: tuple = self._negative_key(row) if negative else self._keyword_key(row)
+            if key in existing:
+                result.rejected.append((row, "duplicate"))
+            elif key in batch:
+                result.rejected.append((row, "duplicate_in_batch"))
+            elif not negative and self.conflicts(row):
+                result.rejected.append((row, "negative_conflict"))
+            else:
+                batch.add(key)
+                result.accepted.append(row)
+        return result
+
+    @staticmethod
+    def _keyword_key(keyword: dict) -> tuple[str, str, str]:
+        return (
+            str(keyword.get("adGroupId")),
+            normalize_keyword_text(keyword.get("keywordText", "")),
+            _match_type(keyword),
+        )
+
+    @staticmethod
+    def _negative_key(negative: dict) -> tuple[str, str, str, str]:
+        scope_type, scope_id = _scope(negative)
+        return (
+            scope_type,
+            scope_id,
+            normalize_keyword_text(negative.get("keywordText", "")),
+            _match_type(negative),
+        )
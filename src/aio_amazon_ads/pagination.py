@@ -0,0 +1,139 @@
+"""Page-level pagination types."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+# IDs packed into one comma-separated *IdFilter value
+DEFAULT_ID_CHUNK_SIZE = 100
+
+# Characters of one comma-separated *IdFilter value, keeps URLs well below server limits
+MAX_ID_FILTER_LENGTH = 1500
+
+
+def chunk_ids(
+    ids: Iterable[str | int],
+    chunk_size: int = DEFAULT_ID_CHUNK_SIZE,
+    max_length: int = MAX_ID_FILTER_LENGTH,
+) -> list[list[str]]:
+    """Split IDs into chunks that fit one comma-separated ID filter.
+
+    Duplicates are dropped and order is kept. A chunk is closed when it
+    reaches ``chunk_size`` IDs or its joined value would exceed ``max_length``.
+
+    Args:
+        ids: Entity IDs
+        chunk_size: Maximum number of IDs per chunk
+        max_length: Maximum length of a chunk joined with commas
+
+    Returns:
+        List of ID chunks
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    length = 0
+    for entity_id in dict.fromkeys(str(entity_id) for entity_id in ids):
+        added = len(entity_id) + (1 if current else 0)
+        if current and (len(current) >= chunk_size or length + added > max_length):
+            chunks.append(current)
+            current, length, added = [], 0, len(entity_id)
+        current.append(entity_id)
+        length += added
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Serializable position inside a paginated listing.
+
+    A cursor captures the endpoint, the filters and the token of the next page
+    to fetch, so an interrupted crawl can continue with ``resume_from=cursor``
+    instead of starting over from page one.
+    """
+
+    path: str
+    params: dict[str, Any]
+    next_token: str
+    page_index: int
+    """Index of the page the cursor points at"""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            "path": self.path,
+            "params": dict(self.params),
+            "next_token": self.next_token,
+            "page_index": self.page_index,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Cursor":
+        """Rebuild a cursor from ``to_dict()`` output.
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        try:
+            return cls(
+                path=data["path"],
+                params=dict(data.get("params") or {}),
+                next_token=data["next_token"],
+                page_index=int(data.get("page_index", 0)),
+            )
+        except KeyError as e:
+            raise ValueError(f"Invalid cursor, missing field: {e.args[0]}") from e
+
+
+@dataclass
+class Page:
+    """One page of a list endpoint together with its fetch metadata."""
+
+    items: list[dict] = field(repr=False)
+    index: int
+    """Zero-based position of the page within the listing"""
+    next_token: str | None
+    """Token for the following page, None on the last page"""
+    latency: float
+    """Seconds spent fetching the page, including retries"""
+    size_bytes: int
+    """Size of the response body in bytes"""
+    cursor: Cursor | None = None
+    """Resume point for the page after this one, None on the last page"""
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def shard_by_values(param: str, values: Iterable[Any]) -> list[dict[str, Any]]:
+    """Build one shard per filter value.
+
+    Args:
+        param: list_pages() argument to vary, e.g. ``state_filter`` or ``stateFilter``
+        values: Filter values, one shard each
+
+    Returns:
+        List of shard keyword arguments for ``list_sharded()``
+    """
+    return [{param: value} for value in values]
+
+
+def shard_by_ids(
+    param: str,
+    ids: Iterable[str | int],
+    chunk_size: int = DEFAULT_ID_CHUNK_SIZE,
+) -> list[dict[str, Any]]:
+    """Build shards from chunks of IDs packed into comma-separated filters.
+
+    Args:
+        param: list_pages() argument taking an ID filter, e.g. ``campaign_id_filter``
+        ids: Entity IDs to split across shards
+        chunk_size: Maximum number of IDs per shard
+
+    Returns:
+        List of shard keyword arguments for ``list_sharded()``
+    """
+    return [{param: ",".join(chunk)} for chunk in chunk_ids(ids, chunk_size)]
@@ -0,0 +1,210 @@
+"""Rate-limit headroom and quota usage telemetry.
+
+Amazon does not publish per-profile rate limits, so the tracker infers them from
+traffic: every request attempt is recorded per (profile, ad product) and the
+rate at which requests were still accepted when a 429 arrived becomes the
+estimated sustainable throughput for that key.
+"""
+
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+AD_PRODUCTS = frozenset(["sp", "sb", "sd"])
+
+# Number of Retry-After values remembered per key
+RETRY_AFTER_HISTORY = 20
+
+
+def ad_product_for_path(path: str) -> str:
+    """Derive the ad product a request path belongs to.
+
+    Args:
+        path: API request path, e.g. ``/v2/sp/campaigns`` or ``/sp/adGroups``
+
+    Returns:
+        ``sp``, ``sb`` or ``sd``, or ``common`` for shared endpoints such as
+        portfolios and profiles
+    """
+    parts = [part for part in path.split("/") if part]
+    if parts and parts[0][:1] == "v" and parts[0][1:].isdigit():
+        parts = parts[1:]
+    if parts and parts[0] in AD_PRODUCTS:
+        return parts[0]
+    return "common"
+
+
+def parse_retry_after(value: str | None) -> int | None:
+    """Parse a Retry-After header given in seconds.
+
+    Args:
+        value: Header value, e.g. ``"30"`` or ``"1.5"``
+
+    Returns:
+        Whole seconds rounded up, or None if the header is missing or not a
+        number of seconds, such as an HTTP date
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value.strip())
+    except ValueError:
+        return None
+    if not math.isfinite(seconds) or seconds < 0:
+        return None
+    return math.ceil(seconds)
+
+
+@dataclass(frozen=True)
+class QuotaStatus:
+    """Point-in-time quota usage for one profile and ad product."""
+
+    profile_id: str
+    ad_product: str
+    requests: int
+    """Request attempts inside the rolling window"""
+    throttled: int
+    """429 responses inside the rolling window"""
+    request_rate: float
+    """Request attempts per second over the rolling window"""
+    throttle_rate: float
+    """Fraction of attempts inside the window answered with 429"""
+    retry_after: float | None
+    """Mean of recently observed Retry-After values in seconds"""
+    last_retry_after: int | None
+    """Most recent Retry-After value in seconds"""
+    estimated_rps: float | None
+    """Estimated sustainable requests per second, None until first throttled"""
+    headroom: float | None
+    """estimated_rps minus request_rate, None while no limit has been observed"""
+
+
+class _QuotaWindow:
+    """Rolling request statistics for a single (profile, ad product) key."""
+
+    __slots__ = ("window", "samples", "throttled", "retry_afters", "ceiling", "started_at")
+
+    def __init__(self, window: float, now: float):
+        self.window = window
+        self.samples: deque[tuple[float, bool]] = deque()
+        self.throttled = 0
+        """Throttled samples in ``samples``, kept in step on append and expiry"""
+        self.retry_afters: deque[int] = deque(maxlen=RETRY_AFTER_HISTORY)
+        self.ceiling: float | None = None
+        self.started_at = now
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        while self.samples and self.samples[0][0] < cutoff:
+            _, was_throttled = self.samples.popleft()
+            self.throttled -= was_throttled
+
+    def _span(self, now: float) -> float:
+        # Young windows would otherwise report inflated rates
+        return max(min(self.window, now - self.started_at), 1.0)
+
+    def record(self, now: float, throttled: bool, retry_after: int | None) -> None:
+        self._expire(now)
+        self.samples.append((now, throttled))
+        self.throttled += throttled
+        if retry_after is not None:
+            self.retry_afters.append(retry_after)
+
+        accepted = len(self.samples) - self.throttled
+        accepted_rate = accepted / self._span(now)
+        if throttled:
+            self.ceiling = accepted_rate
+        elif self.ceiling is not None and accepted_rate > self.ceiling:
+            # Sustained more than the previous estimate without a 429
+            self.ceiling = accepted_rate
+
+    def status(self, profile_id: str, ad_product: str, now: float) -> QuotaStatus:
+        self._expire(now)
+        requests = len(self.samples)
+        throttled = self.throttled
+        request_rate = requests / self._span(now)
+        retry_after = sum(self.retry_afters) / len(self.retry_afters) if self.retry_afters else None
+        return QuotaStatus(
+            profile_id=profile_id,
+            ad_product=ad_product,
+            requests=requests,
+            throttled=throttled,
+            request_rate=request_rate,
+            throttle_rate=throttled / requests if requests else 0.0,
+            retry_after=retry_after,
+            last_retry_after=self.retry_afters[-1] if self.retry_afters else None,
+            estimated_rps=self.ceiling,
+            headroom=self.ceiling - request_rate if self.ceiling is not None else None,
+        )
+
+
+class QuotaTracker:
+    """Track request rates and throttling per profile and ad product.
+
+    A single tracker can be shared by several clients (one per profile) so a
+    scheduler can compare headroom across profiles.
+
+    Example:
+        tracker = QuotaTracker()
+        clients = [AmazonAdsClient(..., profile_id=p, quota_tracker=tracker) for p in ids]
+        least_busy = max(tracker.status(), key=lambda s: s.headroom or float("inf"))
+    """
+
+    def __init__(self, window: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        """Initialize quota tracker.
+
+        Args:
+            window: Length of the rolling window in seconds
+            clock: Monotonic time source, overridable for tests
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self._clock = clock
+        self._windows: dict[tuple[str, str], _QuotaWindow] = {}
+
+    def record(
+        self,
+        profile_id: str,
+        path: str,
+        status_code: int,
+        retry_after: int | None = None,
+    ) -> None:
+        """Record a single request attempt.
+
+        Args:
+            profile_id: Profile the request was scoped to
+            path: Request path, used to derive the ad product
+            status_code: HTTP status code of the response
+            retry_after: Retry-After header value in seconds, if present
+        """
+        now = self._clock()
+        key = (profile_id, ad_product_for_path(path))
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = _QuotaWindow(self.window, now)
+        window.record(now, status_code == 429, retry_after)
+
+    def status(
+        self,
+        profile_id: str | None = None,
+        ad_product: str | None = None,
+    ) -> list[QuotaStatus]:
+        """Return quota usage for all tracked keys, optionally filtered.
+
+        Args:
+            profile_id: Only include this profile
+            ad_product: Only include this ad product (sp, sb, sd, common)
+
+        Returns:
+            List of QuotaStatus snapshots
+        """
+        now = self._clock()
+        return [
+            window.status(key_profile, key_product, now)
+            for (key_profile, key_product), window in self._windows.items()
+            if (profile_id is None or key_profile == profile_id)
+            and (ad_product is None or key_product == ad_product)
+        ]
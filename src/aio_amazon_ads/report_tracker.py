@@ -0,0 +1,394 @@
+"""Multiplexed status polling and downloading of many pending reports."""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+from collections.abc import AsyncGenerator, Callable
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import TRANSIENT_ERRORS, ReportError, ReportTimeoutError, ThrottlingError
+from .reporting import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_REPORT_DEADLINE,
+    REPORT_DOWNLOADED,
+    REPORT_FAILURE,
+    REPORT_IN_PROGRESS,
+    REPORT_SUCCESS,
+    ReportProgress,
+    ReportTimings,
+    decode_report,
+    next_poll_delay,
+    report_kind,
+    report_location,
+)
+
+if TYPE_CHECKING:
+    from .services.sp import Reports
+
+logger = logging.getLogger(__name__)
+
+# Status polls in flight at once
+DEFAULT_POLL_CONCURRENCY = 8
+
+# Concurrent report downloads
+DEFAULT_DOWNLOAD_WORKERS = 4
+
+# Share of a profile's estimated sustainable request rate that status polls
+# may use, leaving the rest to the entity and write traffic running alongside
+QUOTA_POLL_SHARE = 0.5
+
+
+@dataclass
+class ReportResult:
+    """Outcome of one tracked report."""
+
+    report_id: str
+    kind: str
+    """Timing key of the report, e.g. ``sp:clicks,impressions``"""
+    rows: list[dict[str, Any]] | None = field(default=None, repr=False)
+    """Decoded report rows, None if the report failed"""
+    error: Exception | None = None
+    """ReportError, ReportTimeoutError or the API error that ended tracking"""
+    polls: int = 0
+    elapsed: float = 0.0
+    """Seconds from tracking start until the rows were decoded or tracking ended"""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the report was downloaded."""
+        return self.error is None
+
+
+@dataclass
+class _Tracked:
+    report_id: str
+    kind: str
+    reports: "Reports"
+    started: float
+    future: "asyncio.Future[ReportResult]"
+    polls: int = 0
+    overdue_polls: int = 0
+
+
+class ReportTracker:
+    """Poll many pending reports from one scheduling loop and download them as they finish.
+
+    Every tracked report gets its next poll time from the expected duration
+    of its kind, see next_poll_delay(). One loop polls the report that is
+    due first, so reports expected to be ready soonest are polled first.
+    At most ``poll_concurrency`` polls are in flight.
+
+    Polls are paced per reports service, that is per profile. A fixed
+    ``max_polls_per_second`` takes precedence. Without one, polls of a profile
+    are spaced to QUOTA_POLL_SHARE of the sustainable rate its client's
+    QuotaTracker estimated from earlier 429s, and unpaced while no limit has
+    been observed. A poll still throttled after the request retries holds
+    back further polls of that profile for the Retry-After period. Ready reports are handed to a pool of
+    ``download_workers`` that download and decode them, so downloads never
+    hold up polling.
+
+    Example:
+        async with client.sp.reports.tracker(download_workers=8) as tracker:
+            for profile_client in profile_clients:
+                for day in days:
+                    await tracker.submit(day, metrics, profile_client.sp.reports)
+            async for result in tracker.results():
+                store(result.report_id, result.rows)
+    """
+
+    def __init__(
+        self,
+        reports: "Reports",
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        poll_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+        max_polls_per_second: float | None = None,
+        deadline: float = DEFAULT_REPORT_DEADLINE,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        timings: ReportTimings | None = None,
+        on_progress: Callable[[ReportProgress], None] | None = None,
+    ):
+        """Initialize report tracker.
+
+        Args:
+            reports: Reports service used for reports tracked without their own
+            download_workers: Concurrent report downloads
+            poll_concurrency: Status polls in flight at once
+            max_polls_per_second: Cap on status polls started per second and
+                profile, None to pace polls by the client's quota telemetry
+            deadline: Seconds a report may take from tracking start until it is ready
+            min_interval: Shortest delay between status polls of one report
+            max_interval: Longest delay between status polls of one report
+            timings: Expected durations per report kind, defaults to those of
+                ``reports`` so run() and the tracker learn from each other
+            on_progress: Called after every poll and download with the report's progress
+        """
+        if download_workers < 1:
+            raise ValueError("download_workers must be at least 1")
+        if poll_concurrency < 1:
+            raise ValueError("poll_concurrency must be at least 1")
+        if max_polls_per_second is not None and max_polls_per_second <= 0:
+            raise ValueError("max_polls_per_second must be positive")
+        self.reports = reports
+        self.download_workers = download_workers
+        self.poll_concurrency = poll_concurrency
+        self.max_polls_per_second = max_polls_per_second
+        self.deadline = deadline
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.timings = timings if timings is not None else reports.timings
+        self.on_progress = on_progress
+        self._schedule: list[tuple[float, int, _Tracked]] = []
+        self._order = itertools.count()
+        self._pending: dict[str, _Tracked] = {}
+        self._finished: asyncio.Queue[ReportResult] = asyncio.Queue()
+        self._changed = asyncio.Event()
+        self._downloads: asyncio.Queue[tuple[_Tracked, str]] = asyncio.Queue()
+        self._poll_slots = asyncio.Semaphore(poll_concurrency)
+        self._polls: set[asyncio.Task[None]] = set()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._ready_at: dict[Reports, float] = {}
+
+    def __len__(self) -> int:
+        """Return the number of reports still being tracked."""
+        return len(self._pending)
+
+    async def __aenter__(self) -> "ReportTracker":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            if exc_type is None:
+                await self.join()
+        finally:
+            await self.close()
+
+    async def submit(
+        self, report_date: str, metrics: list[str], reports: "Reports | None" = None
+    ) -> "asyncio.Future[ReportResult]":
+        """Create a report and track it, see track().
+
+        Args:
+            report_date: Report date in YYYYMMDD format
+            metrics: List of metrics to include in report
+            reports: Reports service of the report's profile, defaults to the tracker's
+        """
+        service = reports if reports is not None else self.reports
+        report_id = await service.create(report_date, metrics)
+        return self.track(report_id, report_kind("sp", metrics), service)
+
+    def track(
+        self, report_id: str, kind: str = "sp", reports: "Reports | None" = None
+    ) -> "asyncio.Future[ReportResult]":
+        """Start tracking a created report.
+
+        Args:
+            report_id: Report identifier
+            kind: Timing key of the report, e.g. report_kind("sp", metrics)
+            reports: Reports service of the report's profile, defaults to the tracker's
+
+        Returns:
+            Future resolving to the ReportResult once the report is downloaded
+            or tracking ended; it never raises
+        """
+        if not report_id:
+            raise ValueError("report_id is required")
+        if report_id in self._pending:
+            return self._pending[report_id].future
+        self._start()
+        loop = asyncio.get_running_loop()
+        tracked = _Tracked(
+            report_id=report_id,
+            kind=kind,
+            reports=reports if reports is not None else self.reports,
+            started=loop.time(),
+            future=loop.create_future(),
+        )
+        self._pending[report_id] = tracked
+        self._schedule_poll(tracked)
+        return tracked.future
+
+    async def results(self) -> AsyncGenerator[ReportResult, None]:
+        """Yield results in completion order until no tracked report is pending."""
+        while self._pending or not self._finished.empty():
+            yield await self._finished.get()
+
+    async def join(self) -> None:
+        """Wait until every tracked report is finished."""
+        futures = [tracked.future for tracked in self._pending.values()]
+        if futures:
+            await asyncio.wait(futures)
+
+    async def close(self) -> None:
+        """Stop polling and downloading; reports still pending stay unfinished."""
+        tasks = [*self._tasks, *self._polls]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.ensure_future(self._run_schedule()))
+        for _ in range(self.download_workers):
+            self._tasks.append(asyncio.ensure_future(self._run_downloads()))
+
+    def _schedule_poll(self, tracked: _Tracked) -> None:
+        now = asyncio.get_running_loop().time()
+        elapsed = now - tracked.started
+        remaining = self.deadline - elapsed
+        if remaining <= 0:
+            error = ReportTimeoutError(
+                f"Report {tracked.report_id} not ready after {tracked.polls} polls "
+                f"in {elapsed:.0f}s",
+                tracked.report_id,
+            )
+            self._finish(tracked, error=error)
+            return
+        expected = self.timings.expected(tracked.kind)
+        delay = next_poll_delay(
+            elapsed, expected, tracked.overdue_polls, self.min_interval, self.max_interval
+        )
+        # The last poll happens at the deadline rather than after it
+        delay = min(delay, remaining)
+        heapq.heappush(self._schedule, (now + delay, next(self._order), tracked))
+        self._emit(tracked, REPORT_IN_PROGRESS, delay)
+        self._changed.set()
+
+    async def _run_schedule(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._schedule:
+                self._changed.clear()
+                await self._changed.wait()
+                continue
+            due = self._schedule[0][0]
+            now = loop.time()
+            if due > now:
+                # A newly tracked report may be due earlier
+                self._changed.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._changed.wait(), due - now)
+                continue
+            tracked = self._schedule[0][2]
+            ready_at = self._ready_at.get(tracked.reports, 0.0)
+            if ready_at > now:
+                # Its profile is paced; reports of other profiles may go first
+                heapq.heapreplace(self._schedule, (ready_at, next(self._order), tracked))
+                continue
+            await self._poll_slots.acquire()
+            # The earliest due report is taken only now, after waiting for capacity
+            _, _, tracked = heapq.heappop(self._schedule)
+            now = loop.time()
+            spacing = self._poll_spacing(tracked.reports)
+            self._ready_at[tracked.reports] = max(now, self._ready_at.get(tracked.reports, 0.0))
+            self._ready_at[tracked.reports] += spacing
+            task = asyncio.ensure_future(self._poll(tracked))
+            self._polls.add(task)
+            task.add_done_callback(self._polls.discard)
+
+    def _poll_spacing(self, reports: "Reports") -> float:
+        """Return the seconds between two polls of one profile."""
+        if self.max_polls_per_second is not None:
+            return 1 / self.max_polls_per_second
+        quota_status = reports.quota_status
+        if quota_status is None:
+            return 0.0
+        rates = [status.estimated_rps for status in quota_status() if status.estimated_rps]
+        if not rates:
+            return 0.0
+        return 1 / (min(rates) * QUOTA_POLL_SHARE)
+
+    async def _poll(self, tracked: _Tracked) -> None:
+        try:
+            status = await tracked.reports.get_status(tracked.report_id)
+        except TRANSIENT_ERRORS as e:
+            # Retries of the request are exhausted; try again on the next poll
+            logger.warning(f"Polling report {tracked.report_id} failed: {e}")
+            if isinstance(e, ThrottlingError):
+                now = asyncio.get_running_loop().time()
+                ready_at = self._ready_at.get(tracked.reports, 0.0)
+                self._ready_at[tracked.reports] = max(ready_at, now + e.retry_after)
+            status = {"status": REPORT_IN_PROGRESS}
+        except Exception as e:
+            self._finish(tracked, error=e)
+            return
+        finally:
+            self._poll_slots.release()
+
+        try:
+            self._handle_status(tracked, status)
+        except Exception as e:
+            # The report has left the schedule; finish it rather than lose it
+            logger.warning(f"Handling status of report {tracked.report_id} failed: {e}")
+            self._finish(tracked, error=e)
+
+    def _handle_status(self, tracked: _Tracked, status: dict) -> None:
+        tracked.polls += 1
+        elapsed = asyncio.get_running_loop().time() - tracked.started
+        if elapsed >= self.timings.expected(tracked.kind):
+            tracked.overdue_polls += 1
+        state = status.get("status")
+        if state == REPORT_SUCCESS:
+            self.timings.observe(tracked.kind, elapsed)
+            url = report_location(status)
+            if url is None:
+                message = f"Report {tracked.report_id} is ready but has no location"
+                self._finish(tracked, error=ReportError(message, tracked.report_id))
+                return
+            self._emit(tracked, REPORT_SUCCESS)
+            self._downloads.put_nowait((tracked, url))
+        elif state == REPORT_FAILURE:
+            details = status.get("statusDetails", "no details")
+            message = f"Report {tracked.report_id} failed: {details}"
+            self._finish(tracked, error=ReportError(message, tracked.report_id))
+        else:
+            self._schedule_poll(tracked)
+
+    async def _run_downloads(self) -> None:
+        while True:
+            tracked, url = await self._downloads.get()
+            try:
+                content = await tracked.reports.download_report(url)
+                rows = decode_report(content)
+            except Exception as e:
+                logger.warning(f"Downloading report {tracked.report_id} failed: {e}")
+                self._finish(tracked, error=e)
+            else:
+                self._finish(tracked, rows=rows)
+
+    def _finish(
+        self,
+        tracked: _Tracked,
+        rows: list[dict[str, Any]] | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        elapsed = asyncio.get_running_loop().time() - tracked.started
+        result = ReportResult(tracked.report_id, tracked.kind, rows, error, tracked.polls, elapsed)
+        self._pending.pop(tracked.report_id, None)
+        if not tracked.future.done():
+            tracked.future.set_result(result)
+        self._finished.put_nowait(result)
+        self._emit(tracked, REPORT_DOWNLOADED if error is None else REPORT_FAILURE)
+
+    def _emit(self, tracked: _Tracked, status: str, next_poll: float | None = None) -> None:
+        if self.on_progress is None:
+            return
+        elapsed = asyncio.get_running_loop().time() - tracked.started
+        progress = ReportProgress(tracked.report_id, status, tracked.polls, elapsed, next_poll)
+        try:
+            self.on_progress(progress)
+        except Exception as e:
+            # A failing callback must not stall polling or kill a download worker
+            logger.warning(f"on_progress callback failed for report {tracked.report_id}: {e}")
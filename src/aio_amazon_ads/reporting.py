@@ -0,0 +1,133 @@
+"""Report status polling tuned to observed report durations.
+
+Reports are generated asynchronously and take from seconds to many minutes.
+Polling at a fixed interval either wastes rate budget or adds dead time, so the
+poll schedule follows how long reports of the same kind took before: polls are
+sparse while a report cannot be ready yet, close in on the expected ready time,
+and back off exponentially once a report is overdue.
+"""
+
+import gzip
+import json
+from dataclasses import dataclass
+from typing import Any
+
+# Status values of the v2 report status endpoint
+REPORT_IN_PROGRESS = "IN_PROGRESS"
+REPORT_SUCCESS = "SUCCESS"
+REPORT_FAILURE = "FAILURE"
+
+# Progress status of a report whose rows were downloaded and decoded
+REPORT_DOWNLOADED = "DOWNLOADED"
+
+# Seconds a report of an unseen kind is expected to take
+DEFAULT_EXPECTED_REPORT_SECONDS = 30.0
+
+# Bounds of the delay between two status polls of one report
+DEFAULT_MIN_POLL_INTERVAL = 2.0
+DEFAULT_MAX_POLL_INTERVAL = 60.0
+
+# Seconds a report run may take end to end
+DEFAULT_REPORT_DEADLINE = 1800.0
+
+
+@dataclass(frozen=True)
+class ReportProgress:
+    """Progress event of a report run."""
+
+    report_id: str
+    status: str
+    """IN_PROGRESS, SUCCESS, FAILURE, or DOWNLOADED once the rows are decoded"""
+    polls: int
+    """Status polls made so far"""
+    elapsed: float
+    """Seconds since the report was created"""
+    next_poll: float | None = None
+    """Seconds until the next status poll, None once polling ended"""
+
+
+class ReportTimings:
+    """Expected report durations per report kind, learned from completed reports.
+
+    Each completed report updates an exponential moving average of how long
+    reports of its kind took, e.g. all SP reports with the same metrics.
+    """
+
+    def __init__(
+        self,
+        default_expected: float = DEFAULT_EXPECTED_REPORT_SECONDS,
+        smoothing: float = 0.3,
+    ):
+        """Initialize report timings.
+
+        Args:
+            default_expected: Seconds expected for a kind without observations
+            smoothing: Weight of the newest observation in the moving average
+        """
+        if default_expected <= 0:
+            raise ValueError("default_expected must be positive")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        self.default_expected = default_expected
+        self.smoothing = smoothing
+        self._expected: dict[str, float] = {}
+
+    def expected(self, kind: str) -> float:
+        """Return the seconds a report of this kind is expected to take."""
+        return self._expected.get(kind, self.default_expected)
+
+    def observe(self, kind: str, duration: float) -> None:
+        """Record how long a completed report of this kind took."""
+        previous = self._expected.get(kind)
+        if previous is None:
+            self._expected[kind] = duration
+        else:
+            self._expected[kind] = previous + self.smoothing * (duration - previous)
+
+
+def next_poll_delay(
+    elapsed: float,
+    expected: float,
+    overdue_polls: int,
+    min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+) -> float:
+    """Return the seconds to wait before the next status poll of a report.
+
+    Before the expected ready time each poll halves the remaining time, so
+    polls close in on it without overshooting much. Past it the delay starts
+    at ``min_interval`` and doubles with every further poll.
+
+    Args:
+        elapsed: Seconds since the report was created
+        expected: Seconds reports of its kind are expected to take
+        overdue_polls: Polls made since the expected ready time passed
+        min_interval: Shortest delay
+        max_interval: Longest delay
+
+    Returns:
+        Delay in seconds within [min_interval, max_interval]
+    """
+    remaining = expected - elapsed
+    delay = remaining / 2 if remaining > 0 else min_interval * 2 ** min(overdue_polls, 32)
+    return max(min_interval, min(max_interval, delay))
+
+
+def report_kind(ad_product: str, metrics: list[str]) -> str:
+    """Return the key reports are grouped by for timing, e.g. ``sp:clicks,cost``."""
+    return f"{ad_product}:{','.join(sorted(metrics))}"
+
+
+def report_location(status: dict) -> str | None:
+    """Return the download URL of a ready report status."""
+    return status.get("location") or status.get("fileUrl")
+
+
+def decode_report(content: bytes) -> list[dict[str, Any]]:
+    """Decompress a downloaded report file if gzipped and parse its JSON rows."""
+    if content[:2] == b"\x1f\x8b":
+        content = gzip.decompress(content)
+    rows = json.loads(content) if content.strip() else []
+    if not isinstance(rows, list):
+        raise ValueError("Report file does not hold a list of rows")
+    return rows
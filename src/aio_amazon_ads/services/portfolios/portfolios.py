@@ -1,10 +1,11 @@
 """Portfolios service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import DEFAULT_SHARD_CONCURRENCY, DEFAULT_STREAM_IN_FLIGHT, BaseService
+from ...pagination import Cursor, Page
 from ...validation import (
     validate_portfolio_id,
     validate_portfolios_for_create,
@@ -17,25 +18,63 @@ Portfolio = dict[str, Any]
 class Portfolios(BaseService):
     """Portfolio management service."""
 
-    async def list(self, **filters: Any) -> AsyncGenerator[Portfolio, None]:
+    id_key = "portfolioId"
+
+    async def list(
+        self, *, extended: bool = False, resume_from: Cursor | None = None, **filters: Any
+    ) -> AsyncGenerator[Portfolio, None]:
         """List portfolios with auto-pagination.
 
         Args:
             **filters: Optional query parameters (portfolioIdFilter, stateFilter, etc.)
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Yields:
             Portfolio dictionaries
         """
-        params = filters.copy() if filters else {}
-        while True:
-            response = await self._request("GET", "/v2/portfolios", params=params)
-            data = response.json()
-            for portfolio in data.get("portfolios", []):
+        async for page in self.list_pages(extended=extended, resume_from=resume_from, **filters):
+            for portfolio in page.items:
                 yield portfolio
-            next_token = data.get("nextToken")
-            if not next_token:
-                break
-            params["nextToken"] = next_token
+
+    async def list_pages(
+        self, *, extended: bool = False, resume_from: Cursor | None = None, **filters: Any
+    ) -> AsyncGenerator[Page, None]:
+        """List portfolios page by page.
+
+        Args:
+            **filters: Optional query parameters (portfolioIdFilter, stateFilter, etc.)
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of portfolio dictionaries with page metadata
+        """
+        path = "/v2/portfolios/extended" if extended else "/v2/portfolios"
+        async for page in self._paginate(path, "portfolios", filters, resume_from):
+            yield page
+
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[Portfolio, None]:
+        """List portfolios across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"stateFilter": "paused"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Portfolio dictionaries, deduplicated by portfolioId
+        """
+        async for portfolio in self._list_sharded(
+            self.list_pages, shards, "portfolioId", concurrency
+        ):
+            yield portfolio
 
     async def get(self, portfolio_id: str) -> Portfolio:
         """Get a specific portfolio.
@@ -47,10 +86,28 @@ class Portfolios(BaseService):
             Portfolio dictionary
         """
         validate_portfolio_id(portfolio_id)
+        if self._get_batcher is not None:
+            return await self._get_batcher.load(portfolio_id)
 
         response = await self._request("GET", f"/v2/portfolios/{portfolio_id}")
         return response.json()
 
+    async def get_many(self, portfolio_ids: Iterable[str]) -> dict[str, Portfolio | None]:
+        """Get many portfolios with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            portfolio_ids: Portfolio identifiers
+
+        Returns:
+            Mapping of each requested ID to its portfolio, or None if not found
+        """
+        return await self._get_many(
+            portfolio_ids, lambda ids: self.list_pages(portfolioIdFilter=ids), "portfolioId"
+        )
+
     async def create(self, portfolios: builtins.list[dict]) -> builtins.list[Portfolio]:
         """Create portfolios.
 
@@ -62,8 +119,7 @@ class Portfolios(BaseService):
         """
         validate_portfolios_for_create(portfolios)
 
-        response = await self._request("POST", "/v2/portfolios", json_data=portfolios)
-        return response.json()
+        return await self._write_chunked("POST", "/v2/portfolios", portfolios)
 
     async def edit(self, portfolios: builtins.list[dict]) -> builtins.list[Portfolio]:
         """Edit portfolios.
@@ -76,8 +132,7 @@ class Portfolios(BaseService):
         """
         validate_portfolios_for_update(portfolios)
 
-        response = await self._request("PUT", "/v2/portfolios", json_data=portfolios)
-        return response.json()
+        return await self._write_chunked("PUT", "/v2/portfolios", portfolios)
 
     async def delete(self, portfolio_id: str) -> dict:
         """Delete a portfolio.
@@ -92,3 +147,19 @@ class Portfolios(BaseService):
 
         response = await self._request("DELETE", f"/v2/portfolios/{portfolio_id}")
         return response.json()
+
+    async def delete_many(
+        self, ids: Iterable[str | int], max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT
+    ) -> dict[str, dict]:
+        """Delete many portfolios with concurrent single-ID requests.
+
+        Portfolios have neither a bulk delete endpoint nor an archived state.
+
+        Args:
+            ids: Portfolio identifiers
+            max_in_flight: Maximum delete requests at once
+
+        Returns:
+            Mapping of each requested ID to its deletion response or failure result
+        """
+        return await self._delete_each(ids, self.delete, max_in_flight)
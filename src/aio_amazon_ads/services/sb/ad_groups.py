@@ -1,10 +1,12 @@
 """Sponsored Brands ad groups service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import DEFAULT_SHARD_CONCURRENCY, BaseService
+from ...pagination import Cursor, Page
+from ...upsert import AD_GROUP_KEY
 from ...validation import (
     validate_ad_group_id,
     validate_ad_groups_for_create,
@@ -15,25 +17,58 @@ from ...validation import (
 class AdGroups(BaseService):
     """Sponsored Brands ad groups API service."""
 
-    async def list(self, **filters: Any) -> AsyncGenerator[dict, None]:
+    id_key = "adGroupId"
+    campaign_filter = "campaignIdFilter"
+    natural_key = AD_GROUP_KEY
+
+    async def list(
+        self, *, resume_from: Cursor | None = None, **filters: Any
+    ) -> AsyncGenerator[dict, None]:
         """List Sponsored Brands ad groups with auto-pagination.
 
         Args:
             **filters: Optional query parameters (campaignIdFilter, adGroupIdFilter, etc.)
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Yields:
             Ad group dictionaries
         """
-        params = filters.copy() if filters else {}
-        while True:
-            response = await self._request("GET", "/v2/sb/adGroups", params=params)
-            data = response.json()
-            for ad_group in data.get("adGroups", []):
+        async for page in self.list_pages(resume_from=resume_from, **filters):
+            for ad_group in page.items:
                 yield ad_group
-            next_token = data.get("nextToken")
-            if not next_token:
-                break
-            params["nextToken"] = next_token
+
+    async def list_pages(
+        self, *, resume_from: Cursor | None = None, **filters: Any
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Brands ad groups page by page.
+
+        Args:
+            **filters: Optional query parameters (campaignIdFilter, adGroupIdFilter, etc.)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of ad group dictionaries with page metadata
+        """
+        async for page in self._paginate("/v2/sb/adGroups", "adGroups", filters, resume_from):
+            yield page
+
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Brands ad groups across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"campaignIdFilter": "1,2,3"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Ad group dictionaries, deduplicated by adGroupId
+        """
+        async for ad_group in self._list_sharded(self.list_pages, shards, "adGroupId", concurrency):
+            yield ad_group
 
     async def get(self, ad_group_id: str) -> dict:
         """Get a specific Sponsored Brands ad group.
@@ -45,10 +80,28 @@ class AdGroups(BaseService):
             Ad group dictionary
         """
         validate_ad_group_id(ad_group_id)
+        if self._get_batcher is not None:
+            return await self._get_batcher.load(ad_group_id)
 
         response = await self._request("GET", f"/v2/sb/adGroups/{ad_group_id}")
         return response.json()
 
+    async def get_many(self, ad_group_ids: Iterable[str]) -> dict[str, dict | None]:
+        """Get many Sponsored Brands ad groups with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            ad_group_ids: Ad group identifiers
+
+        Returns:
+            Mapping of each requested ID to its ad group, or None if not found
+        """
+        return await self._get_many(
+            ad_group_ids, lambda ids: self.list_pages(adGroupIdFilter=ids), "adGroupId"
+        )
+
     async def create(self, ad_groups: builtins.list[dict]) -> builtins.list[dict]:
         """Create Sponsored Brands ad groups.
 
@@ -60,8 +113,7 @@ class AdGroups(BaseService):
         """
         validate_ad_groups_for_create(ad_groups)
 
-        response = await self._request("POST", "/v2/sb/adGroups", json_data=ad_groups)
-        return response.json()
+        return await self._write_chunked("POST", "/v2/sb/adGroups", ad_groups)
 
     async def edit(self, ad_groups: builtins.list[dict]) -> builtins.list[dict]:
         """Edit Sponsored Brands ad groups.
@@ -74,5 +126,4 @@ class AdGroups(BaseService):
         """
         validate_ad_groups_for_update(ad_groups)
 
-        response = await self._request("PUT", "/v2/sb/adGroups", json_data=ad_groups)
-        return response.json()
+        return await self._write_chunked("PUT", "/v2/sb/adGroups", ad_groups)
@@ -1,10 +1,11 @@
 """Sponsored Brands ads service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import DEFAULT_SHARD_CONCURRENCY, BaseService
+from ...pagination import Cursor, Page
 from ...validation import (
     validate_ad_id,
     validate_product_ads_for_create,
@@ -15,25 +16,57 @@ from ...validation import (
 class Ads(BaseService):
     """Sponsored Brands ad management."""
 
-    async def list(self, **filters: Any) -> AsyncGenerator[dict, None]:
+    id_key = "adId"
+    campaign_filter = "campaignIdFilter"
+
+    async def list(
+        self, *, resume_from: Cursor | None = None, **filters: Any
+    ) -> AsyncGenerator[dict, None]:
         """List Sponsored Brands ads with auto-pagination.
 
         Args:
             **filters: Optional query parameters (campaignIdFilter, adIdFilter, etc.)
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Yields:
             Ad dictionaries
         """
-        params = filters.copy() if filters else {}
-        while True:
-            response = await self._request("GET", "/v2/sb/ads", params=params)
-            data = response.json()
-            for ad in data.get("ads", []):
+        async for page in self.list_pages(resume_from=resume_from, **filters):
+            for ad in page.items:
                 yield ad
-            next_token = data.get("nextToken")
-            if not next_token:
-                break
-            params["nextToken"] = next_token
+
+    async def list_pages(
+        self, *, resume_from: Cursor | None = None, **filters: Any
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Brands ads page by page.
+
+        Args:
+            **filters: Optional query parameters (campaignIdFilter, adIdFilter, etc.)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of ad dictionaries with page metadata
+        """
+        async for page in self._paginate("/v2/sb/ads", "ads", filters, resume_from):
+            yield page
+
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Brands ads across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"campaignIdFilter": "1,2,3"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Ad dictionaries, deduplicated by adId
+        """
+        async for ad in self._list_sharded(self.list_pages, shards, "adId", concurrency):
+            yield ad
 
     async def get(self, ad_id: str) -> dict:
         """Get a specific Sponsored Brands ad.
@@ -45,10 +78,26 @@ class Ads(BaseService):
             Ad dictionary
         """
         validate_ad_id(ad_id)
+        if self._get_batcher is not None:
+            return await self._get_batcher.load(ad_id)
 
         response = await self._request("GET", f"/v2/sb/ads/{ad_id}")
         return response.json()
 
+    async def get_many(self, ad_ids: Iterable[str]) -> dict[str, dict | None]:
+        """Get many Sponsored Brands ads with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            ad_ids: Ad identifiers
+
+        Returns:
+            Mapping of each requested ID to its ad, or None if not found
+        """
+        return await self._get_many(ad_ids, lambda ids: self.list_pages(adIdFilter=ids), "adId")
+
     async def create(self, ads: builtins.list[dict]) -> builtins.list[dict]:
         """Create Sponsored Brands ads.
 
@@ -60,8 +109,7 @@ class Ads(BaseService):
         """
         validate_product_ads_for_create(ads)
 
-        response = await self._request("POST", "/v2/sb/ads", json_data=ads)
-        return response.json()
+        return await self._write_chunked("POST", "/v2/sb/ads", ads)
 
     async def edit(self, ads: builtins.list[dict]) -> builtins.list[dict]:
         """Edit Sponsored Brands ads.
@@ -74,5 +122,4 @@ class Ads(BaseService):
         """
         validate_product_ads_for_update(ads)
 
-        response = await self._request("PUT", "/v2/sb/ads", json_data=ads)
-        return response.json()
+        return await self._write_chunked("PUT", "/v2/sb/ads", ads)
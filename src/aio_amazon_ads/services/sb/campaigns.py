@@ -1,10 +1,12 @@
 """Sponsored Brands campaigns service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import DEFAULT_SHARD_CONCURRENCY, BaseService
+from ...pagination import Cursor, Page
+from ...upsert import CAMPAIGN_KEY
 from ...validation import (
     validate_campaign_id,
     validate_campaigns_for_create,
@@ -15,31 +17,60 @@ from ...validation import (
 class Campaigns(BaseService):
     """Sponsored Brands campaign management."""
 
-    async def list(self, **filters: Any) -> AsyncGenerator[dict, None]:
+    id_key = "campaignId"
+    campaign_filter = "campaignIdFilter"
+    natural_key = CAMPAIGN_KEY
+
+    async def list(
+        self, *, resume_from: Cursor | None = None, **filters: Any
+    ) -> AsyncGenerator[dict, None]:
         """List Sponsored Brands campaigns with auto-pagination.
 
         Args:
             **filters: Optional query parameters (stateFilter, campaignIdFilter, etc.)
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Yields:
             Campaign dictionaries
         """
-        params = filters.copy() if filters else {}
-        while True:
-            response = await self._request("GET", "/v2/sb/campaigns", params=params)
-            data = response.json()
+        async for page in self.list_pages(resume_from=resume_from, **filters):
+            for campaign in page.items:
+                yield campaign
 
-            if isinstance(data, list):
-                for campaign in data:
-                    yield campaign
-                break
+    async def list_pages(
+        self, *, resume_from: Cursor | None = None, **filters: Any
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Brands campaigns page by page.
 
-            for campaign in data.get("campaigns", []):
-                yield campaign
-            next_token = data.get("nextToken")
-            if not next_token:
-                break
-            params["nextToken"] = next_token
+        Args:
+            **filters: Optional query parameters (stateFilter, campaignIdFilter, etc.)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of campaign dictionaries with page metadata
+        """
+        async for page in self._paginate("/v2/sb/campaigns", "campaigns", filters, resume_from):
+            yield page
+
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Brands campaigns across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"stateFilter": "paused"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Campaign dictionaries, deduplicated by campaignId
+        """
+        async for campaign in self._list_sharded(
+            self.list_pages, shards, "campaignId", concurrency
+        ):
+            yield campaign
 
     async def get(self, campaign_id: str) -> dict:
         """Get a specific Sponsored Brands campaign.
@@ -51,10 +82,28 @@ class Campaigns(BaseService):
             Campaign dictionary
         """
         validate_campaign_id(campaign_id)
+        if self._get_batcher is not None:
+            return await self._get_batcher.load(campaign_id)
 
         response = await self._request("GET", f"/v2/sb/campaigns/{campaign_id}")
         return response.json()
 
+    async def get_many(self, campaign_ids: Iterable[str]) -> dict[str, dict | None]:
+        """Get many Sponsored Brands campaigns with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            campaign_ids: Campaign identifiers
+
+        Returns:
+            Mapping of each requested ID to its campaign, or None if not found
+        """
+        return await self._get_many(
+            campaign_ids, lambda ids: self.list_pages(campaignIdFilter=ids), "campaignId"
+        )
+
     async def create(self, campaigns: builtins.list[dict]) -> builtins.list[dict]:
         """Create Sponsored Brands campaigns.
 
@@ -66,8 +115,7 @@ class Campaigns(BaseService):
         """
         validate_campaigns_for_create(campaigns)
 
-        response = await self._request("POST", "/v2/sb/campaigns", json_data=campaigns)
-        return response.json()
+        return await self._write_chunked("POST", "/v2/sb/campaigns", campaigns)
 
     async def edit(self, campaigns: builtins.list[dict]) -> builtins.list[dict]:
         """Edit Sponsored Brands campaigns.
@@ -80,8 +128,7 @@ class Campaigns(BaseService):
         """
         validate_campaigns_for_update(campaigns)
 
-        response = await self._request("PUT", "/v2/sb/campaigns", json_data=campaigns)
-        return response.json()
+        return await self._write_chunked("PUT", "/v2/sb/campaigns", campaigns)
 
     async def delete(self, campaign_id: str) -> dict:
         """Delete a Sponsored Brands campaign.
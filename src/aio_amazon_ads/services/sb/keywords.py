@@ -1,10 +1,12 @@
 """Sponsored Brands keywords service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import DEFAULT_SHARD_CONCURRENCY, BaseService
+from ...pagination import Cursor, Page
+from ...upsert import KEYWORD_KEY
 from ...validation import (
     validate_keyword_id,
     validate_keywords_for_create,
@@ -15,25 +17,58 @@ from ...validation import (
 class Keywords(BaseService):
     """Sponsored Brands keyword management."""
 
-    async def list(self, **filters: Any) -> AsyncGenerator[dict, None]:
+    id_key = "keywordId"
+    campaign_filter = "campaignIdFilter"
+    natural_key = KEYWORD_KEY
+
+    async def list(
+        self, *, resume_from: Cursor | None = None, **filters: Any
+    ) -> AsyncGenerator[dict, None]:
         """List Sponsored Brands keywords with auto-pagination.
 
         Args:
             **filters: Optional query parameters (campaignIdFilter, adGroupIdFilter, etc.)
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Yields:
             Keyword dictionaries
         """
-        params = filters.copy() if filters else {}
-        while True:
-            response = await self._request("GET", "/v2/sb/keywords", params=params)
-            data = response.json()
-            for keyword in data.get("keywords", []):
+        async for page in self.list_pages(resume_from=resume_from, **filters):
+            for keyword in page.items:
                 yield keyword
-            next_token = data.get("nextToken")
-            if not next_token:
-                break
-            params["nextToken"] = next_token
+
+    async def list_pages(
+        self, *, resume_from: Cursor | None = None, **filters: Any
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Brands keywords page by page.
+
+        Args:
+            **filters: Optional query parameters (campaignIdFilter, adGroupIdFilter, etc.)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of keyword dictionaries with page metadata
+        """
+        async for page in self._paginate("/v2/sb/keywords", "keywords", filters, resume_from):
+            yield page
+
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Brands keywords across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"campaignIdFilter": "1,2,3"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Keyword dictionaries, deduplicated by keywordId
+        """
+        async for keyword in self._list_sharded(self.list_pages, shards, "keywordId", concurrency):
+            yield keyword
 
     async def get(self, keyword_id: str) -> dict:
         """Get a specific Sponsored Brands keyword.
@@ -45,10 +80,28 @@ class Keywords(BaseService):
             Keyword dictionary
         """
         validate_keyword_id(keyword_id)
+        if self._get_batcher is not None:
+            return await self._get_batcher.load(keyword_id)
 
         response = await self._request("GET", f"/v2/sb/keywords/{keyword_id}")
         return response.json()
 
+    async def get_many(self, keyword_ids: Iterable[str]) -> dict[str, dict | None]:
+        """Get many Sponsored Brands keywords with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            keyword_ids: Keyword identifiers
+
+        Returns:
+            Mapping of each requested ID to its keyword, or None if not found
+        """
+        return await self._get_many(
+            keyword_ids, lambda ids: self.list_pages(keywordIdFilter=ids), "keywordId"
+        )
+
     async def create(self, keywords: builtins.list[dict]) -> builtins.list[dict]:
         """Create Sponsored Brands keywords.
 
@@ -60,8 +113,7 @@ class Keywords(BaseService):
         """
         validate_keywords_for_create(keywords)
 
-        response = await self._request("POST", "/v2/sb/keywords", json_data=keywords)
-        return response.json()
+        return await self._write_chunked("POST", "/v2/sb/keywords", keywords)
 
     async def edit(self, keywords: builtins.list[dict]) -> builtins.list[dict]:
         """Edit Sponsored Brands keywords.
@@ -74,5 +126,4 @@ class Keywords(BaseService):
         """
         validate_keywords_for_update(keywords)
 
-        response = await self._request("PUT", "/v2/sb/keywords", json_data=keywords)
-        return response.json()
+        return await self._write_chunked("PUT", "/v2/sb/keywords", keywords)
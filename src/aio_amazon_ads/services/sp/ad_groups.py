@@ -1,50 +1,193 @@
 """Sponsored Products ad groups service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import (
+    DEFAULT_INDEX_PAGE_SIZE,
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_STREAM_IN_FLIGHT,
+    DEFAULT_V3_MAX_RESULTS,
+    BaseService,
+    v3_list_body,
+)
+from ...pagination import Cursor, Page
+from ...upsert import SP_AD_GROUP_KEY
 from ...validation import (
     validate_ad_group_id,
     validate_ad_groups_for_create,
     validate_ad_groups_for_update,
 )
 
+MEDIA_TYPE_V3 = "application/vnd.spAdGroup.v3+json"
+
 
 class AdGroups(BaseService):
     """Sponsored Products ad groups API service."""
 
+    id_key = "adGroupId"
+    campaign_filter = "campaign_id_filter"
+    natural_key = SP_AD_GROUP_KEY
+
     async def list(
         self,
         campaign_id_filter: str | None = None,
         ad_group_id_filter: str | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
         """List ad groups with optional filters.
 
         Args:
             campaign_id_filter: Filter by campaign ID
             ad_group_id_filter: Filter by ad group ID
+            page_size: Items requested per page (startIndex/count paging)
+            total: Known or estimated number of items; pages up to it are fetched
+                concurrently
+            concurrency: Maximum number of pages requested at once
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Yields:
             Ad group dictionaries
         """
-        if not campaign_id_filter and not ad_group_id_filter:
-            response = await self._request("GET", "/sp/adGroups")
-            for item in response.json():
+        async for page in self.list_pages(
+            campaign_id_filter,
+            ad_group_id_filter,
+            page_size,
+            total,
+            concurrency,
+            extended=extended,
+            resume_from=resume_from,
+        ):
+            for item in page.items:
                 yield item
-            return
 
-        params: dict[str, str] = {}
+    async def list_pages(
+        self,
+        campaign_id_filter: str | None = None,
+        ad_group_id_filter: str | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List ad groups page by page.
+
+        Args:
+            campaign_id_filter: Filter by campaign ID
+            ad_group_id_filter: Filter by ad group ID
+            page_size: Items requested per page (startIndex/count paging)
+            total: Known or estimated number of items; pages up to it are fetched
+                concurrently
+            concurrency: Maximum number of pages requested at once
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of ad group dictionaries with page metadata
+        """
+        params: dict[str, Any] = {}
         if campaign_id_filter:
             params["campaignIdFilter"] = campaign_id_filter
         if ad_group_id_filter:
             params["adGroupIdFilter"] = ad_group_id_filter
 
-        response = await self._request("GET", "/sp/adGroups", params=params)
-        for item in response.json():
+        path = "/v2/sp/adGroups/extended" if extended else "/sp/adGroups"
+        async for page in self._paginate_index(
+            path, params, page_size, total, concurrency, resume_from
+        ):
+            yield page
+
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """List ad groups across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"campaign_id_filter": "1,2,3"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Ad group dictionaries, deduplicated by adGroupId
+        """
+        async for item in self._list_sharded(self.list_pages, shards, "adGroupId", concurrency):
             yield item
 
+    async def list_v3(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        ad_group_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """List ad groups via the v3 POST list endpoint.
+
+        Every filter takes many values at once (an iterable or a comma-separated
+        string), and each page holds up to ``max_results`` items.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            ad_group_id_filter: Ad group IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Ad group dictionaries in v3 format
+        """
+        async for page in self.list_v3_pages(
+            state_filter,
+            campaign_id_filter,
+            ad_group_id_filter,
+            max_results,
+            resume_from=resume_from,
+        ):
+            for item in page.items:
+                yield item
+
+    async def list_v3_pages(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        ad_group_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List ad groups page by page via the v3 POST list endpoint.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            ad_group_id_filter: Ad group IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of v3 ad group dictionaries with page metadata
+        """
+        body = v3_list_body(
+            max_results,
+            stateFilter=state_filter,
+            campaignIdFilter=campaign_id_filter,
+            adGroupIdFilter=ad_group_id_filter,
+        )
+        async for page in self._paginate(
+            "/sp/adGroups/list", "adGroups", body, resume_from, MEDIA_TYPE_V3
+        ):
+            yield page
+
     async def get(self, ad_group_id: str) -> dict[str, Any]:
         """Get a single ad group by ID.
 
@@ -55,10 +198,28 @@ class AdGroups(BaseService):
             Ad group object
         """
         validate_ad_group_id(ad_group_id)
+        if self._get_batcher is not None:
+            return await self._get_batcher.load(ad_group_id)
 
         response = await self._request("GET", f"/sp/adGroups/{ad_group_id}")
         return response.json()
 
+    async def get_many(self, ad_group_ids: Iterable[str]) -> dict[str, dict[str, Any] | None]:
+        """Get many ad groups with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            ad_group_ids: Ad group identifiers
+
+        Returns:
+            Mapping of each requested ID to its ad group, or None if not found
+        """
+        return await self._get_many(
+            ad_group_ids, lambda ids: self.list_pages(ad_group_id_filter=ids), "adGroupId"
+        )
+
     async def create(
         self, ad_groups: builtins.list[dict[str, Any]]
     ) -> builtins.list[dict[str, Any]]:
@@ -72,8 +233,7 @@ class AdGroups(BaseService):
         """
         validate_ad_groups_for_create(ad_groups)
 
-        response = await self._request("POST", "/sp/adGroups", json_data=ad_groups)
-        return response.json()
+        return await self._write_chunked("POST", "/sp/adGroups", ad_groups)
 
     async def edit(self, ad_groups: builtins.list[dict[str, Any]]) -> builtins.list[dict[str, Any]]:
         """Update existing ad groups.
@@ -86,8 +246,7 @@ class AdGroups(BaseService):
         """
         validate_ad_groups_for_update(ad_groups)
 
-        response = await self._request("PUT", "/sp/adGroups", json_data=ad_groups)
-        return response.json()
+        return await self._write_chunked("PUT", "/sp/adGroups", ad_groups)
 
     async def delete(self, ad_group_id: str) -> dict[str, Any]:
         """Delete an ad group.
@@ -102,3 +261,21 @@ class AdGroups(BaseService):
 
         response = await self._request("DELETE", f"/sp/adGroups/{ad_group_id}")
         return response.json()
+
+    async def delete_many(
+        self, ids: Iterable[str | int], max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT
+    ) -> dict[str, dict]:
+        """Delete many Sponsored Products ad groups with the v3 bulk delete endpoint.
+
+        IDs are sent in chunks of up to 1000, several chunks at once.
+
+        Args:
+            ids: Ad group identifiers
+            max_in_flight: Maximum chunks being deleted at once
+
+        Returns:
+            Mapping of each requested ID to its result, e.g. {"code": "SUCCESS", ...}
+        """
+        return await self._delete_many_v3(
+            ids, "/sp/adGroups/delete", "adGroupIdFilter", "adGroups", MEDIA_TYPE_V3, max_in_flight
+        )
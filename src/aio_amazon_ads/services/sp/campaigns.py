@@ -1,10 +1,18 @@
 """Sponsored Products campaigns service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import (
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_STREAM_IN_FLIGHT,
+    DEFAULT_V3_MAX_RESULTS,
+    BaseService,
+    v3_list_body,
+)
+from ...pagination import Cursor, Page
+from ...upsert import CAMPAIGN_KEY
 from ...validation import (
     validate_campaign_id,
     validate_campaign_state,
@@ -12,24 +20,60 @@ from ...validation import (
     validate_campaigns_for_update,
 )
 
+MEDIA_TYPE_V3 = "application/vnd.spCampaign.v3+json"
+
 
 class Campaigns(BaseService):
     """Sponsored Products campaign management."""
 
+    id_key = "campaignId"
+    campaign_filter = "campaign_id_filter"
+    natural_key = CAMPAIGN_KEY
+
     async def list(
         self,
         state_filter: str | None = None,
         campaign_id_filter: str | None = None,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
     ) -> AsyncGenerator[dict, None]:
         """List Sponsored Products campaigns with auto-pagination.
 
         Args:
             state_filter: Filter by campaign state (ENABLED, PAUSED, ARCHIVED)
             campaign_id_filter: Filter by specific campaign ID
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Yields:
             Campaign dictionaries
         """
+        async for page in self.list_pages(
+            state_filter, campaign_id_filter, extended=extended, resume_from=resume_from
+        ):
+            for campaign in page.items:
+                yield campaign
+
+    async def list_pages(
+        self,
+        state_filter: str | None = None,
+        campaign_id_filter: str | None = None,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Products campaigns page by page.
+
+        Args:
+            state_filter: Filter by campaign state (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Filter by specific campaign ID
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of campaign dictionaries with page metadata
+        """
         validate_campaign_state(state_filter)
 
         params: dict[str, Any] = {}
@@ -38,23 +82,102 @@ class Campaigns(BaseService):
         if campaign_id_filter is not None:
             params["campaignIdFilter"] = campaign_id_filter
 
-        while True:
-            response = await self._request("GET", "/v2/sp/campaigns", params=params)
-            data = response.json()
+        path = "/v2/sp/campaigns/extended" if extended else "/v2/sp/campaigns"
+        async for page in self._paginate(path, "campaigns", params, resume_from):
+            yield page
+
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Products campaigns across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"state_filter": "PAUSED"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Campaign dictionaries, deduplicated by campaignId
+        """
+        async for campaign in self._list_sharded(
+            self.list_pages, shards, "campaignId", concurrency
+        ):
+            yield campaign
+
+    async def list_v3(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        portfolio_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Products campaigns via the v3 POST list endpoint.
+
+        Every filter takes many values at once (an iterable or a comma-separated
+        string), and each page holds up to ``max_results`` items.
 
-            if isinstance(data, list):
-                campaigns = data
-                next_token = None
-            else:
-                campaigns = data.get("campaigns", [])
-                next_token = data.get("nextToken")
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            portfolio_id_filter: Portfolio IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
-            for campaign in campaigns:
+        Yields:
+            Campaign dictionaries in v3 format
+        """
+        async for page in self.list_v3_pages(
+            state_filter,
+            campaign_id_filter,
+            portfolio_id_filter,
+            max_results,
+            resume_from=resume_from,
+        ):
+            for campaign in page.items:
                 yield campaign
 
-            if not next_token:
-                break
-            params["nextToken"] = next_token
+    async def list_v3_pages(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        portfolio_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Products campaigns page by page via the v3 POST list endpoint.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            portfolio_id_filter: Portfolio IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of v3 campaign dictionaries with page metadata
+        """
+        if state_filter is not None:
+            # A generator would be used up by validation before the body is built
+            states = (
+                state_filter.split(",") if isinstance(state_filter, str) else list(state_filter)
+            )
+            for state in states:
+                validate_campaign_state(state)
+            state_filter = states
+
+        body = v3_list_body(
+            max_results,
+            stateFilter=state_filter,
+            campaignIdFilter=campaign_id_filter,
+            portfolioIdFilter=portfolio_id_filter,
+        )
+        async for page in self._paginate(
+            "/sp/campaigns/list", "campaigns", body, resume_from, MEDIA_TYPE_V3
+        ):
+            yield page
 
     async def get(self, campaign_id: str) -> dict:
         """Get a specific Sponsored Products campaign.
@@ -66,10 +189,28 @@ class Campaigns(BaseService):
             Campaign dictionary
         """
         validate_campaign_id(campaign_id)
+        if self._get_batcher is not None:
+            return await self._get_batcher.load(campaign_id)
 
         response = await self._request("GET", f"/v2/sp/campaigns/{campaign_id}")
         return response.json()
 
+    async def get_many(self, campaign_ids: Iterable[str]) -> dict[str, dict | None]:
+        """Get many Sponsored Products campaigns with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            campaign_ids: Campaign identifiers
+
+        Returns:
+            Mapping of each requested ID to its campaign, or None if not found
+        """
+        return await self._get_many(
+            campaign_ids, lambda ids: self.list_pages(campaign_id_filter=ids), "campaignId"
+        )
+
     async def create(self, campaigns: builtins.list[dict]) -> builtins.list[dict]:
         """Create Sponsored Products campaigns.
 
@@ -81,8 +222,7 @@ class Campaigns(BaseService):
         """
         validate_campaigns_for_create(campaigns)
 
-        response = await self._request("POST", "/v2/sp/campaigns", json_data=campaigns)
-        return response.json()
+        return await self._write_chunked("POST", "/v2/sp/campaigns", campaigns)
 
     async def edit(self, campaigns: builtins.list[dict]) -> builtins.list[dict]:
         """Edit Sponsored Products campaigns.
@@ -95,8 +235,7 @@ class Campaigns(BaseService):
         """
         validate_campaigns_for_update(campaigns)
 
-        response = await self._request("PUT", "/v2/sp/campaigns", json_data=campaigns)
-        return response.json()
+        return await self._write_chunked("PUT", "/v2/sp/campaigns", campaigns)
 
     async def delete(self, campaign_id: str) -> dict:
         """Delete a Sponsored Products campaign.
@@ -111,3 +250,26 @@ class Campaigns(BaseService):
 
         response = await self._request("DELETE", f"/v2/sp/campaigns/{campaign_id}")
         return response.json()
+
+    async def delete_many(
+        self, ids: Iterable[str | int], max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT
+    ) -> dict[str, dict]:
+        """Delete many Sponsored Products campaigns with the v3 bulk delete endpoint.
+
+        IDs are sent in chunks of up to 1000, several chunks at once.
+
+        Args:
+            ids: Campaign identifiers
+            max_in_flight: Maximum chunks being deleted at once
+
+        Returns:
+            Mapping of each requested ID to its result, e.g. {"code": "SUCCESS", ...}
+        """
+        return await self._delete_many_v3(
+            ids,
+            "/sp/campaigns/delete",
+            "campaignIdFilter",
+            "campaigns",
+            MEDIA_TYPE_V3,
+            max_in_flight,
+        )
@@ -1,25 +1,46 @@
 """Sponsored Products keywords service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import (
+    DEFAULT_INDEX_PAGE_SIZE,
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_STREAM_IN_FLIGHT,
+    DEFAULT_V3_MAX_RESULTS,
+    BaseService,
+    v3_list_body,
+)
+from ...pagination import Cursor, Page
+from ...upsert import SP_KEYWORD_KEY
 from ...validation import (
     validate_keyword_id,
     validate_keywords_for_create,
     validate_keywords_for_update,
 )
 
+MEDIA_TYPE_V3 = "application/vnd.spKeyword.v3+json"
+
 
 class Keywords(BaseService):
     """Sponsored Products keyword management."""
 
+    id_key = "keywordId"
+    campaign_filter = "campaign_id_filter"
+    natural_key = SP_KEYWORD_KEY
+    write_chunk_size = 1000
+
     async def list(
         self,
         campaign_id_filter: str | None = None,
         ad_group_id_filter: str | None = None,
         keyword_id_filter: str | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
     ) -> AsyncGenerator[dict, None]:
         """List Sponsored Products keywords.
 
@@ -27,10 +48,58 @@ class Keywords(BaseService):
             campaign_id_filter: Filter by campaign ID
             ad_group_id_filter: Filter by ad group ID
             keyword_id_filter: Filter by keyword ID
+            page_size: Items requested per page (startIndex/count paging)
+            total: Known or estimated number of items; pages up to it are fetched
+                concurrently
+            concurrency: Maximum number of pages requested at once
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Returns:
             Async generator yielding keyword dictionaries
         """
+        async for page in self.list_pages(
+            campaign_id_filter,
+            ad_group_id_filter,
+            keyword_id_filter,
+            page_size,
+            total,
+            concurrency,
+            extended=extended,
+            resume_from=resume_from,
+        ):
+            for keyword in page.items:
+                yield keyword
+
+    async def list_pages(
+        self,
+        campaign_id_filter: str | None = None,
+        ad_group_id_filter: str | None = None,
+        keyword_id_filter: str | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Products keywords page by page.
+
+        Args:
+            campaign_id_filter: Filter by campaign ID
+            ad_group_id_filter: Filter by ad group ID
+            keyword_id_filter: Filter by keyword ID
+            page_size: Items requested per page (startIndex/count paging)
+            total: Known or estimated number of items; pages up to it are fetched
+                concurrently
+            concurrency: Maximum number of pages requested at once
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of keyword dictionaries with page metadata
+        """
         params: dict[str, Any] = {}
         if campaign_id_filter is not None:
             params["campaignIdFilter"] = campaign_id_filter
@@ -39,10 +108,100 @@ class Keywords(BaseService):
         if keyword_id_filter is not None:
             params["keywordIdFilter"] = keyword_id_filter
 
-        response = await self._request("GET", "/v2/sp/keywords", params=params)
-        for keyword in response.json():
+        path = "/v2/sp/keywords/extended" if extended else "/v2/sp/keywords"
+        async for page in self._paginate_index(
+            path, params, page_size, total, concurrency, resume_from
+        ):
+            yield page
+
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Products keywords across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"ad_group_id_filter": "1,2,3"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Keyword dictionaries, deduplicated by keywordId
+        """
+        async for keyword in self._list_sharded(self.list_pages, shards, "keywordId", concurrency):
             yield keyword
 
+    async def list_v3(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        ad_group_id_filter: str | Iterable[str] | None = None,
+        keyword_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Products keywords via the v3 POST list endpoint.
+
+        Every filter takes many values at once (an iterable or a comma-separated
+        string), and each page holds up to ``max_results`` items.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            ad_group_id_filter: Ad group IDs to include
+            keyword_id_filter: Keyword IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Keyword dictionaries in v3 format
+        """
+        async for page in self.list_v3_pages(
+            state_filter,
+            campaign_id_filter,
+            ad_group_id_filter,
+            keyword_id_filter,
+            max_results,
+            resume_from=resume_from,
+        ):
+            for keyword in page.items:
+                yield keyword
+
+    async def list_v3_pages(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        ad_group_id_filter: str | Iterable[str] | None = None,
+        keyword_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Products keywords page by page via the v3 POST list endpoint.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            ad_group_id_filter: Ad group IDs to include
+            keyword_id_filter: Keyword IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of v3 keyword dictionaries with page metadata
+        """
+        body = v3_list_body(
+            max_results,
+            stateFilter=state_filter,
+            campaignIdFilter=campaign_id_filter,
+            adGroupIdFilter=ad_group_id_filter,
+            keywordIdFilter=keyword_id_filter,
+        )
+        async for page in self._paginate(
+            "/sp/keywords/list", "keywords", body, resume_from, MEDIA_TYPE_V3
+        ):
+            yield page
+
     async def get(self, keyword_id: str) -> dict:
         """Get a specific Sponsored Products keyword.
 
@@ -53,10 +212,28 @@ class Keywords(BaseService):
             Keyword dictionary
         """
         validate_keyword_id(keyword_id)
+        if self._get_batcher is not None:
+            return await self._get_batcher.load(keyword_id)
 
         response = await self._request("GET", f"/v2/sp/keywords/{keyword_id}")
         return response.json()
 
+    async def get_many(self, keyword_ids: Iterable[str]) -> dict[str, dict | None]:
+        """Get many Sponsored Products keywords with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            keyword_ids: Keyword identifiers
+
+        Returns:
+            Mapping of each requested ID to its keyword, or None if not found
+        """
+        return await self._get_many(
+            keyword_ids, lambda ids: self.list_pages(keyword_id_filter=ids), "keywordId"
+        )
+
     async def create(self, keywords: builtins.list[dict]) -> builtins.list[dict]:
         """Create Sponsored Products keywords.
 
@@ -68,8 +245,7 @@ class Keywords(BaseService):
         """
         validate_keywords_for_create(keywords)
 
-        response = await self._request("POST", "/v2/sp/keywords", json_data=keywords)
-        return response.json()
+        return await self._write_chunked("POST", "/v2/sp/keywords", keywords)
 
     async def edit(self, keywords: builtins.list[dict]) -> builtins.list[dict]:
         """Edit Sponsored Products keywords.
@@ -82,8 +258,7 @@ class Keywords(BaseService):
         """
         validate_keywords_for_update(keywords)
 
-        response = await self._request("PUT", "/v2/sp/keywords", json_data=keywords)
-        return response.json()
+        return await self._write_chunked("PUT", "/v2/sp/keywords", keywords)
 
     async def delete(self, keyword_id: str) -> dict:
         """Delete a Sponsored Products keyword.
@@ -98,3 +273,21 @@ class Keywords(BaseService):
 
         response = await self._request("DELETE", f"/v2/sp/keywords/{keyword_id}")
         return response.json()
+
+    async def delete_many(
+        self, ids: Iterable[str | int], max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT
+    ) -> dict[str, dict]:
+        """Delete many Sponsored Products keywords with the v3 bulk delete endpoint.
+
+        IDs are sent in chunks of up to 1000, several chunks at once.
+
+        Args:
+            ids: Keyword identifiers
+            max_in_flight: Maximum chunks being deleted at once
+
+        Returns:
+            Mapping of each requested ID to its result, e.g. {"code": "SUCCESS", ...}
+        """
+        return await self._delete_many_v3(
+            ids, "/sp/keywords/delete", "keywordIdFilter", "keywords", MEDIA_TYPE_V3, max_in_flight
+        )
@@ -1,43 +1,221 @@
 """Sponsored Products negative keywords service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import (
+    DEFAULT_INDEX_PAGE_SIZE,
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_STREAM_IN_FLIGHT,
+    DEFAULT_V3_MAX_RESULTS,
+    BaseService,
+    v3_list_body,
+)
+from ...pagination import Cursor, Page
 from ...validation import (
     validate_negative_keywords_for_create,
     validate_negative_keywords_for_delete,
+    validate_negative_keywords_for_update,
 )
 
+MEDIA_TYPE_V3 = "application/vnd.spNegativeKeyword.v3+json"
+
 
 class NegativeKeywords(BaseService):
     """Sponsored Products negative keyword management."""
 
+    id_key = "keywordId"
+    campaign_filter = "campaign_id_filter"
+    write_chunk_size = 1000
+
     async def list(
         self,
         campaign_id_filter: str | None = None,
         ad_group_id_filter: str | None = None,
+        keyword_id_filter: str | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
     ) -> AsyncGenerator[dict, None]:
         """List Sponsored Products negative keywords.
 
         Args:
             campaign_id_filter: Filter by campaign ID
             ad_group_id_filter: Filter by ad group ID
+            keyword_id_filter: Filter by negative keyword ID
+            page_size: Items requested per page (startIndex/count paging)
+            total: Known or estimated number of items; pages up to it are fetched
+                concurrently
+            concurrency: Maximum number of pages requested at once
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Yields:
             Negative keyword dictionaries
         """
+        async for page in self.list_pages(
+            campaign_id_filter,
+            ad_group_id_filter,
+            keyword_id_filter,
+            page_size,
+            total,
+            concurrency,
+            extended=extended,
+            resume_from=resume_from,
+        ):
+            for item in page.items:
+                yield item
+
+    async def list_pages(
+        self,
+        campaign_id_filter: str | None = None,
+        ad_group_id_filter: str | None = None,
+        keyword_id_filter: str | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Products negative keywords page by page.
+
+        Args:
+            campaign_id_filter: Filter by campaign ID
+            ad_group_id_filter: Filter by ad group ID
+            keyword_id_filter: Filter by negative keyword ID
+            page_size: Items requested per page (startIndex/count paging)
+            total: Known or estimated number of items; pages up to it are fetched
+                concurrently
+            concurrency: Maximum number of pages requested at once
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of negative keyword dictionaries with page metadata
+        """
         params: dict[str, Any] = {}
         if campaign_id_filter is not None:
             params["campaignIdFilter"] = campaign_id_filter
         if ad_group_id_filter is not None:
             params["adGroupIdFilter"] = ad_group_id_filter
+        if keyword_id_filter is not None:
+            params["keywordIdFilter"] = keyword_id_filter
+
+        path = "/v2/sp/negativeKeywords/extended" if extended else "/v2/sp/negativeKeywords"
+        async for page in self._paginate_index(
+            path, params, page_size, total, concurrency, resume_from
+        ):
+            yield page
 
-        response = await self._request("GET", "/v2/sp/negativeKeywords", params=params)
-        for item in response.json():
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Products negative keywords across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"campaign_id_filter": "1,2,3"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Negative keyword dictionaries, deduplicated by keywordId
+        """
+        async for item in self._list_sharded(self.list_pages, shards, "keywordId", concurrency):
             yield item
 
+    async def list_v3(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        ad_group_id_filter: str | Iterable[str] | None = None,
+        negative_keyword_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Products negative keywords via the v3 POST list endpoint.
+
+        Every filter takes many values at once (an iterable or a comma-separated
+        string), and each page holds up to ``max_results`` items.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            ad_group_id_filter: Ad group IDs to include
+            negative_keyword_id_filter: Negative keyword IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Negative keyword dictionaries in v3 format
+        """
+        async for page in self.list_v3_pages(
+            state_filter,
+            campaign_id_filter,
+            ad_group_id_filter,
+            negative_keyword_id_filter,
+            max_results,
+            resume_from=resume_from,
+        ):
+            for item in page.items:
+                yield item
+
+    async def list_v3_pages(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        ad_group_id_filter: str | Iterable[str] | None = None,
+        negative_keyword_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Products negative keywords page by page via the v3 POST list endpoint.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            ad_group_id_filter: Ad group IDs to include
+            negative_keyword_id_filter: Negative keyword IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of v3 negative keyword dictionaries with page metadata
+        """
+        body = v3_list_body(
+            max_results,
+            stateFilter=state_filter,
+            campaignIdFilter=campaign_id_filter,
+            adGroupIdFilter=ad_group_id_filter,
+            negativeKeywordIdFilter=negative_keyword_id_filter,
+        )
+        async for page in self._paginate(
+            "/sp/negativeKeywords/list", "negativeKeywords", body, resume_from, MEDIA_TYPE_V3
+        ):
+            yield page
+
+    async def get_many(self, keyword_ids: Iterable[str]) -> dict[str, dict | None]:
+        """Get many Sponsored Products negative keywords with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            keyword_ids: Negative keyword identifiers
+
+        Returns:
+            Mapping of each requested ID to its negative keyword, or None if not found
+        """
+        return await self._get_many(
+            keyword_ids, lambda ids: self.list_pages(keyword_id_filter=ids), "keywordId"
+        )
+
     async def create(self, keywords: builtins.list[dict]) -> builtins.list[dict]:
         """Create Sponsored Products negative keywords.
 
@@ -49,8 +227,20 @@ class NegativeKeywords(BaseService):
         """
         validate_negative_keywords_for_create(keywords)
 
-        response = await self._request("POST", "/v2/sp/negativeKeywords", json_data=keywords)
-        return response.json()
+        return await self._write_chunked("POST", "/v2/sp/negativeKeywords", keywords)
+
+    async def edit(self, keywords: builtins.list[dict]) -> builtins.list[dict]:
+        """Edit Sponsored Products negative keywords.
+
+        Args:
+            keywords: List of negative keyword objects to update
+
+        Returns:
+            List of updated negative keyword dictionaries
+        """
+        validate_negative_keywords_for_update(keywords)
+
+        return await self._write_chunked("PUT", "/v2/sp/negativeKeywords", keywords)
 
     async def delete(self, keyword_id: str) -> dict:
         """Delete a Sponsored Products negative keyword.
@@ -65,3 +255,26 @@ class NegativeKeywords(BaseService):
 
         response = await self._request("DELETE", f"/v2/sp/negativeKeywords/{keyword_id}")
         return response.json()
+
+    async def delete_many(
+        self, ids: Iterable[str | int], max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT
+    ) -> dict[str, dict]:
+        """Delete many Sponsored Products negative keywords with the v3 bulk delete endpoint.
+
+        IDs are sent in chunks of up to 1000, several chunks at once.
+
+        Args:
+            ids: Negative keyword identifiers
+            max_in_flight: Maximum chunks being deleted at once
+
+        Returns:
+            Mapping of each requested ID to its result, e.g. {"code": "SUCCESS", ...}
+        """
+        return await self._delete_many_v3(
+            ids,
+            "/sp/negativeKeywords/delete",
+            "negativeKeywordIdFilter",
+            "negativeKeywords",
+            MEDIA_TYPE_V3,
+            max_in_flight,
+        )
@@ -1,25 +1,44 @@
 """Sponsored Products product ads service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import (
+    DEFAULT_INDEX_PAGE_SIZE,
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_STREAM_IN_FLIGHT,
+    DEFAULT_V3_MAX_RESULTS,
+    BaseService,
+    v3_list_body,
+)
+from ...pagination import Cursor, Page
 from ...validation import (
     validate_ad_id,
     validate_product_ads_for_create,
     validate_product_ads_for_update,
 )
 
+MEDIA_TYPE_V3 = "application/vnd.spProductAd.v3+json"
+
 
 class ProductAds(BaseService):
     """Sponsored Products product ad management."""
 
+    id_key = "adId"
+    campaign_filter = "campaign_id_filter"
+    write_chunk_size = 1000
+
     async def list(
         self,
         campaign_id_filter: str | None = None,
         ad_group_id_filter: str | None = None,
         ad_id_filter: str | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
     ) -> AsyncGenerator[dict, None]:
         """List Sponsored Products product ads.
 
@@ -27,10 +46,58 @@ class ProductAds(BaseService):
             campaign_id_filter: Filter by campaign ID
             ad_group_id_filter: Filter by ad group ID
             ad_id_filter: Filter by specific ad ID
+            page_size: Items requested per page (startIndex/count paging)
+            total: Known or estimated number of items; pages up to it are fetched
+                concurrently
+            concurrency: Maximum number of pages requested at once
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Yields:
             Product ad dictionaries
         """
+        async for page in self.list_pages(
+            campaign_id_filter,
+            ad_group_id_filter,
+            ad_id_filter,
+            page_size,
+            total,
+            concurrency,
+            extended=extended,
+            resume_from=resume_from,
+        ):
+            for item in page.items:
+                yield item
+
+    async def list_pages(
+        self,
+        campaign_id_filter: str | None = None,
+        ad_group_id_filter: str | None = None,
+        ad_id_filter: str | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Products product ads page by page.
+
+        Args:
+            campaign_id_filter: Filter by campaign ID
+            ad_group_id_filter: Filter by ad group ID
+            ad_id_filter: Filter by specific ad ID
+            page_size: Items requested per page (startIndex/count paging)
+            total: Known or estimated number of items; pages up to it are fetched
+                concurrently
+            concurrency: Maximum number of pages requested at once
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of product ad dictionaries with page metadata
+        """
         params: dict[str, Any] = {}
         if campaign_id_filter is not None:
             params["campaignIdFilter"] = campaign_id_filter
@@ -39,10 +106,100 @@ class ProductAds(BaseService):
         if ad_id_filter is not None:
             params["adIdFilter"] = ad_id_filter
 
-        response = await self._request("GET", "/v2/sp/productAds", params=params)
-        for item in response.json():
+        path = "/v2/sp/productAds/extended" if extended else "/v2/sp/productAds"
+        async for page in self._paginate_index(
+            path, params, page_size, total, concurrency, resume_from
+        ):
+            yield page
+
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Products product ads across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"ad_group_id_filter": "1,2,3"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Product ad dictionaries, deduplicated by adId
+        """
+        async for item in self._list_sharded(self.list_pages, shards, "adId", concurrency):
             yield item
 
+    async def list_v3(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        ad_group_id_filter: str | Iterable[str] | None = None,
+        ad_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Products product ads via the v3 POST list endpoint.
+
+        Every filter takes many values at once (an iterable or a comma-separated
+        string), and each page holds up to ``max_results`` items.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            ad_group_id_filter: Ad group IDs to include
+            ad_id_filter: Product ad IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Product ad dictionaries in v3 format
+        """
+        async for page in self.list_v3_pages(
+            state_filter,
+            campaign_id_filter,
+            ad_group_id_filter,
+            ad_id_filter,
+            max_results,
+            resume_from=resume_from,
+        ):
+            for item in page.items:
+                yield item
+
+    async def list_v3_pages(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        ad_group_id_filter: str | Iterable[str] | None = None,
+        ad_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Products product ads page by page via the v3 POST list endpoint.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            ad_group_id_filter: Ad group IDs to include
+            ad_id_filter: Product ad IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of v3 product ad dictionaries with page metadata
+        """
+        body = v3_list_body(
+            max_results,
+            stateFilter=state_filter,
+            campaignIdFilter=campaign_id_filter,
+            adGroupIdFilter=ad_group_id_filter,
+            adIdFilter=ad_id_filter,
+        )
+        async for page in self._paginate(
+            "/sp/productAds/list", "productAds", body, resume_from, MEDIA_TYPE_V3
+        ):
+            yield page
+
     async def get(self, ad_id: str) -> dict:
         """Get a specific Sponsored Products product ad.
 
@@ -53,10 +210,26 @@ class ProductAds(BaseService):
             Product ad dictionary
         """
         validate_ad_id(ad_id)
+        if self._get_batcher is not None:
+            return await self._get_batcher.load(ad_id)
 
         response = await self._request("GET", f"/v2/sp/productAds/{ad_id}")
         return response.json()
 
+    async def get_many(self, ad_ids: Iterable[str]) -> dict[str, dict | None]:
+        """Get many Sponsored Products product ads with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            ad_ids: Product ad identifiers
+
+        Returns:
+            Mapping of each requested ID to its product ad, or None if not found
+        """
+        return await self._get_many(ad_ids, lambda ids: self.list_pages(ad_id_filter=ids), "adId")
+
     async def create(self, ads: builtins.list[dict]) -> builtins.list[dict]:
         """Create Sponsored Products product ads.
 
@@ -68,8 +241,7 @@ class ProductAds(BaseService):
         """
         validate_product_ads_for_create(ads)
 
-        response = await self._request("POST", "/v2/sp/productAds", json_data=ads)
-        return response.json()
+        return await self._write_chunked("POST", "/v2/sp/productAds", ads)
 
     async def edit(self, ads: builtins.list[dict]) -> builtins.list[dict]:
         """Edit Sponsored Products product ads.
@@ -82,8 +254,7 @@ class ProductAds(BaseService):
         """
         validate_product_ads_for_update(ads)
 
-        response = await self._request("PUT", "/v2/sp/productAds", json_data=ads)
-        return response.json()
+        return await self._write_chunked("PUT", "/v2/sp/productAds", ads)
 
     async def delete(self, ad_id: str) -> dict:
         """Delete a Sponsored Products product ad.
@@ -98,3 +269,21 @@ class ProductAds(BaseService):
 
         response = await self._request("DELETE", f"/v2/sp/productAds/{ad_id}")
         return response.json()
+
+    async def delete_many(
+        self, ids: Iterable[str | int], max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT
+    ) -> dict[str, dict]:
+        """Delete many Sponsored Products product ads with the v3 bulk delete endpoint.
+
+        IDs are sent in chunks of up to 1000, several chunks at once.
+
+        Args:
+            ids: Product ad identifiers
+            max_in_flight: Maximum chunks being deleted at once
+
+        Returns:
+            Mapping of each requested ID to its result, e.g. {"code": "SUCCESS", ...}
+        """
+        return await self._delete_many_v3(
+            ids, "/sp/productAds/delete", "adIdFilter", "productAds", MEDIA_TYPE_V3, max_in_flight
+        )
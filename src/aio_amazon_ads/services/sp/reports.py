@@ -1,13 +1,57 @@
 """Sponsored Products reports service."""
 
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
 import httpx
 
 from ...base import BaseService
+from ...exceptions import ReportError, ReportTimeoutError
+from ...quota import QuotaStatus
+from ...report_tracker import DEFAULT_DOWNLOAD_WORKERS, DEFAULT_POLL_CONCURRENCY, ReportTracker
+from ...reporting import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_REPORT_DEADLINE,
+    REPORT_DOWNLOADED,
+    REPORT_FAILURE,
+    REPORT_IN_PROGRESS,
+    REPORT_SUCCESS,
+    ReportProgress,
+    ReportTimings,
+    decode_report,
+    next_poll_delay,
+    report_kind,
+    report_location,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class Reports(BaseService):
     """Sponsored Products report management."""
 
+    def __init__(
+        self,
+        request: Callable[..., Any],
+        quota_status: Callable[[], list[QuotaStatus]] | None = None,
+    ):
+        """Initialize reports service.
+
+        Args:
+            request: Request function of the client
+            quota_status: Returns the client's SP quota telemetry, pacing
+                ReportTracker polls
+        """
+        super().__init__(request)
+        self.timings = ReportTimings()
+        """Expected durations per report kind, tuning the poll schedule of run()"""
+        self.quota_status = quota_status
+        """Returns the client's SP quota telemetry, None when there is none"""
+
     async def create(self, report_date: str, metrics: list[str]) -> str:
         """Create a Sponsored Products report.
 
@@ -63,3 +107,146 @@ class Reports(BaseService):
             if response.status_code != 200:
                 raise Exception(f"Download failed: {response.status_code}")
             return response.content
+
+    async def download_report(self, location: str) -> bytes:
+        """Download a ready report from the location in its status.
+
+        The location is an Ads API endpoint, so it is requested with the
+        client's credentials and redirects to the pre-signed file URL.
+
+        Args:
+            location: ``location`` or ``fileUrl`` of the report status
+
+        Returns:
+            Report file content as bytes
+        """
+        if not location:
+            raise ValueError("location is required")
+
+        response = await self._request("GET", location, follow_redirects=True)
+        return response.content
+
+    async def run(
+        self,
+        report_date: str,
+        metrics: list[str],
+        deadline: float = DEFAULT_REPORT_DEADLINE,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        on_progress: Callable[[ReportProgress], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Create a report, wait until it is ready, then download and decode it.
+
+        Status polls follow the duration of earlier reports with the same
+        metrics, see ``timings`` and next_poll_delay().
+
+        Example:
+            rows = await client.sp.reports.run(
+                "20240601", ["impressions", "clicks", "cost"], deadline=600
+            )
+
+        Args:
+            report_date: Report date in YYYYMMDD format
+            metrics: List of metrics to include in report
+            deadline: Seconds the whole run may take
+            min_interval: Shortest delay between status polls
+            max_interval: Longest delay between status polls
+            on_progress: Called after creation, every poll and the download
+
+        Returns:
+            Report rows
+
+        Raises:
+            ReportError: If the report failed to generate
+            ReportTimeoutError: If the report was not downloaded within ``deadline``
+        """
+        kind = report_kind("sp", metrics)
+        expected = self.timings.expected(kind)
+        started = time.monotonic()
+        report_id = await self.create(report_date, metrics)
+        polls = 0
+        overdue_polls = 0
+
+        def emit(status: str, next_poll: float | None = None) -> None:
+            if on_progress is not None:
+                elapsed = time.monotonic() - started
+                on_progress(ReportProgress(report_id, status, polls, elapsed, next_poll))
+
+        while True:
+            elapsed = time.monotonic() - started
+            if elapsed >= deadline:
+                raise ReportTimeoutError(
+                    f"Report {report_id} not ready after {polls} polls in {elapsed:.0f}s",
+                    report_id,
+                )
+            delay = next_poll_delay(elapsed, expected, overdue_polls, min_interval, max_interval)
+            # The last poll happens at the deadline rather than after it
+            delay = min(delay, deadline - elapsed)
+            emit(REPORT_IN_PROGRESS, delay)
+            await asyncio.sleep(delay)
+
+            status = await self.get_status(report_id)
+            polls += 1
+            if time.monotonic() - started >= expected:
+                overdue_polls += 1
+            state = status.get("status")
+            if state == REPORT_SUCCESS:
+                break
+            if state == REPORT_FAILURE:
+                emit(REPORT_FAILURE)
+                details = status.get("statusDetails", "no details")
+                raise ReportError(f"Report {report_id} failed: {details}", report_id)
+
+        duration = time.monotonic() - started
+        self.timings.observe(kind, duration)
+        logger.debug(f"Report {report_id} ready after {duration:.1f}s and {polls} polls")
+        emit(REPORT_SUCCESS)
+
+        url = report_location(status)
+        if url is None:
+            raise ReportError(f"Report {report_id} is ready but has no location", report_id)
+        try:
+            content = await asyncio.wait_for(
+                self.download_report(url), max(0.0, deadline - (time.monotonic() - started))
+            )
+        except asyncio.TimeoutError as e:
+            raise ReportTimeoutError(
+                f"Report {report_id} download did not finish within the deadline", report_id
+            ) from e
+        rows = decode_report(content)
+        emit(REPORT_DOWNLOADED)
+        return rows
+
+    def tracker(
+        self,
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        poll_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+        max_polls_per_second: float | None = None,
+        deadline: float = DEFAULT_REPORT_DEADLINE,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        on_progress: Callable[[ReportProgress], None] | None = None,
+    ) -> ReportTracker:
+        """Create a tracker polling many pending reports from one scheduling loop.
+
+        The tracker shares ``timings`` with run(), see ReportTracker.
+
+        Args:
+            download_workers: Concurrent report downloads
+            poll_concurrency: Status polls in flight at once
+            max_polls_per_second: Cap on status polls started per second
+            deadline: Seconds a report may take from tracking start until it is ready
+            min_interval: Shortest delay between status polls of one report
+            max_interval: Longest delay between status polls of one report
+            on_progress: Called after every poll and download with the report's progress
+        """
+        return ReportTracker(
+            self,
+            download_workers=download_workers,
+            poll_concurrency=poll_concurrency,
+            max_polls_per_second=max_polls_per_second,
+            deadline=deadline,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            on_progress=on_progress,
+        )
@@ -1,25 +1,46 @@
 """Sponsored Products targets service."""
 
 import builtins
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
-from ...base import BaseService
+from ...base import (
+    DEFAULT_INDEX_PAGE_SIZE,
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_STREAM_IN_FLIGHT,
+    DEFAULT_V3_MAX_RESULTS,
+    BaseService,
+    v3_list_body,
+)
+from ...pagination import Cursor, Page
+from ...upsert import SP_TARGET_KEY
 from ...validation import (
     validate_target_id,
     validate_targets_for_create,
     validate_targets_for_update,
 )
 
+MEDIA_TYPE_V3 = "application/vnd.spTargetingClause.v3+json"
+
 
 class Targets(BaseService):
     """Sponsored Products target management."""
 
+    id_key = "targetId"
+    campaign_filter = "campaign_id_filter"
+    natural_key = SP_TARGET_KEY
+    write_chunk_size = 1000
+
     async def list(
         self,
         campaign_id_filter: str | None = None,
         ad_group_id_filter: str | None = None,
         target_id_filter: str | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
     ) -> AsyncGenerator[dict, None]:
         """List Sponsored Products targets.
 
@@ -27,10 +48,58 @@ class Targets(BaseService):
             campaign_id_filter: Filter by campaign ID
             ad_group_id_filter: Filter by ad group ID
             target_id_filter: Filter by target ID
+            page_size: Items requested per page (startIndex/count paging)
+            total: Known or estimated number of items; pages up to it are fetched
+                concurrently
+            concurrency: Maximum number of pages requested at once
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
 
         Yields:
             Target dictionaries
         """
+        async for page in self.list_pages(
+            campaign_id_filter,
+            ad_group_id_filter,
+            target_id_filter,
+            page_size,
+            total,
+            concurrency,
+            extended=extended,
+            resume_from=resume_from,
+        ):
+            for target in page.items:
+                yield target
+
+    async def list_pages(
+        self,
+        campaign_id_filter: str | None = None,
+        ad_group_id_filter: str | None = None,
+        target_id_filter: str | None = None,
+        page_size: int = DEFAULT_INDEX_PAGE_SIZE,
+        total: int | None = None,
+        concurrency: int = 1,
+        extended: bool = False,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Products targets page by page.
+
+        Args:
+            campaign_id_filter: Filter by campaign ID
+            ad_group_id_filter: Filter by ad group ID
+            target_id_filter: Filter by target ID
+            page_size: Items requested per page (startIndex/count paging)
+            total: Known or estimated number of items; pages up to it are fetched
+                concurrently
+            concurrency: Maximum number of pages requested at once
+            extended: Use the extended endpoint, whose items also carry servingStatus,
+                creationDate and lastUpdatedDate
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of target dictionaries with page metadata
+        """
         params: dict[str, Any] = {}
         if campaign_id_filter is not None:
             params["campaignIdFilter"] = campaign_id_filter
@@ -39,11 +108,100 @@ class Targets(BaseService):
         if target_id_filter is not None:
             params["targetIdFilter"] = target_id_filter
 
-        response = await self._request("GET", "/v2/sp/targets", params=params)
-        targets = response.json()
-        for target in targets:
+        path = "/v2/sp/targets/extended" if extended else "/v2/sp/targets"
+        async for page in self._paginate_index(
+            path, params, page_size, total, concurrency, resume_from
+        ):
+            yield page
+
+    async def list_sharded(
+        self,
+        shards: Iterable[dict[str, Any]],
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Products targets across independent shards in parallel.
+
+        Args:
+            shards: list_pages() keyword arguments per shard, e.g. {"ad_group_id_filter": "1,2,3"}
+                or built with shard_by_values() / shard_by_ids()
+            concurrency: Maximum number of shards crawled at once
+
+        Yields:
+            Target dictionaries, deduplicated by targetId
+        """
+        async for target in self._list_sharded(self.list_pages, shards, "targetId", concurrency):
             yield target
 
+    async def list_v3(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        ad_group_id_filter: str | Iterable[str] | None = None,
+        target_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[dict, None]:
+        """List Sponsored Products targets via the v3 POST list endpoint.
+
+        Every filter takes many values at once (an iterable or a comma-separated
+        string), and each page holds up to ``max_results`` items.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            ad_group_id_filter: Ad group IDs to include
+            target_id_filter: Target IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Target dictionaries in v3 format
+        """
+        async for page in self.list_v3_pages(
+            state_filter,
+            campaign_id_filter,
+            ad_group_id_filter,
+            target_id_filter,
+            max_results,
+            resume_from=resume_from,
+        ):
+            for target in page.items:
+                yield target
+
+    async def list_v3_pages(
+        self,
+        state_filter: str | Iterable[str] | None = None,
+        campaign_id_filter: str | Iterable[str] | None = None,
+        ad_group_id_filter: str | Iterable[str] | None = None,
+        target_id_filter: str | Iterable[str] | None = None,
+        max_results: int = DEFAULT_V3_MAX_RESULTS,
+        resume_from: Cursor | None = None,
+    ) -> AsyncGenerator[Page, None]:
+        """List Sponsored Products targets page by page via the v3 POST list endpoint.
+
+        Args:
+            state_filter: States to include (ENABLED, PAUSED, ARCHIVED)
+            campaign_id_filter: Campaign IDs to include
+            ad_group_id_filter: Ad group IDs to include
+            target_id_filter: Target IDs to include
+            max_results: Items per page (maxResults)
+            resume_from: Cursor from a previous page to continue an interrupted listing
+
+        Yields:
+            Pages of v3 target dictionaries with page metadata
+        """
+        body = v3_list_body(
+            max_results,
+            stateFilter=state_filter,
+            campaignIdFilter=campaign_id_filter,
+            adGroupIdFilter=ad_group_id_filter,
+            targetIdFilter=target_id_filter,
+        )
+        async for page in self._paginate(
+            "/sp/targets/list", "targetingClauses", body, resume_from, MEDIA_TYPE_V3
+        ):
+            yield page
+
     async def get(self, target_id: str) -> dict:
         """Get a specific Sponsored Products target.
 
@@ -54,10 +212,28 @@ class Targets(BaseService):
             Target dictionary
         """
         validate_target_id(target_id)
+        if self._get_batcher is not None:
+            return await self._get_batcher.load(target_id)
 
         response = await self._request("GET", f"/v2/sp/targets/{target_id}")
         return response.json()
 
+    async def get_many(self, target_ids: Iterable[str]) -> dict[str, dict | None]:
+        """Get many Sponsored Products targets with batched list requests.
+
+        IDs are packed into comma-separated ID filters, chunked to fit URL and
+        API limits, and the chunks are fetched concurrently.
+
+        Args:
+            target_ids: Target identifiers
+
+        Returns:
+            Mapping of each requested ID to its target, or None if not found
+        """
+        return await self._get_many(
+            target_ids, lambda ids: self.list_pages(target_id_filter=ids), "targetId"
+        )
+
     async def create(self, targets: builtins.list[dict]) -> builtins.list[dict]:
         """Create Sponsored Products targets.
 
@@ -69,8 +245,7 @@ class Targets(BaseService):
         """
         validate_targets_for_create(targets)
 
-        response = await self._request("POST", "/v2/sp/targets", json_data=targets)
-        return response.json()
+        return await self._write_chunked("POST", "/v2/sp/targets", targets)
 
     async def edit(self, targets: builtins.list[dict]) -> builtins.list[dict]:
         """Edit Sponsored Products targets.
@@ -83,8 +258,7 @@ class Targets(BaseService):
         """
         validate_targets_for_update(targets)
 
-        response = await self._request("PUT", "/v2/sp/targets", json_data=targets)
-        return response.json()
+        return await self._write_chunked("PUT", "/v2/sp/targets", targets)
 
     async def delete(self, target_id: str) -> dict:
         """Delete a Sponsored Products target.
@@ -99,3 +273,26 @@ class Targets(BaseService):
 
         response = await self._request("DELETE", f"/v2/sp/targets/{target_id}")
         return response.json()
+
+    async def delete_many(
+        self, ids: Iterable[str | int], max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT
+    ) -> dict[str, dict]:
+        """Delete many Sponsored Products targets with the v3 bulk delete endpoint.
+
+        IDs are sent in chunks of up to 1000, several chunks at once.
+
+        Args:
+            ids: Target identifiers
+            max_in_flight: Maximum chunks being deleted at once
+
+        Returns:
+            Mapping of each requested ID to its result, e.g. {"code": "SUCCESS", ...}
+        """
+        return await self._delete_many_v3(
+            ids,
+            "/sp/targets/delete",
+            "targetIdFilter",
+            "targetingClauses",
+            MEDIA_TYPE_V3,
+            max_in_flight,
+        )
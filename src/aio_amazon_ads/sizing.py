@@ -0,0 +1,91 @@
+"""Adaptive chunk sizing for bulk writes.
+
+Large create/edit chunks run into the read timeout or payload size limits,
+especially with complex target expressions. Small chunks waste round trips.
+``BatchSizer`` tunes the chunk size from observed outcomes. After a timeout or
+a payload size error the size is cut multiplicatively. A slow full chunk
+scales the size down towards the target latency. A fast full chunk grows it by
+a fixed step, up to the endpoint's limit.
+"""
+
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Seconds a create/edit request should take at most
+DEFAULT_TARGET_WRITE_LATENCY = 5.0
+
+# Factor applied to the chunk size after a timeout or payload size error
+DEFAULT_SIZE_DECREASE = 0.5
+
+# Chunk sizes remembered for inspection
+SIZE_HISTORY = 100
+
+
+class BatchSizer:
+    """Additive-increase, multiplicative-decrease chunk size for bulk writes.
+
+    Example:
+        sizer = client.sp.targets.enable_adaptive_writes(target_latency=3.0)
+        await client.sp.targets.create(rows)
+        print(sizer.size, list(sizer.history))
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        min_size: int = 1,
+        initial_size: int | None = None,
+        target_latency: float = DEFAULT_TARGET_WRITE_LATENCY,
+        increase: int | None = None,
+        decrease: float = DEFAULT_SIZE_DECREASE,
+    ):
+        """Initialize the sizer.
+
+        Args:
+            max_size: Largest chunk the endpoint accepts
+            min_size: Smallest chunk to shrink to
+            initial_size: Starting chunk size, defaults to max_size
+            target_latency: Seconds a chunk should take at most
+            increase: Items added after a fast full chunk, defaults to a tenth of max_size
+            decrease: Factor applied to the size after a timeout or size error
+        """
+        if not 1 <= min_size <= max_size:
+            raise ValueError("min_size must be between 1 and max_size")
+        if target_latency <= 0:
+            raise ValueError("target_latency must be positive")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.max_size = max_size
+        self.min_size = min_size
+        self.target_latency = target_latency
+        self.increase = increase if increase is not None else max(1, max_size // 10)
+        self.decrease = decrease
+        self.size = self._clamp(initial_size if initial_size is not None else max_size)
+        self.history: deque[int] = deque([self.size], maxlen=SIZE_HISTORY)
+        """Chunk sizes chosen so far, oldest first"""
+
+    def record_success(self, count: int, latency: float) -> None:
+        """Adjust the size after a chunk of ``count`` items took ``latency`` seconds."""
+        if latency > self.target_latency:
+            # Aim for the target, but never cut harder than after a failure
+            factor = max(self.target_latency / latency, self.decrease)
+            self._resize(min(self.size, int(count * factor)), f"{latency:.1f}s for {count} items")
+        elif count >= self.size:
+            # Only full chunks show whether a larger size is affordable
+            self._resize(self.size + self.increase, f"{latency:.1f}s for {count} items")
+
+    def record_failure(self, count: int) -> None:
+        """Shrink the size after a chunk of ``count`` items timed out or was too large."""
+        self._resize(min(self.size, int(count * self.decrease)), f"{count} items failed")
+
+    def _resize(self, size: int, reason: str) -> None:
+        size = self._clamp(size)
+        if size != self.size:
+            logger.info(f"Bulk write chunk size {self.size} -> {size} ({reason})")
+            self.size = size
+            self.history.append(size)
+
+    def _clamp(self, size: int) -> int:
+        return max(self.min_size, min(self.max_size, size))
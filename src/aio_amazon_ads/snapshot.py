@@ -0,0 +1,413 @@
+"""Local SQLite snapshot of account entities with incremental refresh.
+
+A snapshot keeps Sponsored Products campaigns, ad groups, keywords, targets,
+product ads and negative keywords plus portfolios in a SQLite database indexed
+by ID, parent and campaign, so reads become local queries.
+
+``refresh()`` lists portfolios, campaigns and ad groups from the extended
+endpoints, whose ``lastUpdatedDate`` reveals what changed since the previous
+refresh. Keywords, targets, product ads and negative keywords are re-fetched
+below ad groups that are new, changed or belong to a changed campaign.
+
+Leaf edits such as a keyword bid do not move their ad group's
+lastUpdatedDate, and the API has no modified-since filter for leaf listings.
+So every refresh also sweeps the leaves of the next slice of ad groups in
+rotation, and each leaf type is compared row by row by its own
+lastUpdatedDate. With ``sweep_refreshes`` refreshes per rotation, every leaf
+edit is picked up within that many refreshes at 1/``sweep_refreshes`` of the
+cost of a full leaf listing. Only changed rows are written. Entities missing
+from a re-fetched listing are deleted, and so are the children of deleted
+parents.
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import math
+import sqlite3
+import time
+from collections.abc import AsyncGenerator, Iterable
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from os import PathLike
+from typing import TYPE_CHECKING, Any
+
+from .base import DEFAULT_SHARD_CONCURRENCY
+from .pagination import shard_by_ids
+
+if TYPE_CHECKING:
+    from .client import AmazonAdsClient
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    ad_product TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    parent_id TEXT,
+    campaign_id TEXT,
+    last_updated INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (ad_product, entity_type, entity_id)
+);
+CREATE INDEX IF NOT EXISTS entities_parent ON entities (ad_product, entity_type, parent_id);
+CREATE INDEX IF NOT EXISTS entities_campaign ON entities (ad_product, entity_type, campaign_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class _SnapshotType:
+    ad_product: str
+    entity_type: str
+    id_key: str
+    parent_key: str | None
+
+
+_PORTFOLIOS = _SnapshotType("common", "portfolios", "portfolioId", None)
+_CAMPAIGNS = _SnapshotType("sp", "campaigns", "campaignId", None)
+_AD_GROUPS = _SnapshotType("sp", "ad_groups", "adGroupId", "campaignId")
+
+# Parent IDs bound per SQL query
+_PARAMS_PER_QUERY = 500
+
+# Entity types re-fetched per changed or swept ad group
+_LEAF_TYPES = (
+    _SnapshotType("sp", "keywords", "keywordId", "adGroupId"),
+    _SnapshotType("sp", "targets", "targetId", "adGroupId"),
+    _SnapshotType("sp", "product_ads", "adId", "adGroupId"),
+    _SnapshotType("sp", "negative_keywords", "keywordId", "adGroupId"),
+)
+
+# Incremental refreshes over which the leaf sweep visits every ad group once
+DEFAULT_SWEEP_REFRESHES = 12
+
+
+@dataclass
+class RefreshResult:
+    """Outcome of one snapshot refresh."""
+
+    full: bool
+    """Whether every entity type was re-fetched for the whole account"""
+    changed_ad_groups: int = 0
+    """New or changed ad groups, including those of changed campaigns"""
+    swept_ad_groups: int = 0
+    """Unchanged ad groups whose children were re-fetched by the rotating sweep"""
+    upserted: dict[str, int] = field(default_factory=dict)
+    """Entities written per entity type"""
+    deleted: dict[str, int] = field(default_factory=dict)
+    """Entities removed per entity type"""
+    duration: float = 0.0
+    """Seconds spent refreshing"""
+
+
+class SnapshotStore:
+    """SQLite store of account entities.
+
+    Example:
+        with SnapshotStore("account.db") as store:
+            await store.refresh(client)
+            paused = [kw for kw in store.query("keywords") if kw["state"] == "paused"]
+    """
+
+    def __init__(self, path: str | PathLike[str] = ":memory:"):
+        """Open or create a snapshot database.
+
+        Args:
+            path: SQLite database file, defaults to an in-memory database
+        """
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def refreshed_at(self) -> float | None:
+        """Unix time of the last completed refresh, None for an empty snapshot."""
+        value = self._meta("refreshed_at")
+        return float(value) if value is not None else None
+
+    def _meta(self, key: str) -> str | None:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def get(self, entity_type: str, entity_id: str | int, ad_product: str = "sp") -> dict | None:
+        """Return one stored entity.
+
+        Args:
+            entity_type: Entity type, e.g. campaigns or keywords
+            entity_id: Entity ID
+            ad_product: Ad product, ``common`` for portfolios
+
+        Returns:
+            Entity dictionary, or None if it is not in the snapshot
+        """
+        row = self._db.execute(
+            "SELECT data FROM entities WHERE ad_product = ? AND entity_type = ? AND entity_id = ?",
+            (_product(entity_type, ad_product), entity_type, str(entity_id)),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def query(
+        self,
+        entity_type: str,
+        ad_product: str = "sp",
+        parent_id: str | int | None = None,
+        campaign_id: str | int | None = None,
+    ) -> list[dict]:
+        """Return stored entities of one type, optionally by parent or campaign.
+
+        Args:
+            entity_type: Entity type, e.g. ad_groups or keywords
+            ad_product: Ad product, ``common`` for portfolios
+            parent_id: Only entities directly below this campaign or ad group
+            campaign_id: Only entities belonging to this campaign
+
+        Returns:
+            List of entity dictionaries
+        """
+        sql = "SELECT data FROM entities WHERE ad_product = ? AND entity_type = ?"
+        args: list[Any] = [_product(entity_type, ad_product), entity_type]
+        if parent_id is not None:
+            sql += " AND parent_id = ?"
+            args.append(str(parent_id))
+        if campaign_id is not None:
+            sql += " AND campaign_id = ?"
+            args.append(str(campaign_id))
+        return [json.loads(row[0]) for row in self._db.execute(sql, args)]
+
+    def count(self, entity_type: str, ad_product: str = "sp") -> int:
+        """Return the number of stored entities of one type."""
+        row = self._db.execute(
+            "SELECT COUNT(*) FROM entities WHERE ad_product = ? AND entity_type = ?",
+            (_product(entity_type, ad_product), entity_type),
+        ).fetchone()
+        return int(row[0])
+
+    async def refresh(
+        self,
+        client: "AmazonAdsClient",
+        full: bool = False,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        sweep_refreshes: int = DEFAULT_SWEEP_REFRESHES,
+    ) -> RefreshResult:
+        """Bring the snapshot up to date.
+
+        Leaves are re-fetched below ad groups and campaigns whose
+        lastUpdatedDate moved, plus below the next 1/``sweep_refreshes`` of
+        all ad groups in rotation, which picks up edits to leaves alone.
+
+        Args:
+            client: Client to fetch with
+            full: Re-fetch every entity type for the whole account. The first
+                refresh of an empty snapshot is always full.
+            concurrency: Maximum number of ad group ID shards fetched at once
+            sweep_refreshes: Incremental refreshes over which every ad group's
+                leaves are checked once
+
+        Returns:
+            RefreshResult with per-type write and delete counts
+        """
+        if sweep_refreshes < 1:
+            raise ValueError("sweep_refreshes must be at least 1")
+        started = time.monotonic()
+        full = full or self.refreshed_at is None
+        result = RefreshResult(full=full)
+        refreshed_at = time.time()
+
+        portfolios, campaigns, ad_groups = await asyncio.gather(
+            _collect(client.portfolios.list(extended=True)),
+            _collect(client.sp.campaigns.list(extended=True)),
+            _collect(client.sp.ad_groups.list(extended=True)),
+        )
+
+        # Fetch everything before writing, a failed refresh leaves the snapshot untouched
+        dirty: set[str] | None = None
+        swept_to = self._meta("swept_to") or ""
+        if full:
+            leaf_items = await asyncio.gather(
+                *(_collect(_service(client, kind).list(extended=True)) for kind in _LEAF_TYPES)
+            )
+        else:
+            changed_campaigns = self._changed(_CAMPAIGNS, campaigns)
+            dirty = self._changed(_AD_GROUPS, ad_groups)
+            dirty.update(
+                str(group["adGroupId"])
+                for group in ad_groups
+                if str(group.get("campaignId")) in changed_campaigns
+            )
+            result.changed_ad_groups = len(dirty)
+            group_ids = sorted(str(group["adGroupId"]) for group in ad_groups)
+            swept, swept_to = _sweep(group_ids, swept_to, sweep_refreshes)
+            result.swept_ad_groups = len(set(swept) - dirty)
+            dirty.update(swept)
+            logger.debug(
+                f"Snapshot: re-fetching children of {result.changed_ad_groups} changed "
+                f"and {result.swept_ad_groups} swept ad groups"
+            )
+            shards = [
+                {**shard, "extended": True}
+                for shard in shard_by_ids("ad_group_id_filter", sorted(dirty))
+            ]
+            leaf_items = await asyncio.gather(
+                *(
+                    _collect(_service(client, kind).list_sharded(shards, concurrency))
+                    for kind in _LEAF_TYPES
+                )
+            )
+
+        self._replace(_PORTFOLIOS, portfolios, result)
+        self._replace(_CAMPAIGNS, campaigns, result)
+        self._replace(_AD_GROUPS, ad_groups, result)
+        for kind, items in zip(_LEAF_TYPES, leaf_items, strict=True):
+            self._replace(kind, items, result, parents=dirty)
+        if not full:
+            # Children of ad groups that no longer exist
+            self._delete_orphans(result)
+
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("refreshed_at", str(refreshed_at)), ("swept_to", swept_to)],
+            )
+        result.duration = time.monotonic() - started
+        return result
+
+    def _stored(self, kind: _SnapshotType, parents: Iterable[str] | None) -> dict[str, Any]:
+        """Return stored IDs with their lastUpdatedDate, optionally below some parents."""
+        sql = (
+            "SELECT entity_id, last_updated FROM entities WHERE ad_product = ? AND entity_type = ?"
+        )
+        args: list[Any] = [kind.ad_product, kind.entity_type]
+        if parents is None:
+            return dict(self._db.execute(sql, args).fetchall())
+        stored: dict[str, Any] = {}
+        parent_ids = list(parents)
+        for start in range(0, len(parent_ids), _PARAMS_PER_QUERY):
+            chunk = parent_ids[start : start + _PARAMS_PER_QUERY]
+            in_clause = f" AND parent_id IN ({','.join('?' * len(chunk))})"
+            stored.update(self._db.execute(sql + in_clause, args + chunk).fetchall())
+        return stored
+
+    def _changed(self, kind: _SnapshotType, items: list[dict]) -> set[str]:
+        """Return IDs of new items and items whose lastUpdatedDate moved."""
+        stored = self._stored(kind, None)
+        return {
+            str(item[kind.id_key])
+            for item in items
+            if _is_changed(stored, str(item[kind.id_key]), item.get("lastUpdatedDate"))
+        }
+
+    def _replace(
+        self,
+        kind: _SnapshotType,
+        items: list[dict],
+        result: RefreshResult,
+        parents: Iterable[str] | None = None,
+    ) -> None:
+        """Store a complete listing and delete stored entities missing from it.
+
+        Args:
+            kind: Entity type of the items
+            items: Listing of every entity of the type, or of every entity below ``parents``
+            result: Refresh result to update
+            parents: Restrict the listing's scope to these parent IDs
+        """
+        stored = self._stored(kind, parents)
+        rows = []
+        for item in items:
+            entity_id = str(item[kind.id_key])
+            last_updated = item.get("lastUpdatedDate")
+            if _is_changed(stored, entity_id, last_updated):
+                rows.append(_row(kind, entity_id, last_updated, item))
+        gone = stored.keys() - {str(item[kind.id_key]) for item in items}
+
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO entities "
+                "(ad_product, entity_type, entity_id, parent_id, campaign_id, last_updated, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._db.executemany(
+                "DELETE FROM entities WHERE ad_product = ? AND entity_type = ? AND entity_id = ?",
+                [(kind.ad_product, kind.entity_type, entity_id) for entity_id in gone],
+            )
+        _add(result.upserted, kind.entity_type, len(rows))
+        _add(result.deleted, kind.entity_type, len(gone))
+
+    def _delete_orphans(self, result: RefreshResult) -> None:
+        with self._db:
+            for kind in _LEAF_TYPES:
+                deleted = self._db.execute(
+                    "DELETE FROM entities WHERE ad_product = ? AND entity_type = ? "
+                    "AND parent_id NOT IN (SELECT entity_id FROM entities "
+                    "WHERE ad_product = 'sp' AND entity_type = 'ad_groups')",
+                    (kind.ad_product, kind.entity_type),
+                ).rowcount
+                _add(result.deleted, kind.entity_type, deleted)
+
+
+def _sweep(group_ids: list[str], swept_to: str, refreshes: int) -> tuple[list[str], str]:
+    """Return the next slice of sorted ad group IDs after ``swept_to`` and its last ID.
+
+    The slice wraps around, so every ad group is visited once per ``refreshes``
+    calls even as ad groups come and go.
+    """
+    if not group_ids:
+        return [], swept_to
+    size = math.ceil(len(group_ids) / refreshes)
+    start = bisect.bisect_right(group_ids, swept_to)
+    swept = (group_ids[start:] + group_ids[:start])[:size]
+    return swept, swept[-1]
+
+
+def _product(entity_type: str, ad_product: str) -> str:
+    return "common" if entity_type == "portfolios" else ad_product
+
+
+def _is_changed(stored: dict[str, Any], entity_id: str, last_updated: Any) -> bool:
+    # Items without lastUpdatedDate are always rewritten
+    return entity_id not in stored or last_updated is None or stored[entity_id] != last_updated
+
+
+def _row(kind: _SnapshotType, entity_id: str, last_updated: Any, item: dict) -> tuple:
+    parent = item.get(kind.parent_key) if kind.parent_key else None
+    campaign = item.get("campaignId")
+    return (
+        kind.ad_product,
+        kind.entity_type,
+        entity_id,
+        str(parent) if parent is not None else None,
+        str(campaign) if campaign is not None else None,
+        last_updated,
+        json.dumps(item),
+    )
+
+
+def _add(counts: dict[str, int], key: str, value: int) -> None:
+    if value:
+        counts[key] = counts.get(key, 0) + value
+
+
+def _service(client: "AmazonAdsClient", kind: _SnapshotType) -> Any:
+    return getattr(client.sp, kind.entity_type)
+
+
+async def _collect(items: AsyncGenerator[dict, None]) -> list[dict]:
+    async with aclosing(items) as stream:
+        return [item async for item in stream]
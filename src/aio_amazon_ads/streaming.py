@@ -0,0 +1,124 @@
+"""Streaming bulk writes from async iterables of changes."""
+
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable
+from typing import Any
+
+from .bulk import BulkItem, request_failure
+
+logger = logging.getLogger(__name__)
+
+# Batches a streaming write keeps in flight at once
+DEFAULT_STREAM_IN_FLIGHT = 4
+
+
+async def apply_stream(
+    write: Callable[[list[dict]], Awaitable[list[dict]]],
+    changes: AsyncIterable[dict],
+    batch_size: int,
+    max_in_flight: int = DEFAULT_STREAM_IN_FLIGHT,
+    linger: float | None = None,
+) -> AsyncGenerator[BulkItem, None]:
+    """Write a stream of changes in batches and yield per-item results.
+
+    Changes are read only while fewer than ``max_in_flight`` batches are
+    being written and their results have been consumed, so memory stays
+    bounded and a slow API or consumer slows the producer down. A batch is
+    sent when it is full, when the stream ends, or when no change arrived for
+    ``linger`` seconds. A batch whose request fails yields a REQUEST_FAILED
+    result for each of its items and the stream continues.
+
+    Args:
+        write: Bulk create or edit returning one result per item in input order
+        changes: Async iterable of entities to write
+        batch_size: Maximum items per batch
+        max_in_flight: Maximum batches being written at once
+        linger: Seconds to wait for more changes before sending a partial
+            batch, None to wait until the batch is full or the stream ends
+
+    Yields:
+        BulkItem per change in completion order, ``index`` being the position
+        of the change in the stream
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    done = object()
+    results: asyncio.Queue[Any] = asyncio.Queue(maxsize=max_in_flight)
+    slots = asyncio.Semaphore(max_in_flight)
+    writes: set[asyncio.Task[None]] = set()
+
+    async def send(start: int, batch: list[dict]) -> None:
+        try:
+            responses = await write(batch)
+        except Exception as e:
+            logger.warning(f"Streaming write of {len(batch)} items failed: {e}")
+            responses = [request_failure(e) for _ in batch]
+        # The slot is freed once the consumer made room for the results
+        await results.put((start, batch, responses))
+        slots.release()
+
+    async def launch(start: int, batch: list[dict]) -> None:
+        await slots.acquire()
+        task = asyncio.ensure_future(send(start, batch))
+        writes.add(task)
+        task.add_done_callback(writes.discard)
+
+    async def produce() -> None:
+        iterator = aiter(changes)
+        batch: list[dict] = []
+        position = 0
+        pending_next: asyncio.Future[dict] | None = None
+        try:
+            while True:
+                if pending_next is None:
+                    pending_next = asyncio.ensure_future(anext(iterator))
+                if linger is not None and batch:
+                    # The pending read is kept, not cancelled, when the linger expires
+                    finished, _ = await asyncio.wait({pending_next}, timeout=linger)
+                    if not finished:
+                        await launch(position - len(batch), batch)
+                        batch = []
+                        continue
+                try:
+                    change = await pending_next
+                except StopAsyncIteration:
+                    break
+                finally:
+                    if pending_next.done():
+                        pending_next = None
+                batch.append(change)
+                position += 1
+                if len(batch) >= batch_size:
+                    await launch(position - len(batch), batch)
+                    batch = []
+            if batch:
+                await launch(position - len(batch), batch)
+            if writes:
+                await asyncio.gather(*writes)
+        except Exception as e:
+            await results.put(e)
+            return
+        finally:
+            if pending_next is not None:
+                pending_next.cancel()
+        await results.put(done)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            entry = await results.get()
+            if entry is done:
+                break
+            if isinstance(entry, BaseException):
+                raise entry
+            start, batch, responses = entry
+            for offset, (item, response) in enumerate(zip(batch, responses, strict=True)):
+                yield BulkItem(index=start + offset, item=item, result=response)
+    finally:
+        producer.cancel()
+        for task in list(writes):
+            task.cancel()
@@ -0,0 +1,49 @@
+"""Diffing desired entity state against known state."""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a diff-based edit."""
+
+    changes: list[dict] = field(default_factory=list)
+    """Sent deltas: the ID plus the fields that differ from the known state"""
+    results: list[dict] = field(default_factory=list)
+    """Per-item results of the edit, in the order of ``changes``"""
+    unchanged: list[str] = field(default_factory=list)
+    """IDs of entities already in the desired state"""
+    missing: list[dict] = field(default_factory=list)
+    """Desired entities whose current state is unknown, not sent"""
+
+
+def _same(desired: Any, current: Any) -> bool:
+    if isinstance(desired, bool) or isinstance(current, bool):
+        return desired is current
+    if isinstance(desired, int | float) and isinstance(current, int | float):
+        # Bids come back as floats that may differ in the last digits
+        return math.isclose(desired, current, rel_tol=1e-9, abs_tol=1e-9)
+    return bool(desired == current)
+
+
+def diff_entity(desired: dict, current: dict, id_key: str) -> dict | None:
+    """Return the part of a desired entity that differs from its current state.
+
+    Args:
+        desired: Desired entity, holding the ID and the fields to set
+        current: Current entity as returned by the API
+        id_key: Entity field holding the ID, always kept in the delta
+
+    Returns:
+        The ID plus every field whose value differs, or None if nothing differs
+    """
+    delta = {
+        key: value
+        for key, value in desired.items()
+        if key != id_key and (key not in current or not _same(value, current[key]))
+    }
+    if not delta:
+        return None
+    return {id_key: desired[id_key], **delta}
@@ -0,0 +1,91 @@
+"""Natural keys matching desired entities to existing ones for upserts."""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+from .keyword_index import normalize_keyword_text
+
+
+def _expression_key(expression: Any) -> str:
+    """Return an order-insensitive, case-insensitive form of a target expression."""
+    if not isinstance(expression, list):
+        return json.dumps(expression, sort_keys=True).lower()
+    parts = sorted(json.dumps(part, sort_keys=True).lower() for part in expression)
+    return json.dumps(parts)
+
+
+_NORMALIZERS = {
+    "keywordText": normalize_keyword_text,
+    "matchType": lambda value: str(value).lower(),
+    "expression": _expression_key,
+    "expressionType": lambda value: str(value).lower(),
+}
+
+
+@dataclass(frozen=True)
+class NaturalKey:
+    """Fields identifying an entity without its ID, e.g. ad group, text and match type."""
+
+    fields: tuple[str, ...]
+    """Identifying fields; they are not sent in edits"""
+    parent_key: str | None = None
+    """Identifying field holding the parent ID, None for top-level entities"""
+    parent_filter: str | None = None
+    """list_pages() argument taking comma-separated parent IDs"""
+    create_only: tuple[str, ...] = ()
+    """Further fields that cannot be edited and are only sent on create"""
+
+    def __call__(self, entity: dict) -> tuple:
+        """Return the normalized key of an entity.
+
+        Raises:
+            ValueError: If an identifying field is missing
+        """
+        values = []
+        for name in self.fields:
+            value = entity.get(name)
+            if value is None:
+                raise ValueError(f"Entity has no {name}: {entity}")
+            normalize = _NORMALIZERS.get(name, str)
+            values.append(normalize(value))
+        return tuple(values)
+
+
+CAMPAIGN_KEY = NaturalKey(("name",))
+SP_AD_GROUP_KEY = NaturalKey(("campaignId", "name"), "campaignId", "campaign_id_filter")
+SP_KEYWORD_KEY = NaturalKey(
+    ("adGroupId", "keywordText", "matchType"),
+    "adGroupId",
+    "ad_group_id_filter",
+    create_only=("campaignId",),
+)
+SP_TARGET_KEY = NaturalKey(
+    ("adGroupId", "expression"),
+    "adGroupId",
+    "ad_group_id_filter",
+    create_only=("campaignId", "expressionType"),
+)
+AD_GROUP_KEY = NaturalKey(("campaignId", "name"), "campaignId", "campaignIdFilter")
+KEYWORD_KEY = NaturalKey(
+    ("adGroupId", "keywordText", "matchType"),
+    "adGroupId",
+    "adGroupIdFilter",
+    create_only=("campaignId",),
+)
+
+
+@dataclass
+class UpsertResult:
+    """Outcome of an upsert, split into creates and edits."""
+
+    creates: list[dict] = field(default_factory=list)
+    """Entities sent to create()"""
+    created: list[dict] = field(default_factory=list)
+    """Per-item results of create(), in the order of ``creates``"""
+    edits: list[dict] = field(default_factory=list)
+    """Deltas sent to edit(): the matched ID plus the changed fields"""
+    edited: list[dict] = field(default_factory=list)
+    """Per-item results of edit(), in the order of ``edits``"""
+    unchanged: list[str] = field(default_factory=list)
+    """IDs of matched entities already in the desired state"""
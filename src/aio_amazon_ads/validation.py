@@ -346,6 +346,28 @@ def validate_negative_keywords_for_create(keywords: list[dict]) -> list[dict]:
     return keywords
 
 
+def validate_negative_keywords_for_update(keywords: list[dict]) -> list[dict]:
+    """Validate negative keywords for update operation.
+
+    Args:
+        keywords: List of negative keywords to validate
+
+    Returns:
+        Validated negative keywords list
+
+    Raises:
+        ValueError: If validation fails
+    """
+    if not keywords:
+        raise ValueError("keywords list cannot be empty")
+
+    for i, keyword in enumerate(keywords):
+        if "keywordId" not in keyword:
+            raise ValueError(f"Negative keyword at index {i} must have keywordId")
+
+    return keywords
+
+
 def validate_negative_keywords_for_delete(keyword_id: str | None) -> str:
     """Validate negative keyword ID for delete operation.
 
@@ -0,0 +1,167 @@
+"""Tests for adaptive bulk write chunk sizing."""
+
+import json
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, BatchSizer, PayloadTooLargeError, ValidationError
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _targets(count):
+    return [{"adGroupId": "1", "bid": i} for i in range(count)]
+
+
+def test_sizer_grows_on_fast_full_chunks_and_shrinks_on_slow_ones():
+    """Test the size grows additively and scales down towards the target latency."""
+    sizer = BatchSizer(max_size=100, initial_size=20, target_latency=2.0, increase=10)
+
+    sizer.record_success(20, 0.5)
+    sizer.record_success(5, 0.1)  # partial chunk, no growth
+    assert sizer.size == 30
+
+    sizer.record_success(30, 3.0)
+    assert sizer.size == 20
+
+    sizer.record_failure(20)
+    sizer.record_failure(10)
+    sizer.record_failure(5)
+    assert sizer.size == 2
+    assert list(sizer.history) == [20, 30, 20, 10, 5, 2]
+
+
+def test_sizer_stays_within_bounds():
+    """Test the size never leaves [min_size, max_size]."""
+    sizer = BatchSizer(max_size=50, min_size=5, target_latency=1.0)
+
+    sizer.record_success(50, 0.1)
+    assert sizer.size == 50
+    for _ in range(10):
+        sizer.record_failure(sizer.size)
+    assert sizer.size == 5
+
+    with pytest.raises(ValueError):
+        BatchSizer(max_size=10, min_size=20)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_create_splits_chunks_rejected_as_too_large(client, mock_token):
+    """Test a 413 chunk is split and resent, with results kept in input order."""
+    sizes = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        sizes.append(len(body))
+        if len(body) > 250:
+            return Response(413, text="Request entity too large")
+        return Response(
+            200, json=[{"code": "SUCCESS", "targetId": str(item["bid"])} for item in body]
+        )
+
+    respx.post(f"{BASE}/v2/sp/targets").mock(side_effect=handler)
+    sizer = client.sp.targets.enable_adaptive_writes(target_latency=60.0)
+
+    results = await client.sp.targets.create(_targets(1000))
+
+    assert [r["targetId"] for r in results] == [str(i) for i in range(1000)]
+    assert sizes[0] == 1000
+    assert max(size for size in sizes if size <= 250) <= 250
+    assert sizer.size <= 500
+    assert sizer.history[0] == 1000
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_create_shrinks_after_timeouts(client, mock_token):
+    """Test timed out chunks are split at once, without resending them at the same size."""
+    sizes = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        sizes.append(len(body))
+        if len(body) > 100:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return Response(200, json=[{"code": "SUCCESS"} for _ in body])
+
+    respx.post(f"{BASE}/v2/sp/keywords").mock(side_effect=handler)
+    sizer = client.sp.keywords.enable_adaptive_writes(initial_size=400)
+
+    results = await client.sp.keywords.create(_targets(400))
+
+    assert len(results) == 400
+    assert all(r["code"] == "SUCCESS" for r in results)
+    assert list(sizer.history)[:3] == [400, 200, 100]
+    # One call per chunk: 400, then 2 x 200, then 4 x 100
+    assert sorted(sizes) == [100] * 4 + [200] * 2 + [400]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_size_errors_at_min_size_are_reported(client, mock_token):
+    """Test chunks at the minimum size are not split further and the error is raised."""
+    respx.put(f"{BASE}/v2/sp/campaigns").mock(
+        return_value=Response(400, json={"details": "Too many items in request"})
+    )
+    client.sp.campaigns.enable_adaptive_writes(min_size=50)
+
+    with pytest.raises(PayloadTooLargeError) as exc_info:
+        await client.sp.campaigns.edit([{"campaignId": str(i)} for i in range(100)])
+    assert isinstance(exc_info.value, ValidationError)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_plain_validation_errors_are_not_split(client, mock_token):
+    """Test a 400 about invalid content stays a ValidationError and is sent once."""
+    route = respx.put(f"{BASE}/v2/sp/campaigns").mock(
+        return_value=Response(400, json={"details": "Invalid payload: bid must be positive"})
+    )
+    client.sp.campaigns.enable_adaptive_writes(min_size=1)
+
+    with pytest.raises(ValidationError) as exc_info:
+        await client.sp.campaigns.edit([{"campaignId": str(i)} for i in range(100)])
+    assert not isinstance(exc_info.value, PayloadTooLargeError)
+    assert route.call_count == 1
+
+
+def test_client_enables_adaptive_writes():
+    """Test the client option enables sizing on every writable service."""
+    client = AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        write_target_latency=3.0,
+    )
+
+    assert client.sp.keywords.write_sizer is not None
+    assert client.sp.keywords.write_sizer.target_latency == 3.0
+    assert client.sb.campaigns.write_sizer is not None
+    assert client.profiles.write_sizer is None
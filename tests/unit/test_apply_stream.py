@@ -0,0 +1,132 @@
+"""Tests for streaming bulk writes."""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, ValidationError
+from aio_amazon_ads.bulk import REQUEST_FAILED
+from aio_amazon_ads.streaming import apply_stream
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+async def _changes(count, delay=0.0, read=None):
+    for i in range(count):
+        if delay:
+            await asyncio.sleep(delay)
+        if read is not None:
+            read.append(i)
+        yield {"keywordId": str(i), "bid": i}
+
+
+async def _echo(batch):
+    return [{"code": "SUCCESS", "keywordId": item["keywordId"]} for item in batch]
+
+
+@pytest.mark.asyncio
+async def test_stream_is_batched_and_every_change_yields_a_result():
+    """Test changes are sent in full batches plus a final partial one."""
+    sizes = []
+
+    async def write(batch):
+        sizes.append(len(batch))
+        return await _echo(batch)
+
+    items = [item async for item in apply_stream(write, _changes(10), batch_size=3)]
+
+    assert sizes == [3, 3, 3, 1]
+    assert sorted(item.index for item in items) == list(range(10))
+    assert all(item.result["keywordId"] == item.item["keywordId"] for item in items)
+
+
+@pytest.mark.asyncio
+async def test_slow_writes_hold_back_the_producer():
+    """Test no more than the in-flight batches plus one are read ahead."""
+    read = []
+    release = asyncio.Event()
+
+    async def write(batch):
+        await release.wait()
+        return await _echo(batch)
+
+    stream = apply_stream(write, _changes(100, read=read), batch_size=5, max_in_flight=2)
+    first = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0.05)
+    assert len(read) <= 15
+
+    release.set()
+    items = [await first] + [item async for item in stream]
+    assert len(items) == 100
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_are_reported_per_item():
+    """Test a failing batch yields REQUEST_FAILED results and the stream continues."""
+
+    async def write(batch):
+        if batch[0]["keywordId"] == "0":
+            raise ValidationError("bad batch")
+        return await _echo(batch)
+
+    items = [item async for item in apply_stream(write, _changes(4), batch_size=2)]
+
+    failed = sorted(
+        (item.index, item.result["retryable"]) for item in items if item.code == REQUEST_FAILED
+    )
+    assert failed == [(0, False), (1, False)]
+
+
+@pytest.mark.asyncio
+async def test_linger_sends_partial_batches_of_slow_streams():
+    """Test a partial batch goes out once no change arrived for the linger time."""
+    sizes = []
+
+    async def write(batch):
+        sizes.append(len(batch))
+        return await _echo(batch)
+
+    stream = apply_stream(write, _changes(3, delay=0.05), batch_size=100, linger=0.01)
+    items = [item async for item in stream]
+
+    assert len(items) == 3
+    assert sizes == [1, 1, 1]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_client_apply_stream_edits_service(client):
+    """Test the client resolves the dotted service name and edits through it."""
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+    route = respx.put(f"{BASE}/v2/sp/keywords").mock(
+        side_effect=lambda request: Response(
+            200, json=[{"code": "SUCCESS"} for _ in json.loads(request.content)]
+        )
+    )
+
+    items = [item async for item in client.apply_stream(_changes(5), "sp.keywords", batch_size=2)]
+
+    assert len(items) == 5
+    assert route.call_count == 3
+    with pytest.raises(ValueError):
+        client.service("sp.nothing")
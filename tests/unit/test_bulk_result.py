@@ -0,0 +1,136 @@
+"""Tests for per-item bulk results and selective retry."""
+
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, ServerError, ValidationError
+from aio_amazon_ads.bulk import REQUEST_FAILED, is_retryable, request_failure
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _keywords(count):
+    return [{"adGroupId": "1", "keywordText": f"kw{i}", "bid": i} for i in range(count)]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_bulk_create_maps_results_and_retries_only_transient_items(client, mock_token):
+    """Test permanent failures are kept and only transient failures are resent."""
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append([item["bid"] for item in body])
+        results = []
+        for item in body:
+            if item["bid"] == 1:
+                results.append({"code": "INVALID_ARGUMENT", "description": "Bad bid"})
+            elif item["bid"] == 2 and len(bodies) == 1:
+                results.append({"code": "INTERNAL_ERROR"})
+            else:
+                results.append({"code": "SUCCESS", "keywordId": str(item["bid"])})
+        return Response(200, json=results)
+
+    respx.post(f"{BASE}/v2/sp/keywords").mock(side_effect=handler)
+
+    result = await client.sp.keywords.bulk_create(_keywords(4), backoff=0)
+
+    assert bodies == [[0, 1, 2, 3], [2]]
+    assert result.attempts == 2
+    assert not result.ok
+    assert [item.index for item in result.succeeded] == [0, 3, 2]
+    assert [(item.index, item.code) for item in result.failed] == [(1, "INVALID_ARGUMENT")]
+    assert result.retryable == []
+    assert [r["code"] for r in result.results] == [
+        "SUCCESS",
+        "INVALID_ARGUMENT",
+        "SUCCESS",
+        "SUCCESS",
+    ]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_bulk_edit_gives_up_after_max_retries(client, mock_token):
+    """Test items still failing transiently after all retries are reported as retryable."""
+    route = respx.put(f"{BASE}/v2/sp/keywords").mock(
+        side_effect=lambda request: Response(
+            200,
+            json=[
+                {"code": "SUCCESS"} if item["keywordId"] == "1" else {"code": "THROTTLED"}
+                for item in json.loads(request.content)
+            ],
+        )
+    )
+
+    result = await client.sp.keywords.bulk_edit(
+        [{"keywordId": "1", "bid": 1.0}, {"keywordId": "2", "bid": 2.0}],
+        max_retries=2,
+        backoff=0,
+    )
+
+    assert route.call_count == 3
+    assert result.attempts == 3
+    assert [item.index for item in result.succeeded] == [0]
+    assert [(item.index, item.item["keywordId"]) for item in result.retryable] == [(1, "2")]
+    assert not result.ok
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_bulk_create_reports_whole_call_errors_per_item(client, mock_token):
+    """Test a rejected request fails every item without retrying."""
+    route = respx.post(f"{BASE}/v2/sp/keywords").mock(
+        return_value=Response(400, json={"code": "400", "details": "Malformed"})
+    )
+
+    result = await client.sp.keywords.bulk_create(_keywords(2), backoff=0)
+
+    assert route.call_count == 1
+    assert [item.index for item in result.failed] == [0, 1]
+    assert all(item.code == REQUEST_FAILED for item in result.failed)
+    assert "Malformed" in result.failed[0].result["description"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_requires_write_method(client):
+    """Test services without edit() reject bulk_edit()."""
+    with pytest.raises(TypeError):
+        await client.profiles.bulk_edit([{}])
+
+
+def test_request_failure_is_retryable_for_transient_errors():
+    """Test whole-request failures share one result shape and retry flag."""
+    transient = request_failure(ServerError("unavailable"))
+    permanent = request_failure(ValidationError("bad payload"))
+
+    assert transient == {"code": REQUEST_FAILED, "description": "unavailable", "retryable": True}
+    assert is_retryable(transient)
+    assert not is_retryable(permanent)
+    assert is_retryable(request_failure("No result returned", retryable=True))
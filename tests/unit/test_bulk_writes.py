@@ -0,0 +1,115 @@
+"""Tests for chunked bulk create/edit."""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, ValidationError
+from aio_amazon_ads.bulk import REQUEST_FAILED
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _echo(request):
+    """Answer every keyword with SUCCESS, echoing its bid as keywordId."""
+    body = json.loads(request.content)
+    return [{"code": "SUCCESS", "keywordId": str(item["bid"])} for item in body]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_edit_splits_chunks_and_keeps_input_order(client, mock_token):
+    """Test large edits are chunked, sent concurrently and merged in input order."""
+    sizes = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        body = json.loads(request.content)
+        sizes.append(len(body))
+        # Later chunks answer first
+        await asyncio.sleep(0.01 * (5 - body[0]["bid"] // 100))
+        in_flight -= 1
+        return Response(207, json=_echo(request))
+
+    respx.put(f"{BASE}/v2/sb/keywords").mock(side_effect=handler)
+
+    client.sb.keywords.write_concurrency = 2
+    results = await client.sb.keywords.edit([{"keywordId": i, "bid": i} for i in range(450)])
+
+    assert [r["keywordId"] for r in results] == [str(i) for i in range(450)]
+    assert sorted(sizes) == [50, 100, 100, 100, 100]
+    assert max_in_flight == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_sp_keywords_use_endpoint_chunk_size(client, mock_token):
+    """Test endpoints accepting larger batches get fewer requests."""
+    route = respx.post(f"{BASE}/v2/sp/keywords").mock(
+        side_effect=lambda request: Response(207, json=_echo(request))
+    )
+
+    results = await client.sp.keywords.create([{"bid": i} for i in range(1500)])
+
+    assert len(results) == 1500
+    assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_failed_chunk_does_not_block_others(client, mock_token):
+    """Test a rejected chunk reports per-item failures while other chunks succeed."""
+
+    def handler(request):
+        body = json.loads(request.content)
+        if body[0]["bid"] == 100:
+            return Response(400, json={"message": "bad chunk"})
+        return Response(207, json=_echo(request))
+
+    respx.post(f"{BASE}/v2/sb/keywords").mock(side_effect=handler)
+
+    results = await client.sb.keywords.create([{"bid": i} for i in range(250)])
+
+    assert [r["code"] for r in results[:100]] == ["SUCCESS"] * 100
+    assert {r["code"] for r in results[100:200]} == {REQUEST_FAILED}
+    assert "bad chunk" in results[150]["description"]
+    assert [r["keywordId"] for r in results[200:]] == [str(i) for i in range(200, 250)]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_all_chunks_failing_raises(client, mock_token):
+    """Test the error is raised when no chunk succeeded, as for a single request."""
+    respx.post(f"{BASE}/v2/sb/keywords").mock(return_value=Response(400, json={"message": "no"}))
+
+    with pytest.raises(ValidationError):
+        await client.sb.keywords.create([{"bid": i} for i in range(150)])
@@ -0,0 +1,143 @@
+"""Tests for the hierarchical account crawler."""
+
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, EntityEvent
+from aio_amazon_ads.exceptions import ValidationError
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _mock_sd():
+    campaigns = respx.get(f"{BASE}/v2/sd/campaigns").mock(
+        return_value=Response(200, json=[{"campaignId": "c1"}, {"campaignId": "c2"}])
+    )
+    ad_groups = respx.get(f"{BASE}/v2/sd/adGroups").mock(
+        return_value=Response(
+            200,
+            json=[
+                {"adGroupId": "a1", "campaignId": "c1"},
+                {"adGroupId": "a2", "campaignId": "c2"},
+            ],
+        )
+    )
+    return campaigns, ad_groups
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_crawl_account_strategy_lists_each_type_once(client, mock_token):
+    """Test whole-account crawls use one unfiltered listing per entity type."""
+    campaigns, ad_groups = _mock_sd()
+
+    events = [event async for event in client.crawl(ad_products=["sd"])]
+
+    assert sorted((e.entity_type, e.entity_id, e.parent_id) for e in events) == [
+        ("ad_groups", "a1", "c1"),
+        ("ad_groups", "a2", "c2"),
+        ("campaigns", "c1", None),
+        ("campaigns", "c2", None),
+    ]
+    assert all(isinstance(e, EntityEvent) and e.ad_product == "sd" for e in events)
+    assert campaigns.call_count == 1
+    assert "campaignIdFilter" not in ad_groups.calls[0].request.url.params
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_crawl_parent_strategy_filters_children_by_campaign(client, mock_token):
+    """Test children are listed with campaign ID filters from the parent level."""
+    _, ad_groups = _mock_sd()
+
+    events = [
+        event
+        async for event in client.crawl(
+            ad_products=["sd"], entity_types=["ad_groups"], strategy="parent"
+        )
+    ]
+
+    assert {e.entity_id for e in events} == {"a1", "a2"}
+    assert ad_groups.calls[0].request.url.params["campaignIdFilter"] == "c1,c2"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_crawl_campaign_scope_shards_sp_children(client, mock_token):
+    """Test a campaign-scoped crawl skips the campaign listing and shards children."""
+    keywords = respx.get(f"{BASE}/v2/sp/keywords").mock(
+        return_value=Response(200, json=[{"keywordId": 1, "adGroupId": 7, "campaignId": 5}])
+    )
+    campaigns = respx.get(f"{BASE}/v2/sp/campaigns")
+
+    events = [
+        event
+        async for event in client.crawl(
+            ad_products=["sp"], entity_types=["keywords"], campaign_ids=[5]
+        )
+    ]
+
+    assert [(e.entity_type, e.entity_id, e.parent_id) for e in events] == [("keywords", "1", "7")]
+    assert keywords.calls[0].request.url.params["campaignIdFilter"] == "5"
+    assert not campaigns.called
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_crawl_account_strategy_applies_campaign_scope(client, mock_token):
+    """Test account listings drop entities outside the requested campaigns."""
+    _mock_sd()
+
+    events = [
+        event
+        async for event in client.crawl(ad_products=["sd"], campaign_ids=["c2"], strategy="account")
+    ]
+
+    assert {e.entity_id for e in events} == {"c2", "a2"}
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_crawl_propagates_listing_errors(client, mock_token):
+    """Test a failing listing aborts the crawl."""
+    respx.get(f"{BASE}/v2/sd/campaigns").mock(return_value=Response(200, json=[]))
+    respx.get(f"{BASE}/v2/sd/adGroups").mock(return_value=Response(400, text="bad filter"))
+
+    with pytest.raises(ValidationError):
+        async for _ in client.crawl(ad_products=["sd"]):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_crawl_rejects_unknown_names(client):
+    """Test unknown ad products and entity types are rejected."""
+    with pytest.raises(ValueError):
+        async for _ in client.crawl(ad_products=["dsp"]):
+            pass
+    with pytest.raises(ValueError):
+        async for _ in client.crawl(entity_types=["creatives"]):
+            pass
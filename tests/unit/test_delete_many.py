@@ -0,0 +1,163 @@
+"""Tests for batched deletes."""
+
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient
+
+BASE = "https://advertising-api.amazon.com"
+KEYWORD_MEDIA_TYPE = "application/vnd.spKeyword.v3+json"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _v3_delete(result_key, id_key, failing=()):
+    def handler(request):
+        ids = json.loads(request.content)[f"{id_key}Filter"]["include"]
+        success, error = [], []
+        for index, entity_id in enumerate(ids):
+            if entity_id in failing:
+                errors = [{"errorType": "ENTITY_NOT_FOUND", "errorValue": {}}]
+                error.append({"index": index, "errors": errors})
+            else:
+                success.append({"index": index, id_key: entity_id})
+        return Response(200, json={result_key: {"success": success, "error": error}})
+
+    return handler
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_sp_delete_many_uses_chunked_v3_bulk_delete(client, mock_token):
+    """Test SP IDs are deduplicated, chunked by 1000 and mapped back to per-ID results."""
+    route = respx.post(f"{BASE}/sp/keywords/delete").mock(
+        side_effect=_v3_delete("keywords", "keywordId", failing={"7"})
+    )
+    ids = [str(i) for i in range(2500)] + ["7", 3]
+
+    results = await client.sp.keywords.delete_many(ids)
+
+    assert route.call_count == 3
+    sizes = [len(json.loads(c.request.content)["keywordIdFilter"]["include"]) for c in route.calls]
+    assert sorted(sizes) == [500, 1000, 1000]
+    request = route.calls[0].request
+    assert request.headers["Content-Type"] == KEYWORD_MEDIA_TYPE
+    assert request.headers["Accept"] == KEYWORD_MEDIA_TYPE
+    assert list(results) == [str(i) for i in range(2500)]
+    assert results["0"] == {"code": "SUCCESS", "keywordId": "0"}
+    assert results["7"]["code"] == "ENTITY_NOT_FOUND"
+    assert results["7"]["errors"][0]["errorType"] == "ENTITY_NOT_FOUND"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_sp_delete_many_reports_failed_chunk_per_id(client, mock_token):
+    """Test a rejected chunk yields REQUEST_FAILED results while other chunks are kept."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return Response(400, json={"message": "Bad request"})
+        return _v3_delete("targetingClauses", "targetId")(request)
+
+    respx.post(f"{BASE}/sp/targets/delete").mock(side_effect=handler)
+
+    results = await client.sp.targets.delete_many([str(i) for i in range(1500)], max_in_flight=1)
+
+    assert results["0"]["code"] == "REQUEST_FAILED"
+    assert results["0"]["retryable"] is False
+    assert results["999"]["code"] == "REQUEST_FAILED"
+    assert results["1000"] == {"code": "SUCCESS", "targetId": "1000"}
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_sp_delete_many_marks_ids_without_result_retryable(client, mock_token):
+    """Test IDs the response leaves out get a retryable REQUEST_FAILED result."""
+    respx.post(f"{BASE}/sp/keywords/delete").mock(
+        return_value=Response(
+            200, json={"keywords": {"success": [{"index": 0, "keywordId": "1"}], "error": []}}
+        )
+    )
+
+    results = await client.sp.keywords.delete_many(["1", "2"])
+
+    assert results["1"]["code"] == "SUCCESS"
+    assert results["2"] == {
+        "code": "REQUEST_FAILED",
+        "description": "No result returned",
+        "retryable": True,
+    }
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_sb_delete_many_archives_with_chunked_edits(client, mock_token):
+    """Test services without a bulk delete archive through edit()."""
+
+    def handler(request):
+        body = json.loads(request.content)
+        assert {item["state"] for item in body} == {"archived"}
+        return Response(
+            200, json=[{"code": "SUCCESS", "campaignId": item["campaignId"]} for item in body]
+        )
+
+    route = respx.put(f"{BASE}/v2/sb/campaigns").mock(side_effect=handler)
+
+    results = await client.sb.campaigns.delete_many([1, 2, 1, 3])
+
+    assert route.call_count == 1
+    assert [item["campaignId"] for item in json.loads(route.calls[0].request.content)] == [1, 2, 3]
+    assert list(results) == ["1", "2", "3"]
+    assert results["2"] == {"code": "SUCCESS", "campaignId": 2}
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_portfolio_delete_many_sends_concurrent_deletes(client, mock_token):
+    """Test portfolios are deleted one request per ID and failures are reported per ID."""
+    respx.delete(f"{BASE}/v2/portfolios/1").mock(
+        return_value=Response(200, json={"code": "SUCCESS", "portfolioId": 1})
+    )
+    respx.delete(f"{BASE}/v2/portfolios/2").mock(
+        return_value=Response(404, json={"message": "Not found"})
+    )
+
+    results = await client.portfolios.delete_many(["1", "2"])
+
+    assert results["1"] == {"code": "SUCCESS", "portfolioId": 1}
+    assert results["2"]["code"] == "REQUEST_FAILED"
+    assert results["2"]["retryable"] is False
+
+
+@pytest.mark.asyncio
+async def test_delete_many_rejects_empty_ids(client):
+    """Test empty IDs are rejected before any request is sent."""
+    with pytest.raises(ValueError):
+        await client.sp.campaigns.delete_many(["1", ""])
+    with pytest.raises(ValueError):
+        await client.sd.campaigns.delete_many([""])
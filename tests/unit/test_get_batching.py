@@ -0,0 +1,121 @@
+"""Tests for automatic batching of concurrent get() calls."""
+
+import asyncio
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, NotFoundError
+from aio_amazon_ads.batching import GetBatcher
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _client(**kwargs):
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        **kwargs,
+    )
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_request(mock_token):
+    """Test concurrent get() calls become one multi-ID list request."""
+    list_route = respx.get("https://advertising-api.amazon.com/v2/sp/keywords").mock(
+        return_value=Response(200, json=[{"keywordId": 1}, {"keywordId": 2}])
+    )
+    get_route = respx.get(url__regex=r".*/v2/sp/keywords/\d+")
+
+    client = _client(get_batch_window=0.0)
+    one, two, again = await asyncio.gather(
+        client.sp.keywords.get("1"),
+        client.sp.keywords.get("2"),
+        client.sp.keywords.get("1"),
+    )
+
+    assert one == again == {"keywordId": 1}
+    assert two == {"keywordId": 2}
+    assert list_route.call_count == 1
+    assert list_route.calls[0].request.url.params["keywordIdFilter"] == "1,2"
+    assert not get_route.called
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_batched_get_missing_entity_raises_not_found(mock_token):
+    """Test an ID missing from the batch fails only its own caller."""
+    respx.get("https://advertising-api.amazon.com/v2/sb/campaigns").mock(
+        return_value=Response(200, json=[{"campaignId": "c1"}])
+    )
+
+    client = _client()
+    client.sb.campaigns.enable_get_batching()
+    found, missing = await asyncio.gather(
+        client.sb.campaigns.get("c1"),
+        client.sb.campaigns.get("c2"),
+        return_exceptions=True,
+    )
+
+    assert found == {"campaignId": "c1"}
+    assert isinstance(missing, NotFoundError)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_get_without_batching_maps_404_to_not_found(mock_token):
+    """Test the unbatched path raises the same error for missing entities."""
+    respx.get("https://advertising-api.amazon.com/v2/sd/campaigns/9").mock(
+        return_value=Response(404, json={"code": "NOT_FOUND"})
+    )
+
+    with pytest.raises(NotFoundError):
+        await _client().sd.campaigns.get("9")
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_on_size_and_window():
+    """Test full batches go out at once and the rest after the window."""
+    batches = []
+
+    async def get_many(ids):
+        batches.append(ids)
+        return {entity_id: {"id": entity_id} for entity_id in ids}
+
+    batcher = GetBatcher(get_many, window=0.01, max_batch_size=2)
+    results = await asyncio.gather(*(batcher.load(i) for i in range(5)))
+
+    assert [r["id"] for r in results] == ["0", "1", "2", "3", "4"]
+    assert batches == [["0", "1"], ["2", "3"], ["4"]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_propagates_errors_to_all_callers():
+    """Test a failing batch fails every waiting caller."""
+
+    async def get_many(ids):
+        raise RuntimeError("boom")
+
+    batcher = GetBatcher(get_many)
+    results = await asyncio.gather(batcher.load("a"), batcher.load("b"), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_services_without_get_many_cannot_batch():
+    """Test enabling batching on a service without get_many() fails."""
+    with pytest.raises(TypeError):
+        _client().profiles.enable_get_batching()
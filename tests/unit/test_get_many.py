@@ -0,0 +1,85 @@
+"""Tests for batched get_many lookups."""
+
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient
+from aio_amazon_ads.pagination import chunk_ids
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def test_chunk_ids_respects_count_and_length():
+    """Test chunks close on count or joined length and drop duplicates."""
+    assert chunk_ids(["1", "2", "2", "3"], chunk_size=2) == [["1", "2"], ["3"]]
+    assert chunk_ids(["aaaa", "bbbb", "cccc"], max_length=9) == [["aaaa", "bbbb"], ["cccc"]]
+    assert chunk_ids([]) == []
+    with pytest.raises(ValueError):
+        chunk_ids(["1"], chunk_size=0)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_sp_campaigns_get_many_chunks_and_reports_missing(client, mock_token):
+    """Test IDs are fetched in chunked filters and missing IDs map to None."""
+    filters = []
+
+    def handler(request):
+        ids = request.url.params["campaignIdFilter"].split(",")
+        filters.append(ids)
+        # Amazon returns numeric IDs; the odd ones do not exist
+        return Response(200, json=[{"campaignId": int(i)} for i in ids if int(i) % 2 == 0])
+
+    respx.get("https://advertising-api.amazon.com/v2/sp/campaigns").mock(side_effect=handler)
+
+    ids = [str(i) for i in range(250)]
+    result = await client.sp.campaigns.get_many(ids)
+
+    assert list(result) == ids
+    assert result["4"] == {"campaignId": 4}
+    assert result["5"] is None
+    assert sorted(len(chunk) for chunk in filters) == [50, 100, 100]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_sb_keywords_get_many(client, mock_token):
+    """Test get_many on a **filters service uses the camelCase ID filter."""
+    route = respx.get("https://advertising-api.amazon.com/v2/sb/keywords").mock(
+        return_value=Response(200, json={"keywords": [{"keywordId": "k1"}, {"keywordId": "k2"}]})
+    )
+
+    result = await client.sb.keywords.get_many(["k1", "k2", "k3"])
+
+    assert result == {"k1": {"keywordId": "k1"}, "k2": {"keywordId": "k2"}, "k3": None}
+    assert route.calls[0].request.url.params["keywordIdFilter"] == "k1,k2,k3"
+
+
+@pytest.mark.asyncio
+async def test_get_many_rejects_empty_ids(client):
+    """Test empty IDs are rejected and no IDs means no requests."""
+    with pytest.raises(ValueError):
+        await client.sp.keywords.get_many(["1", ""])
+    assert await client.portfolios.get_many([]) == {}
@@ -0,0 +1,149 @@
+"""Tests for the in-memory entity index."""
+
+import sys
+import tracemalloc
+
+import pytest
+
+sys.path.insert(0, "src")
+
+from aio_amazon_ads import EntityIndex
+
+
+@pytest.fixture
+def index():
+    index = EntityIndex()
+    index.add("campaigns", {"campaignId": 1, "name": "Brand", "state": "enabled"})
+    index.add_many(
+        "ad_groups",
+        [
+            {"adGroupId": 10, "campaignId": 1, "name": "Shoes"},
+            {"adGroupId": 11, "campaignId": 1, "name": "Socks"},
+        ],
+    )
+    index.add_many(
+        "keywords",
+        [
+            {
+                "keywordId": 100,
+                "adGroupId": 10,
+                "keywordText": "running shoes",
+                "matchType": "exact",
+            },
+            {"keywordId": 101, "adGroupId": 10, "keywordText": "trail shoes", "matchType": "broad"},
+            {"keywordId": 102, "adGroupId": 11, "keywordText": "wool socks", "matchType": "exact"},
+        ],
+    )
+    return index
+
+
+def test_lookups_by_id_parent_and_name(index):
+    """Test ID, parent, name and keyword lookups round-trip entity dicts."""
+    assert len(index) == 6
+    assert ("keywords", 100) in index
+    assert index.get("campaigns", "1") == {"campaignId": 1, "name": "Brand", "state": "enabled"}
+    assert index.parent_id("keywords", 102) == "11"
+    assert index.parent_id("ad_groups", 11) == "1"
+    assert sorted(kw["keywordId"] for kw in index.children("keywords", 10)) == [100, 101]
+    assert index.find_by_name("ad_groups", "Socks", campaign_id=1)["adGroupId"] == 11
+    assert index.find_by_name("campaigns", "Brand")["campaignId"] == 1
+    assert index.find_by_name("ad_groups", "Socks", campaign_id=2) is None
+    assert index.find_keyword(10, "running shoes", "exact")["keywordId"] == 100
+    assert index.find_keyword(10, "running shoes", "broad") is None
+
+
+def test_subtree_yields_descendants(index):
+    """Test subtree queries walk the campaign hierarchy."""
+    subtree = [(entity_type, e) for entity_type, e in index.subtree("campaigns", 1)]
+
+    assert sorted(e["adGroupId"] for t, e in subtree if t == "ad_groups") == [10, 11]
+    assert sorted(e["keywordId"] for t, e in subtree if t == "keywords") == [100, 101, 102]
+    assert list(index.subtree("ad_groups", 11)) == [
+        (
+            "keywords",
+            {"keywordId": 102, "adGroupId": 11, "keywordText": "wool socks", "matchType": "exact"},
+        )
+    ]
+
+
+def test_update_reindexes_changed_fields(index):
+    """Test partial updates move entities between parents and name keys."""
+    assert index.update("keywords", {"keywordId": 101, "adGroupId": 11, "bid": 0.5})
+    assert not index.update("keywords", {"keywordId": 999, "bid": 1.0})
+
+    assert index.get("keywords", 101)["bid"] == 0.5
+    assert sorted(kw["keywordId"] for kw in index.children("keywords", 11)) == [101, 102]
+    assert index.find_keyword(10, "trail shoes", "broad") is None
+    assert index.find_keyword(11, "trail shoes", "broad")["keywordId"] == 101
+
+    assert index.update_many("ad_groups", [{"adGroupId": 10, "name": "Sneakers"}]) == 1
+    assert index.find_by_name("ad_groups", "Shoes", campaign_id=1) is None
+    assert index.find_by_name("ad_groups", "Sneakers", campaign_id=1)["adGroupId"] == 10
+
+
+def test_remove(index):
+    """Test removed entities disappear from every index."""
+    assert index.remove("keywords", 100)
+    assert not index.remove("keywords", 100)
+    assert index.get("keywords", 100) is None
+    assert index.find_keyword(10, "running shoes", "exact") is None
+    assert [kw["keywordId"] for kw in index.children("keywords", 10)] == [101]
+
+
+def test_shared_names_and_keyword_texts_survive_removal(index):
+    """Test entities sharing a name or keyword text stay findable when one goes away."""
+    index.add("campaigns", {"campaignId": 2, "name": "Brand", "state": "archived"})
+    index.add(
+        "keywords",
+        {"keywordId": 103, "adGroupId": 10, "keywordText": "running shoes", "matchType": "exact"},
+    )
+
+    assert index.find_by_name("campaigns", "Brand")["campaignId"] == 1
+    assert index.remove("keywords", 100)
+    assert index.find_keyword(10, "running shoes", "exact")["keywordId"] == 103
+    assert index.remove("campaigns", 1)
+    assert index.find_by_name("campaigns", "Brand")["campaignId"] == 2
+    assert index.update("campaigns", {"campaignId": 2, "name": "Legacy"})
+    assert index.find_by_name("campaigns", "Brand") is None
+
+
+def test_add_rejects_unknown_types_and_missing_ids():
+    """Test invalid input is rejected."""
+    index = EntityIndex()
+    with pytest.raises(ValueError):
+        index.add("creatives", {"creativeId": 1})
+    with pytest.raises(ValueError):
+        index.add("keywords", {"keywordText": "no id"})
+
+
+def _keywords(n):
+    for i in range(n):
+        yield {
+            "keywordId": f"{i:012d}",
+            "adGroupId": f"{i // 100:012d}",
+            "campaignId": f"{i // 1000:012d}",
+            "keywordText": f"keyword {i}",
+            "matchType": "exact",
+            "state": "enabled",
+            "bid": 0.75,
+        }
+
+
+def test_index_uses_less_memory_than_dicts():
+    """Test the index with all its lookups is smaller than the plain dicts."""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        dicts = list(_keywords(20_000))
+        dict_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        del dicts
+
+        baseline = tracemalloc.get_traced_memory()[0]
+        index = EntityIndex()
+        index.add_many("keywords", _keywords(20_000))
+        index_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert index.count("keywords") == 20_000
+    assert index_bytes < dict_bytes * 0.85
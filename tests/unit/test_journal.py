@@ -0,0 +1,149 @@
+"""Tests for the crash-safe write journal."""
+
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, WriteJournal
+from aio_amazon_ads.bulk import REQUEST_FAILED
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _client(journal):
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        write_journal=journal,
+    )
+
+
+def _campaigns(count):
+    return [{"campaignId": str(i), "dailyBudget": 10 + i} for i in range(count)]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_rerun_sends_only_unconfirmed_items(tmp_path, mock_token):
+    """Test a rerun skips items confirmed by the first run and resends the rest."""
+    path = tmp_path / "job.jsonl"
+    sent = []
+    fail = {"chunk": True}
+
+    def handler(request):
+        body = json.loads(request.content)
+        sent.append([item["campaignId"] for item in body])
+        if fail["chunk"] and body[0]["campaignId"] == "100":
+            return Response(400, json={"details": "Bad chunk"})
+        results = [{"code": "SUCCESS", "campaignId": item["campaignId"]} for item in body]
+        # The last campaign fails on its own in the first run
+        if fail["chunk"] and body[-1]["campaignId"] == "249":
+            results[-1] = {"code": "INVALID_ARGUMENT"}
+        return Response(200, json=results)
+
+    respx.put(f"{BASE}/v2/sp/campaigns").mock(side_effect=handler)
+
+    with WriteJournal(path) as journal:
+        first = await _client(journal).sp.campaigns.edit(_campaigns(250))
+    assert sum(r["code"] == REQUEST_FAILED for r in first) == 100
+    assert len(journal) == 149
+
+    fail["chunk"] = False
+    sent.clear()
+    with WriteJournal(path) as journal:
+        assert len(journal) == 149
+        assert journal.in_doubt() == []
+        second = await _client(journal).sp.campaigns.edit(_campaigns(250))
+
+    assert sorted(id for chunk in sent for id in chunk) == sorted(
+        [str(i) for i in range(100, 200)] + ["249"]
+    )
+    assert [r["campaignId"] for r in second] == [str(i) for i in range(250)]
+    assert all(r["code"] == "SUCCESS" for r in second)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_writes_repeated_in_one_run_are_sent(tmp_path, mock_token):
+    """Test a confirmation from the current run does not skip a later identical write."""
+    path = tmp_path / "job.jsonl"
+    route = respx.put(f"{BASE}/v2/sp/campaigns").mock(
+        return_value=Response(200, json=[{"code": "SUCCESS", "campaignId": "1"}])
+    )
+
+    with WriteJournal(path, fsync=False) as journal:
+        client = _client(journal)
+        await client.sp.campaigns.edit(_campaigns(1))
+        await client.sp.campaigns.edit(_campaigns(1))
+        assert route.call_count == 2
+        assert len(journal) == 2
+
+    # A rerun replays both writes from the journal, and a third one is sent
+    with WriteJournal(path, fsync=False) as journal:
+        client = _client(journal)
+        for _ in range(3):
+            await client.sp.campaigns.edit(_campaigns(1))
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_torn_lines_and_unfinished_chunks(tmp_path):
+    """Test a crash mid-write leaves a readable journal with the chunk in doubt."""
+    path = tmp_path / "job.jsonl"
+    with WriteJournal(path, fsync=False) as journal:
+        done = await journal.begin("PUT", "/v2/sp/keywords", [{"keywordId": "1"}])
+        await journal.record(done, [{"code": "SUCCESS", "keywordId": "1"}])
+        await journal.begin("PUT", "/v2/sp/keywords", [{"keywordId": "2"}])
+    with open(path, "a") as file:
+        file.write('{"event": "done", "chu')
+
+    with WriteJournal(path) as journal:
+        assert len(journal.in_doubt()) == 1
+        confirmed = journal.confirmed(
+            "PUT", "/v2/sp/keywords", [{"keywordId": "2"}, {"keywordId": "1"}]
+        )
+        assert confirmed == {1: {"code": "SUCCESS", "keywordId": "1"}}
+        assert journal.confirmed("POST", "/v2/sp/keywords", [{"keywordId": "1"}]) == {}
+        # The confirmation is used up by the first match
+        assert journal.confirmed("PUT", "/v2/sp/keywords", [{"keywordId": "1"}]) == {}
+
+
+@pytest.mark.asyncio
+async def test_torn_line_is_cut_off_before_resuming(tmp_path):
+    """Test records appended after a crash mid-write stay readable over two resumes."""
+    path = tmp_path / "job.jsonl"
+    with WriteJournal(path, fsync=False) as journal:
+        token = await journal.begin("PUT", "/v2/sp/keywords", [{"keywordId": "1"}])
+        await journal.record(token, [{"code": "SUCCESS", "keywordId": "1"}])
+    with open(path, "a") as file:
+        file.write('{"event":"sent","chu')
+
+    with WriteJournal(path, fsync=False) as journal:
+        token = await journal.begin("PUT", "/v2/sp/keywords", [{"keywordId": "2"}])
+        await journal.record(token, [{"code": "SUCCESS", "keywordId": "2"}])
+        await journal.begin("PUT", "/v2/sp/keywords", [{"keywordId": "3"}])
+
+    with WriteJournal(path, fsync=False) as journal:
+        assert len(journal) == 2
+        assert len(journal.in_doubt()) == 1
+        confirmed = journal.confirmed(
+            "PUT", "/v2/sp/keywords", [{"keywordId": "1"}, {"keywordId": "2"}]
+        )
+        assert sorted(confirmed) == [0, 1]
+    with open(path) as file:
+        assert [json.loads(line)["event"] for line in file] == ["sent", "done"] * 2 + ["sent"]
@@ -0,0 +1,96 @@
+"""Tests for the normalized keyword index."""
+
+import sys
+
+sys.path.insert(0, "src")
+
+from aio_amazon_ads import KeywordIndex, normalize_keyword_text
+
+
+def _kw(text, match_type="exact", ad_group_id=1, campaign_id=10, **extra):
+    return {
+        "campaignId": campaign_id,
+        "adGroupId": ad_group_id,
+        "keywordText": text,
+        "matchType": match_type,
+        **extra,
+    }
+
+
+def test_normalize_keyword_text():
+    """Test case, punctuation and whitespace are normalized."""
+    assert normalize_keyword_text("  Running-Shoes!! ") == "running shoes"
+    assert normalize_keyword_text("men's   TRAIL\tshoes") == "men s trail shoes"
+    assert normalize_keyword_text("ＳＨＯＥＳ") == "shoes"
+
+
+def test_duplicates_use_normalized_text():
+    """Test duplicates match on ad group, normalized text and match type."""
+    index = KeywordIndex()
+    index.add_keywords([_kw("Running Shoes"), _kw("old", state="archived")])
+
+    assert index.is_duplicate(_kw("running-shoes"))
+    assert index.is_duplicate(_kw("RUNNING SHOES", match_type="EXACT"))
+    assert not index.is_duplicate(_kw("running shoes", match_type="phrase"))
+    assert not index.is_duplicate(_kw("running shoes", ad_group_id=2))
+    assert not index.is_duplicate(_kw("old"))
+    assert len(index) == 1
+
+
+def test_conflicts_across_ad_group_and_campaign_scope():
+    """Test exact and phrase negatives of the ad group and campaign block keywords."""
+    index = KeywordIndex()
+    index.add_negative_keywords(
+        [
+            _kw("Cheap", match_type="negativePhrase"),
+            {"campaignId": 10, "keywordText": "free shoes", "matchType": "negativeExact"},
+        ]
+    )
+
+    assert index.conflicts(_kw("cheap running shoes")) == [("adGroup", "cheap", "negativephrase")]
+    assert index.conflicts(_kw("Free Shoes", ad_group_id=2)) == [
+        ("campaign", "free shoes", "negativeexact")
+    ]
+    assert index.conflicts(_kw("free shoes for kids", ad_group_id=2)) == []
+    assert index.conflicts(_kw("cheap shoes", ad_group_id=2)) == []
+    assert index.is_duplicate_negative(
+        {"campaignId": 10, "keywordText": "FREE shoes", "matchType": "negativeExact"}
+    )
+
+
+def test_preflight_drops_doomed_rows():
+    """Test preflight keeps input order and reports why rows were dropped."""
+    index = KeywordIndex()
+    index.add_keywords([_kw("running shoes")])
+    index.add_negative_keywords([_kw("cheap", match_type="negativePhrase")])
+
+    rows = [
+        _kw("trail shoes"),
+        _kw("Running Shoes"),
+        _kw("trail-shoes"),
+        _kw("cheap trail shoes"),
+        _kw("hiking boots"),
+    ]
+    result = index.preflight(rows)
+
+    assert [r["keywordText"] for r in result.accepted] == ["trail shoes", "hiking boots"]
+    assert [(r["keywordText"], reason) for r, reason in result.rejected] == [
+        ("Running Shoes", "duplicate"),
+        ("trail-shoes", "duplicate_in_batch"),
+        ("cheap trail shoes", "negative_conflict"),
+    ]
+
+
+def test_preflight_negatives_only_drops_duplicates():
+    """Test negative rows are checked for duplicates only."""
+    index = KeywordIndex()
+    index.add_keywords([_kw("shoes")])
+    index.add_negative_keywords([_kw("cheap", match_type="negativeExact")])
+
+    result = index.preflight(
+        [_kw("CHEAP", match_type="negativeExact"), _kw("shoes", match_type="negativeExact")],
+        negative=True,
+    )
+
+    assert [r["keywordText"] for r in result.accepted] == ["shoes"]
+    assert result.rejected[0][1] == "duplicate"
@@ -1,5 +1,7 @@
 """Comprehensive pagination tests using respx."""
 
+import asyncio
+import json
 import sys
 
 import pytest
@@ -9,7 +11,8 @@ sys.path.insert(0, "src")
 
 import respx
 
-from aio_amazon_ads import AmazonAdsClient
+from aio_amazon_ads import AmazonAdsClient, Cursor
+from aio_amazon_ads.exceptions import AmazonAPIError
 
 
 @pytest.fixture
@@ -526,3 +529,278 @@ async def test_mixed_response_format_pagination(client):
     assert campaigns[0]["campaignId"] == "1"
     assert campaigns[1]["campaignId"] == "2"
     assert call_count == 1
+
+
+def _mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _portfolio_pages(total_pages):
+    """Return a handler serving numbered portfolio pages and its call log."""
+    calls = []
+
+    def handler(request):
+        page = int(request.url.params.get("nextToken", "0"))
+        calls.append(page)
+        body = {"portfolios": [{"portfolioId": str(page)}]}
+        if page + 1 < total_pages:
+            body["nextToken"] = str(page + 1)
+        return Response(200, json=body)
+
+    return handler, calls
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_pagination_prefetches_next_page(client):
+    """Test the next page is fetched while the consumer processes the current one."""
+    _mock_token()
+    handler, calls = _portfolio_pages(3)
+    respx.get("https://advertising-api.amazon.com/v2/portfolios").mock(side_effect=handler)
+
+    seen = []
+    async for portfolio in client.portfolios.list():
+        seen.append(portfolio["portfolioId"])
+        await asyncio.sleep(0.01)
+        # Read-ahead depth 1: exactly one page beyond the current one
+        assert len(calls) == min(len(seen) + 1, 3)
+
+    assert seen == ["0", "1", "2"]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_pagination_prefetch_depth_is_configurable(client):
+    """Test prefetch_pages controls how far ahead pages are fetched."""
+    _mock_token()
+    handler, calls = _portfolio_pages(5)
+    respx.get("https://advertising-api.amazon.com/v2/portfolios").mock(side_effect=handler)
+
+    client.portfolios.prefetch_pages = 0
+    async for _ in client.portfolios.list():
+        await asyncio.sleep(0.01)
+        assert len(calls) == 1
+        break
+
+    calls.clear()
+    client.portfolios.prefetch_pages = 3
+    pages = client.portfolios.list()
+    await pages.__anext__()
+    await asyncio.sleep(0.05)
+    assert calls == [0, 1, 2, 3]
+    await pages.aclose()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_pagination_prefetch_propagates_errors(client):
+    """Test errors raised while prefetching surface to the consumer in order."""
+    _mock_token()
+    responses = iter(
+        [
+            Response(200, json={"portfolios": [{"portfolioId": "1"}], "nextToken": "t"}),
+            Response(404, json={"message": "gone"}),
+        ]
+    )
+    respx.get("https://advertising-api.amazon.com/v2/portfolios").mock(
+        side_effect=lambda request: next(responses)
+    )
+
+    seen = []
+    with pytest.raises(AmazonAPIError):
+        async for portfolio in client.portfolios.list():
+            seen.append(portfolio["portfolioId"])
+
+    assert seen == ["1"]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_list_pages_yields_pages_with_metadata(client):
+    """Test list_pages yields whole pages with index, token, latency and size."""
+    _mock_token()
+    handler, calls = _portfolio_pages(3)
+    respx.get("https://advertising-api.amazon.com/v2/portfolios").mock(side_effect=handler)
+
+    pages = [page async for page in client.portfolios.list_pages()]
+
+    assert [page.index for page in pages] == [0, 1, 2]
+    assert [page.next_token for page in pages] == ["1", "2", None]
+    assert [[p["portfolioId"] for p in page.items] for page in pages] == [["0"], ["1"], ["2"]]
+    assert all(page.latency >= 0 for page in pages)
+    assert all(page.size_bytes > 0 for page in pages)
+    assert len(pages[0]) == 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_list_pages_single_page_endpoint(client):
+    """Test unpaginated endpoints returning a bare list yield a single page."""
+    _mock_token()
+    respx.get("https://advertising-api.amazon.com/v2/sp/keywords").mock(
+        return_value=Response(200, json=[{"keywordId": "1"}, {"keywordId": "2"}])
+    )
+
+    pages = [page async for page in client.sp.keywords.list_pages(campaign_id_filter="9")]
+
+    assert len(pages) == 1
+    assert pages[0].index == 0
+    assert pages[0].next_token is None
+    assert [k["keywordId"] for k in pages[0].items] == ["1", "2"]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_resume_from_serialized_cursor(client):
+    """Test a listing resumes from a persisted cursor with its original filters."""
+    _mock_token()
+    captured = []
+
+    def handler(request):
+        params = dict(request.url.params)
+        captured.append(params)
+        page = int(params.get("nextToken", "0"))
+        body = {"campaigns": [{"campaignId": str(page)}]}
+        if page < 2:
+            body["nextToken"] = str(page + 1)
+        return Response(200, json=body)
+
+    respx.get("https://advertising-api.amazon.com/v2/sp/campaigns").mock(side_effect=handler)
+    # Fetch on demand so the abandoned first run leaves no prefetched request behind
+    client.sp.campaigns.prefetch_pages = 0
+
+    first_run = client.sp.campaigns.list_pages(state_filter="ENABLED")
+    page = await first_run.__anext__()
+    await first_run.aclose()
+    saved = json.dumps(page.cursor.to_dict())
+
+    captured.clear()
+    cursor = Cursor.from_dict(json.loads(saved))
+    resumed = [c["campaignId"] async for c in client.sp.campaigns.list(resume_from=cursor)]
+
+    assert resumed == ["1", "2"]
+    assert captured[0] == {"stateFilter": "ENABLED", "nextToken": "1"}
+    assert captured[1] == {"stateFilter": "ENABLED", "nextToken": "2"}
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_resume_from_continues_page_index_and_ends_without_cursor(client):
+    """Test resumed pages keep counting indexes and the last page has no cursor."""
+    _mock_token()
+    handler, calls = _portfolio_pages(3)
+    respx.get("https://advertising-api.amazon.com/v2/portfolios").mock(side_effect=handler)
+
+    cursor = Cursor("/v2/portfolios", {}, "1", 1)
+    pages = [page async for page in client.portfolios.list_pages(resume_from=cursor)]
+
+    assert [page.index for page in pages] == [1, 2]
+    assert pages[0].cursor == Cursor("/v2/portfolios", {}, "2", 2)
+    assert pages[-1].cursor is None
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_resume_from_rejects_mismatched_cursor(client):
+    """Test cursors cannot resume another endpoint or a different filter set."""
+    cursor = Cursor("/v2/portfolios", {"stateFilter": "enabled"}, "t", 1)
+
+    with pytest.raises(ValueError, match="cannot resume"):
+        async for _ in client.sb.campaigns.list(resume_from=cursor):
+            pass
+    with pytest.raises(ValueError, match="do not match"):
+        async for _ in client.portfolios.list(resume_from=cursor, stateFilter="paused"):
+            pass
+    with pytest.raises(ValueError, match="missing field"):
+        Cursor.from_dict({"path": "/v2/portfolios"})
+
+
+def _index_pages(total_items, delay=0.0):
+    """Return a startIndex/count keyword handler and its (startIndex, count) log."""
+    calls = []
+
+    async def handler(request):
+        start = int(request.url.params["startIndex"])
+        count = int(request.url.params["count"])
+        calls.append((start, count))
+        # Later pages answer faster to prove results are reordered
+        await asyncio.sleep(delay / (start + 1))
+        stop = min(start + count, total_items)
+        return Response(200, json=[{"keywordId": str(i)} for i in range(start, stop)])
+
+    return handler, calls
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_index_pagination_sequential(client):
+    """Test startIndex/count paging stops at the first short page."""
+    _mock_token()
+    handler, calls = _index_pages(5)
+    respx.get("https://advertising-api.amazon.com/v2/sp/keywords").mock(side_effect=handler)
+
+    pages = [page async for page in client.sp.keywords.list_pages(page_size=2)]
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [page.index for page in pages] == [0, 1, 2]
+    assert calls == [(0, 2), (2, 2), (4, 2)]
+    assert pages[0].cursor.next_token == "2"
+    assert pages[-1].cursor is None
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_index_pagination_concurrent_with_total(client):
+    """Test pages are fetched concurrently up to the total and yielded in order."""
+    _mock_token()
+    handler, calls = _index_pages(10, delay=0.02)
+    respx.get("https://advertising-api.amazon.com/v2/sp/targets").mock(side_effect=handler)
+
+    targets = [
+        t["keywordId"] async for t in client.sp.targets.list(page_size=3, total=10, concurrency=4)
+    ]
+
+    assert targets == [str(i) for i in range(10)]
+    assert sorted(calls) == [(0, 3), (3, 3), (6, 3), (9, 3)]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_index_pagination_speculative_window_and_underestimated_total(client):
+    """Test speculation without a total and continuing past a low estimate."""
+    _mock_token()
+    handler, calls = _index_pages(7)
+    respx.get("https://advertising-api.amazon.com/v2/sp/productAds").mock(side_effect=handler)
+
+    ads = [a async for a in client.sp.product_ads.list(page_size=2, concurrency=3)]
+    assert len(ads) == 7
+    assert {start for start, _ in calls} >= {0, 2, 4, 6}
+
+    calls.clear()
+    ads = [a async for a in client.sp.product_ads.list(page_size=2, total=3, concurrency=3)]
+    assert len(ads) == 7
+    assert [start for start, _ in calls] == [0, 2, 4, 6]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_index_pagination_resume_from_cursor(client):
+    """Test index-paginated listings resume at the stored startIndex and filters."""
+    _mock_token()
+    captured = []
+
+    def handler(request):
+        captured.append(dict(request.url.params))
+        return Response(200, json=[{"keywordId": "9"}])
+
+    respx.get("https://advertising-api.amazon.com/v2/sp/negativeKeywords").mock(side_effect=handler)
+
+    cursor = Cursor("/v2/sp/negativeKeywords", {"campaignIdFilter": "5"}, "4", 2)
+    pages = [
+        p async for p in client.sp.negative_keywords.list_pages(page_size=2, resume_from=cursor)
+    ]
+
+    assert pages[0].index == 2
+    assert captured == [{"campaignIdFilter": "5", "startIndex": "4", "count": "2"}]
@@ -0,0 +1,165 @@
+"""Tests for rate-limit telemetry."""
+
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, QuotaTracker
+from aio_amazon_ads.quota import ad_product_for_path, parse_retry_after
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ad_product_for_path():
+    """Test ad product detection from request paths."""
+    assert ad_product_for_path("/v2/sp/campaigns") == "sp"
+    assert ad_product_for_path("/sp/adGroups") == "sp"
+    assert ad_product_for_path("/v2/sb/keywords") == "sb"
+    assert ad_product_for_path("/v2/sd/campaigns/1") == "sd"
+    assert ad_product_for_path("/v2/portfolios") == "common"
+    assert ad_product_for_path("/v2/profiles") == "common"
+
+
+def test_quota_tracker_rates_and_retry_after():
+    """Test rolling rates, throttle rate and Retry-After statistics."""
+    clock = FakeClock()
+    tracker = QuotaTracker(window=10.0, clock=clock)
+
+    for _ in range(20):
+        tracker.record("p1", "/v2/sp/keywords", 200)
+        clock.now += 0.5
+    tracker.record("p1", "/v2/sp/keywords", 429, retry_after=2)
+    tracker.record("p1", "/v2/sp/keywords", 429, retry_after=4)
+
+    [status] = tracker.status()
+    assert status.profile_id == "p1"
+    assert status.ad_product == "sp"
+    assert status.requests == 22
+    assert status.throttled == 2
+    assert status.throttle_rate == pytest.approx(2 / 22)
+    assert status.request_rate == pytest.approx(2.2)
+    assert status.retry_after == pytest.approx(3.0)
+    assert status.last_retry_after == 4
+    assert status.estimated_rps == pytest.approx(2.0)
+    assert status.headroom == pytest.approx(2.0 - 2.2)
+
+
+def test_quota_tracker_window_expiry_and_filters():
+    """Test samples leave the window and status filters by key."""
+    clock = FakeClock()
+    tracker = QuotaTracker(window=10.0, clock=clock)
+
+    tracker.record("p1", "/v2/sp/campaigns", 200)
+    tracker.record("p2", "/v2/sb/campaigns", 200)
+    clock.now += 30
+
+    assert {(s.profile_id, s.ad_product) for s in tracker.status()} == {
+        ("p1", "sp"),
+        ("p2", "sb"),
+    }
+    [status] = tracker.status(profile_id="p2")
+    assert status.requests == 0
+    assert status.estimated_rps is None
+    assert status.headroom is None
+    assert tracker.status(ad_product="sd") == []
+
+
+def test_quota_tracker_throttled_count_follows_expiry():
+    """Test the running throttled count drops as throttled samples leave the window."""
+    clock = FakeClock()
+    tracker = QuotaTracker(window=10.0, clock=clock)
+
+    tracker.record("p1", "/v2/sp/keywords", 429, retry_after=1)
+    clock.now += 6
+    tracker.record("p1", "/v2/sp/keywords", 200)
+    tracker.record("p1", "/v2/sp/keywords", 429, retry_after=1)
+    clock.now += 6
+
+    [status] = tracker.status()
+    assert status.requests == 2
+    assert status.throttled == 1
+
+
+def test_parse_retry_after():
+    """Test Retry-After seconds are parsed and other forms are ignored."""
+    assert parse_retry_after("30") == 30
+    assert parse_retry_after(" 1.5 ") == 2
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("Wed, 21 Oct 2026 07:28:00 GMT") is None
+    assert parse_retry_after("-5") is None
+    assert parse_retry_after("nan") is None
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_client_records_quota_status():
+    """Test requests are recorded and queryable via client.quota_status()."""
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+    respx.get("https://advertising-api.amazon.com/v2/sp/campaigns").mock(
+        return_value=Response(200, json={"campaigns": []})
+    )
+    respx.get("https://advertising-api.amazon.com/v2/portfolios").mock(
+        return_value=Response(200, json={"portfolios": []})
+    )
+
+    tracker = QuotaTracker()
+    client = AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        quota_tracker=tracker,
+    )
+
+    async for _ in client.sp.campaigns.list():
+        pass
+    async for _ in client.portfolios.list():
+        pass
+
+    statuses = {s.ad_product: s for s in client.quota_status()}
+    assert set(statuses) == {"sp", "common"}
+    assert statuses["sp"].requests == 1
+    assert statuses["sp"].throttled == 0
+    assert client.quota_status(ad_product="sp") == [statuses["sp"]]
+    assert client.quota is tracker
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_unparseable_retry_after_does_not_fail_request():
+    """Test a successful response with an HTTP-date Retry-After is still returned."""
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+    respx.get("https://advertising-api.amazon.com/v2/portfolios").mock(
+        return_value=Response(
+            200, json=[], headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}
+        )
+    )
+    client = AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+    assert [p async for p in client.portfolios.list()] == []
+    [status] = client.quota_status()
+    assert status.requests == 1
+    assert status.last_retry_after is None
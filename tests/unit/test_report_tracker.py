@@ -0,0 +1,209 @@
+"""Tests for the multiplexed report tracker."""
+
+import asyncio
+import gzip
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import (
+    AmazonAdsClient,
+    QuotaStatus,
+    ReportError,
+    ReportTimeoutError,
+    ReportTimings,
+    ReportTracker,
+)
+
+BASE = "https://advertising-api.amazon.com"
+
+
+class FakeReports:
+    """Reports service double whose reports become ready after a number of polls."""
+
+    def __init__(self, ready_after, fail=(), download_delay=0.0):
+        self.timings = ReportTimings(default_expected=0.01)
+        self.quota_status = None
+        self.ready_after = ready_after
+        self.fail = set(fail)
+        self.download_delay = download_delay
+        self.polled = []
+        self.polls_in_flight = 0
+        self.max_polls_in_flight = 0
+        self.downloads_in_flight = 0
+        self.max_downloads_in_flight = 0
+
+    async def get_status(self, report_id):
+        self.polled.append(report_id)
+        self.polls_in_flight += 1
+        self.max_polls_in_flight = max(self.max_polls_in_flight, self.polls_in_flight)
+        await asyncio.sleep(0.002)
+        self.polls_in_flight -= 1
+        if report_id in self.fail:
+            return {"reportId": report_id, "status": "FAILURE", "statusDetails": "boom"}
+        if self.polled.count(report_id) >= self.ready_after.get(report_id, 1):
+            return {"reportId": report_id, "status": "SUCCESS", "location": f"url-{report_id}"}
+        return {"reportId": report_id, "status": "IN_PROGRESS"}
+
+    async def download_report(self, url):
+        self.downloads_in_flight += 1
+        self.max_downloads_in_flight = max(self.max_downloads_in_flight, self.downloads_in_flight)
+        await asyncio.sleep(self.download_delay)
+        self.downloads_in_flight -= 1
+        return gzip.compress(json.dumps([{"url": url}]).encode())
+
+
+def _tracker(reports, **options):
+    return ReportTracker(reports, min_interval=0.001, max_interval=0.01, **options)
+
+
+@pytest.mark.asyncio
+async def test_tracker_polls_and_downloads_many_reports():
+    """Test every tracked report is polled until ready, downloaded and yielded once."""
+    ready_after = {f"r{i}": 1 + i % 3 for i in range(30)}
+    reports = FakeReports(ready_after, download_delay=0.005)
+    events = []
+
+    async with _tracker(
+        reports, poll_concurrency=4, download_workers=2, on_progress=events.append
+    ) as tracker:
+        futures = [tracker.track(report_id) for report_id in ready_after]
+        results = [result async for result in tracker.results()]
+
+    assert sorted(result.report_id for result in results) == sorted(ready_after)
+    assert all(result.ok for result in results)
+    assert results[0].rows and results[0].rows[0]["url"].startswith("url-r")
+    assert all(future.done() for future in futures)
+    for report_id, polls in ready_after.items():
+        assert reports.polled.count(report_id) == polls
+    assert reports.max_polls_in_flight <= 4
+    assert reports.max_downloads_in_flight <= 2
+    assert len(tracker) == 0
+    assert {event.status for event in events} == {"IN_PROGRESS", "SUCCESS", "DOWNLOADED"}
+
+
+@pytest.mark.asyncio
+async def test_tracker_polls_soonest_expected_report_first():
+    """Test reports of a kind expected to be ready sooner are polled first."""
+    reports = FakeReports({})
+    reports.timings.observe("sp:slow", 0.2)
+    reports.timings.observe("sp:fast", 0.005)
+
+    async with _tracker(reports, poll_concurrency=1) as tracker:
+        tracker.track("slow", "sp:slow")
+        tracker.track("fast", "sp:fast")
+
+    assert reports.polled == ["fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_tracker_reports_failures_and_deadline_per_report():
+    """Test failed and overdue reports resolve with an error instead of raising."""
+    reports = FakeReports({"ok": 1, "late": 10_000}, fail={"bad"})
+
+    async with _tracker(reports, deadline=0.1) as tracker:
+        ok, bad, late = (tracker.track(report_id) for report_id in ("ok", "bad", "late"))
+
+    assert ok.result().ok
+    assert isinstance(bad.result().error, ReportError)
+    assert bad.result().rows is None
+    assert isinstance(late.result().error, ReportTimeoutError)
+    assert late.result().polls >= 2
+
+
+@pytest.mark.asyncio
+async def test_tracker_caps_poll_rate():
+    """Test max_polls_per_second spaces status polls out."""
+    reports = FakeReports({f"r{i}": 1 for i in range(5)})
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async with _tracker(reports, max_polls_per_second=50) as tracker:
+        for i in range(5):
+            tracker.track(f"r{i}")
+
+    assert loop.time() - started >= 4 / 50
+
+
+@pytest.mark.asyncio
+async def test_failing_progress_callback_does_not_stall_tracking():
+    """Test reports still finish when on_progress raises, even with one download worker."""
+    reports = FakeReports({f"r{i}": 1 + i % 2 for i in range(5)})
+
+    def on_progress(progress):
+        raise RuntimeError("callback bug")
+
+    async with _tracker(reports, download_workers=1, on_progress=on_progress) as tracker:
+        futures = [tracker.track(f"r{i}") for i in range(5)]
+        await asyncio.wait_for(tracker.join(), timeout=5)
+
+    assert all(future.result().ok for future in futures)
+
+
+@pytest.mark.asyncio
+async def test_tracker_paces_polls_by_quota_telemetry():
+    """Test polls are spaced to a share of the profile's estimated sustainable rate."""
+    reports = FakeReports({f"r{i}": 1 for i in range(4)})
+    reports.quota_status = lambda: [
+        QuotaStatus(
+            profile_id="p1",
+            ad_product="sp",
+            requests=100,
+            throttled=1,
+            request_rate=40.0,
+            throttle_rate=0.01,
+            retry_after=1.0,
+            last_retry_after=1,
+            estimated_rps=40.0,
+            headroom=0.0,
+        )
+    ]
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async with _tracker(reports) as tracker:
+        for i in range(4):
+            tracker.track(f"r{i}")
+
+    assert loop.time() - started >= 3 / 20
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_submit_creates_and_tracks_with_the_sp_reports_service():
+    """Test submit() creates the report and the tracker learns its duration."""
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+    respx.post(f"{BASE}/v2/sp/reports").mock(
+        return_value=Response(202, json={"reportId": "report-1", "status": "IN_PROGRESS"})
+    )
+    file_url = "https://reports.example.com/report-1.json.gz"
+    respx.get(f"{BASE}/v2/sp/reports/report-1").mock(
+        return_value=Response(200, json={"status": "SUCCESS", "location": file_url})
+    )
+    rows = [{"campaignId": 1, "clicks": 2}]
+    respx.get(file_url).mock(
+        return_value=Response(200, content=gzip.compress(json.dumps(rows).encode()))
+    )
+    client = AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+    client.sp.reports.timings = ReportTimings(default_expected=0.01)
+
+    async with client.sp.reports.tracker(min_interval=0.001) as tracker:
+        future = await tracker.submit("20240601", ["clicks"])
+
+    assert future.result().rows == rows
+    assert tracker.timings is client.sp.reports.timings
+    assert client.sp.reports.quota_status() == client.quota_status("sp")
+    assert client.sp.reports.timings.expected("sp:clicks") != 0.01
@@ -0,0 +1,155 @@
+"""Tests for the report runner and its poll schedule."""
+
+import gzip
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, ReportError, ReportTimeoutError, ReportTimings
+from aio_amazon_ads.reporting import decode_report, next_poll_delay
+
+BASE = "https://advertising-api.amazon.com"
+LOCATION = f"{BASE}/v2/reports/report-1/download"
+FILE_URL = "https://reports.example.com/report-1.json.gz"
+METRICS = ["impressions", "clicks"]
+
+
+@pytest.fixture
+def client():
+    """Create test client with report timings suited to fast tests."""
+    client = AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+    client.sp.reports.timings = ReportTimings(default_expected=0.02)
+    return client
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _mock_create():
+    return respx.post(f"{BASE}/v2/sp/reports").mock(
+        return_value=Response(202, json={"reportId": "report-1", "status": "IN_PROGRESS"})
+    )
+
+
+def test_poll_delay_closes_in_on_expected_time_then_backs_off():
+    """Test polls halve the remaining time before the expected time and double after it."""
+    assert next_poll_delay(0, 120, 0, 2, 60) == 60
+    assert next_poll_delay(100, 120, 0, 2, 60) == 10
+    assert next_poll_delay(119, 120, 0, 2, 60) == 2
+    assert [next_poll_delay(130, 120, n, 2, 60) for n in range(6)] == [2, 4, 8, 16, 32, 60]
+    assert next_poll_delay(10_000, 120, 5_000, 2, 60) == 60
+
+
+def test_timings_learn_moving_average_per_kind():
+    """Test the first observation replaces the default and later ones are smoothed."""
+    timings = ReportTimings(default_expected=30, smoothing=0.5)
+
+    timings.observe("sp:clicks", 100)
+    timings.observe("sp:clicks", 200)
+
+    assert timings.expected("sp:clicks") == 150
+    assert timings.expected("sp:cost") == 30
+
+
+def test_decode_report_accepts_gzipped_and_plain_json():
+    """Test report files are decompressed when gzipped."""
+    rows = [{"campaignId": 1, "clicks": 3}]
+
+    assert decode_report(gzip.compress(json.dumps(rows).encode())) == rows
+    assert decode_report(json.dumps(rows).encode()) == rows
+    assert decode_report(b"") == []
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_run_polls_until_ready_then_downloads_and_decodes(client, mock_token):
+    """Test run() creates, polls, downloads and reports progress along the way."""
+    create = _mock_create()
+    statuses = iter(
+        [
+            {"reportId": "report-1", "status": "IN_PROGRESS"},
+            {"reportId": "report-1", "status": "IN_PROGRESS"},
+            {"reportId": "report-1", "status": "SUCCESS", "location": LOCATION},
+        ]
+    )
+    status = respx.get(f"{BASE}/v2/sp/reports/report-1").mock(
+        side_effect=lambda request: Response(200, json=next(statuses))
+    )
+    rows = [{"campaignId": 1, "impressions": 10, "clicks": 2}]
+    location = respx.get(LOCATION).mock(return_value=Response(307, headers={"Location": FILE_URL}))
+    file = respx.get(FILE_URL).mock(
+        return_value=Response(200, content=gzip.compress(json.dumps(rows).encode()))
+    )
+    events = []
+
+    result = await client.sp.reports.run(
+        "20240601", METRICS, min_interval=0.001, max_interval=0.01, on_progress=events.append
+    )
+
+    assert result == rows
+    assert json.loads(create.calls[0].request.content) == {
+        "reportDate": "20240601",
+        "metrics": METRICS,
+    }
+    assert status.call_count == 3
+    # The API location needs credentials, the pre-signed file URL must not get them
+    headers = location.calls[0].request.headers
+    assert headers["Authorization"] == "Bearer mock_token"
+    assert headers["Amazon-Advertising-API-ClientId"] == "test_client_id"
+    assert headers["Amazon-Advertising-API-Scope"] == "123456789"
+    assert "Authorization" not in file.calls[0].request.headers
+    assert [event.status for event in events][-2:] == ["SUCCESS", "DOWNLOADED"]
+    assert [event.polls for event in events if event.status == "IN_PROGRESS"] == [0, 1, 2]
+    assert all(event.next_poll is not None for event in events if event.status == "IN_PROGRESS")
+    assert client.sp.reports.timings.expected("sp:clicks,impressions") != 0.02
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_run_raises_report_error_on_failure(client, mock_token):
+    """Test a failed report raises ReportError carrying the report ID."""
+    _mock_create()
+    respx.get(f"{BASE}/v2/sp/reports/report-1").mock(
+        return_value=Response(
+            200, json={"reportId": "report-1", "status": "FAILURE", "statusDetails": "boom"}
+        )
+    )
+
+    with pytest.raises(ReportError) as excinfo:
+        await client.sp.reports.run("20240601", METRICS, min_interval=0.001)
+
+    assert excinfo.value.report_id == "report-1"
+    assert "boom" in str(excinfo.value)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_run_raises_timeout_at_deadline(client, mock_token):
+    """Test a report still in progress at the deadline raises ReportTimeoutError."""
+    _mock_create()
+    status = respx.get(f"{BASE}/v2/sp/reports/report-1").mock(
+        return_value=Response(200, json={"reportId": "report-1", "status": "IN_PROGRESS"})
+    )
+
+    with pytest.raises(ReportTimeoutError) as excinfo:
+        await client.sp.reports.run(
+            "20240601", METRICS, deadline=0.3, min_interval=0.001, max_interval=0.005
+        )
+
+    assert excinfo.value.report_id == "report-1"
+    assert status.call_count >= 2
@@ -355,6 +355,22 @@ async def test_sd_ad_groups_get(client):
     assert route.called
 
 
+@respx.mock
+@pytest.mark.asyncio
+async def test_sd_ad_groups_edit(client):
+    """Test Sponsored Display ad group edit."""
+    mock_token()
+
+    route = respx.put("https://advertising-api.amazon.com/v2/sd/adGroups").mock(
+        return_value=Response(200, json=[{"code": "SUCCESS", "adGroupId": "sdag123"}])
+    )
+
+    result = await client.sd.ad_groups.edit([{"adGroupId": "sdag123", "state": "paused"}])
+
+    assert result[0]["code"] == "SUCCESS"
+    assert route.called
+
+
 @respx.mock
 @pytest.mark.asyncio
 async def test_sd_campaigns_list(client):
@@ -0,0 +1,153 @@
+"""Tests for sharded parallel listing."""
+
+import asyncio
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, shard_by_ids, shard_by_values
+from aio_amazon_ads.exceptions import AmazonAPIError
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def test_shard_builders():
+    """Test shard helpers split values and deduplicate chunked IDs."""
+    assert shard_by_values("state_filter", ["ENABLED", "PAUSED"]) == [
+        {"state_filter": "ENABLED"},
+        {"state_filter": "PAUSED"},
+    ]
+    assert shard_by_ids("campaign_id_filter", [1, 2, 2, 3, 4, 5], chunk_size=2) == [
+        {"campaign_id_filter": "1,2"},
+        {"campaign_id_filter": "3,4"},
+        {"campaign_id_filter": "5"},
+    ]
+    with pytest.raises(ValueError):
+        shard_by_ids("campaign_id_filter", [1], chunk_size=0)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_list_sharded_merges_and_deduplicates(client, mock_token):
+    """Test shards are crawled concurrently, paginated and merged without duplicates."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+        state = request.url.params["stateFilter"]
+        if state == "ENABLED" and "nextToken" not in request.url.params:
+            return Response(200, json={"campaigns": [{"campaignId": 1}], "nextToken": "p2"})
+        if state == "ENABLED":
+            return Response(200, json={"campaigns": [{"campaignId": 2}, {"campaignId": 3}]})
+        # Overlapping shard returns an already seen campaign
+        return Response(200, json={"campaigns": [{"campaignId": 3}, {"campaignId": 4}]})
+
+    respx.get("https://advertising-api.amazon.com/v2/sp/campaigns").mock(side_effect=handler)
+
+    shards = shard_by_values("state_filter", ["ENABLED", "PAUSED", "ARCHIVED"])
+    ids = [c["campaignId"] async for c in client.sp.campaigns.list_sharded(shards)]
+
+    assert sorted(ids) == [1, 2, 3, 4]
+    assert max_in_flight > 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_list_sharded_bounds_concurrency(client, mock_token):
+    """Test no more than `concurrency` shards run at the same time."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        ids = request.url.params["campaignIdFilter"].split(",")
+        return Response(200, json={"adGroups": [{"adGroupId": f"ag{i}"} for i in ids]})
+
+    respx.get("https://advertising-api.amazon.com/v2/sb/adGroups").mock(side_effect=handler)
+
+    shards = shard_by_ids("campaignIdFilter", range(10), chunk_size=1)
+    ad_groups = [a async for a in client.sb.ad_groups.list_sharded(shards, concurrency=2)]
+
+    assert len(ad_groups) == 10
+    assert max_in_flight == 2
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_list_sharded_propagates_shard_errors(client, mock_token):
+    """Test a failing shard aborts the merged stream with its error."""
+
+    def handler(request):
+        if request.url.params["stateFilter"] == "archived":
+            return Response(404, json={"message": "nope"})
+        return Response(200, json={"portfolios": [{"portfolioId": "1"}]})
+
+    respx.get("https://advertising-api.amazon.com/v2/portfolios").mock(side_effect=handler)
+
+    with pytest.raises(AmazonAPIError):
+        async for _ in client.portfolios.list_sharded(
+            shard_by_values("stateFilter", ["enabled", "archived"])
+        ):
+            pass
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_client_max_concurrency_limits_requests(mock_token):
+    """Test the client never has more than max_concurrency requests in flight."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Response(200, json={"campaignId": "1"})
+
+    respx.get(url__regex=r"https://advertising-api.amazon.com/v2/sd/campaigns/\d+").mock(
+        side_effect=handler
+    )
+
+    client = AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        max_concurrency=3,
+    )
+    await asyncio.gather(*(client.sd.campaigns.get(str(i)) for i in range(10)))
+
+    assert max_in_flight == 3
@@ -0,0 +1,209 @@
+"""Tests for the SQLite snapshot store."""
+
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, SnapshotStore
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+class FakeAccount:
+    """Serves extended listings from mutable in-memory entities."""
+
+    def __init__(self):
+        self.campaigns = [{"campaignId": "c1", "lastUpdatedDate": 1}]
+        self.ad_groups = [
+            {"adGroupId": "a1", "campaignId": "c1", "lastUpdatedDate": 1},
+            {"adGroupId": "a2", "campaignId": "c1", "lastUpdatedDate": 1},
+        ]
+        self.keywords = [
+            {"keywordId": "k1", "adGroupId": "a1", "campaignId": "c1", "lastUpdatedDate": 1},
+            {"keywordId": "k2", "adGroupId": "a2", "campaignId": "c1", "lastUpdatedDate": 1},
+        ]
+        self.negative_keywords = [
+            {"keywordId": "n1", "adGroupId": "a1", "campaignId": "c1", "lastUpdatedDate": 1},
+            {"keywordId": "n2", "adGroupId": "a2", "campaignId": "c1", "lastUpdatedDate": 1},
+        ]
+        self.keyword_filters = []
+        self.negative_filters = []
+
+    def mock(self):
+        respx.get(f"{BASE}/v2/portfolios/extended").mock(
+            return_value=Response(200, json=[{"portfolioId": "p1", "lastUpdatedDate": 1}])
+        )
+        respx.get(f"{BASE}/v2/sp/campaigns/extended").mock(
+            side_effect=lambda request: Response(200, json=self.campaigns)
+        )
+        respx.get(f"{BASE}/v2/sp/adGroups/extended").mock(
+            side_effect=lambda request: Response(200, json=self.ad_groups)
+        )
+        respx.get(f"{BASE}/v2/sp/keywords/extended").mock(
+            side_effect=lambda request: self._listing(request, self.keywords, self.keyword_filters)
+        )
+        respx.get(f"{BASE}/v2/sp/negativeKeywords/extended").mock(
+            side_effect=lambda request: self._listing(
+                request, self.negative_keywords, self.negative_filters
+            )
+        )
+        for path in ("targets", "productAds"):
+            respx.get(f"{BASE}/v2/sp/{path}/extended").mock(return_value=Response(200, json=[]))
+
+    def _listing(self, request, items, filters):
+        groups = request.url.params.get("adGroupIdFilter")
+        filters.append(groups)
+        if groups is None:
+            return Response(200, json=items)
+        wanted = groups.split(",")
+        return Response(200, json=[item for item in items if item["adGroupId"] in wanted])
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_first_refresh_is_full_and_queryable(client, mock_token):
+    """Test an empty snapshot downloads every entity and indexes it by parent."""
+    account = FakeAccount()
+    account.mock()
+
+    with SnapshotStore() as store:
+        result = await store.refresh(client)
+
+        assert result.full
+        assert result.upserted == {
+            "portfolios": 1,
+            "campaigns": 1,
+            "ad_groups": 2,
+            "keywords": 2,
+            "negative_keywords": 2,
+        }
+        assert store.refreshed_at is not None
+        assert store.get("keywords", "k1")["adGroupId"] == "a1"
+        assert store.get("portfolios", "p1")["portfolioId"] == "p1"
+        assert [kw["keywordId"] for kw in store.query("keywords", parent_id="a2")] == ["k2"]
+        assert (
+            store.count(
+                "keywords",
+            )
+            == 2
+        )
+        assert len(store.query("ad_groups", campaign_id="c1")) == 2
+        assert account.keyword_filters == [None]
+        assert account.negative_filters == [None]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_incremental_refresh_refetches_changed_subtrees(client, mock_token):
+    """Test only children of changed ad groups are re-fetched and reconciled."""
+    account = FakeAccount()
+    account.mock()
+
+    with SnapshotStore() as store:
+        await store.refresh(client)
+
+        # a1 changed: n1 was deleted and n3 added; a2 is untouched
+        account.ad_groups[0]["lastUpdatedDate"] = 2
+        account.negative_keywords = [
+            {"keywordId": "n2", "adGroupId": "a2", "campaignId": "c1", "lastUpdatedDate": 1},
+            {"keywordId": "n3", "adGroupId": "a1", "campaignId": "c1", "lastUpdatedDate": 2},
+        ]
+        account.negative_filters.clear()
+        result = await store.refresh(client)
+
+        assert not result.full
+        assert result.changed_ad_groups == 1
+        assert account.negative_filters == ["a1"]
+        assert result.upserted == {"ad_groups": 1, "negative_keywords": 1}
+        assert result.deleted == {"negative_keywords": 1}
+        assert store.get("negative_keywords", "n1") is None
+        assert store.get("negative_keywords", "n3") is not None
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_rotating_sweep_picks_up_leaf_only_edits(client, mock_token):
+    """Test leaves edited without touching their ad group are found by the sweep."""
+    account = FakeAccount()
+    account.mock()
+
+    with SnapshotStore() as store:
+        await store.refresh(client)
+
+        account.negative_keywords[0] = {**account.negative_keywords[0], "lastUpdatedDate": 2}
+        account.keywords[1] = {**account.keywords[1], "bid": 0.8, "lastUpdatedDate": 2}
+        account.keyword_filters.clear()
+
+        first = await store.refresh(client, sweep_refreshes=2)
+        second = await store.refresh(client, sweep_refreshes=2)
+
+        assert (first.changed_ad_groups, first.swept_ad_groups) == (0, 1)
+        assert account.keyword_filters == ["a1", "a2"]
+        assert first.upserted == {"negative_keywords": 1}
+        assert second.upserted == {"keywords": 1}
+        assert store.get("keywords", "k2")["bid"] == 0.8
+        assert store.get("negative_keywords", "n1")["lastUpdatedDate"] == 2
+
+        # The rotation wraps around
+        account.keyword_filters.clear()
+        await store.refresh(client, sweep_refreshes=2)
+        assert account.keyword_filters == ["a1"]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_incremental_refresh_drops_children_of_deleted_ad_groups(client, mock_token):
+    """Test deleting an ad group removes it and its children from the snapshot."""
+    account = FakeAccount()
+    account.mock()
+
+    with SnapshotStore() as store:
+        await store.refresh(client)
+
+        account.ad_groups = account.ad_groups[:1]
+        account.keywords = account.keywords[:1]
+        account.negative_filters.clear()
+        result = await store.refresh(client)
+
+        # Only the sweep visits the remaining ad group
+        assert account.negative_filters == ["a1"]
+        assert result.deleted == {"ad_groups": 1, "keywords": 1, "negative_keywords": 1}
+        assert store.get("ad_groups", "a2") is None
+        assert store.query("keywords", parent_id="a2") == []
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_snapshot_persists_to_file(client, mock_token, tmp_path):
+    """Test a file-backed snapshot survives reopening."""
+    FakeAccount().mock()
+    path = tmp_path / "account.db"
+
+    with SnapshotStore(path) as store:
+        await store.refresh(client)
+    with SnapshotStore(path) as store:
+        assert store.count("campaigns") == 1
+        assert store.refreshed_at is not None
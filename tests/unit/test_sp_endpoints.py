@@ -402,6 +402,24 @@ async def test_negative_keywords_delete(client):
     assert route.called
 
 
+@respx.mock
+@pytest.mark.asyncio
+async def test_negative_keywords_edit(client):
+    """Test editing negative keywords."""
+    mock_token()
+
+    route = respx.put("https://advertising-api.amazon.com/v2/sp/negativeKeywords").mock(
+        return_value=Response(200, json=[{"code": "SUCCESS", "keywordId": "202"}])
+    )
+
+    result = await client.sp.negative_keywords.edit([{"keywordId": "202", "state": "archived"}])
+
+    assert result[0]["code"] == "SUCCESS"
+    assert route.called
+    with pytest.raises(ValueError):
+        await client.sp.negative_keywords.edit([{"state": "archived"}])
+
+
 @respx.mock
 @pytest.mark.asyncio
 async def test_targets_get(client):
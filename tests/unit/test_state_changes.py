@@ -0,0 +1,114 @@
+"""Tests for predicate-driven and batched state changes."""
+
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _success(id_key):
+    def handler(request):
+        body = json.loads(request.content)
+        return Response(200, json=[{"code": "SUCCESS", id_key: item[id_key]} for item in body])
+
+    return handler
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_set_state_where_edits_only_matching_entities(client, mock_token):
+    """Test matches are paused while entities already paused or archived are skipped."""
+    listing = respx.get(f"{BASE}/v2/sp/keywords").mock(
+        return_value=Response(
+            200,
+            json=[
+                {"keywordId": 1, "campaignId": 7, "state": "enabled", "bid": 2.0},
+                {"keywordId": 2, "campaignId": 7, "state": "enabled", "bid": 0.2},
+                {"keywordId": 3, "campaignId": 8, "state": "paused", "bid": 3.0},
+                {"keywordId": 4, "campaignId": 8, "state": "archived", "bid": 3.0},
+                {"keywordId": 5, "campaignId": 8, "state": "enabled", "bid": 1.5},
+            ],
+        )
+    )
+    edits = respx.put(f"{BASE}/v2/sp/keywords").mock(side_effect=_success("keywordId"))
+    snapshots = []
+
+    result = await client.sp.keywords.set_state_where(
+        lambda keyword: keyword["bid"] > 1.0,
+        "PAUSED",
+        campaign_ids=["7", "8"],
+        on_progress=lambda progress: snapshots.append(progress.succeeded),
+    )
+
+    assert listing.calls[0].request.url.params["campaignIdFilter"] == "7,8"
+    sent = [item for call in edits.calls for item in json.loads(call.request.content)]
+    assert sent == [{"keywordId": 1, "state": "paused"}, {"keywordId": 5, "state": "paused"}]
+    assert result.ok
+    assert [item.item["keywordId"] for item in result.succeeded] == [1, 5]
+    assert snapshots == [1, 2]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_archive_many_reports_per_id_outcomes(client, mock_token):
+    """Test a batched archive sends chunked edits and maps failures to their IDs."""
+    sizes = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        sizes.append(len(body))
+        return Response(
+            200,
+            json=[
+                {"code": "NOT_FOUND"} if item["keywordId"] == "13" else {"code": "SUCCESS"}
+                for item in body
+            ],
+        )
+
+    respx.put(f"{BASE}/v2/sp/negativeKeywords").mock(side_effect=handler)
+
+    result = await client.sp.negative_keywords.archive_many(
+        [str(i) for i in range(2500)], max_in_flight=2
+    )
+
+    assert sorted(sizes) == [500, 1000, 1000]
+    assert len(result.succeeded) == 2499
+    assert [(item.index, item.code) for item in result.failed] == [(13, "NOT_FOUND")]
+
+
+@pytest.mark.asyncio
+async def test_state_changes_validate_arguments(client):
+    """Test invalid states and unscopable services are rejected."""
+    with pytest.raises(ValueError):
+        await client.sp.campaigns.set_state_many(["1"], "deleted")
+    with pytest.raises(TypeError):
+        await client.portfolios.set_state_where(lambda p: True, "paused", campaign_ids=["1"])
+    with pytest.raises(TypeError):
+        await client.profiles.archive_many(["1"])
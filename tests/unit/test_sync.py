@@ -0,0 +1,109 @@
+"""Tests for diff-based edits."""
+
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient
+from aio_amazon_ads.sync import diff_entity
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def test_diff_entity_keeps_id_and_changed_fields():
+    """Test unchanged fields are stripped and float noise is ignored."""
+    current = {"keywordId": 1, "bid": 0.30000000000000004, "state": "enabled", "adGroupId": 5}
+
+    assert (
+        diff_entity({"keywordId": "1", "bid": 0.3, "state": "enabled"}, current, "keywordId")
+        is None
+    )
+    assert diff_entity(
+        {"keywordId": "1", "bid": 0.4, "state": "enabled"}, current, "keywordId"
+    ) == {
+        "keywordId": "1",
+        "bid": 0.4,
+    }
+    assert diff_entity({"keywordId": "1", "name": "new"}, current, "keywordId") == {
+        "keywordId": "1",
+        "name": "new",
+    }
+    # A flag is not the number 1
+    assert diff_entity({"keywordId": "1", "adGroupId": True}, {"adGroupId": 1}, "keywordId")
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_sync_sends_only_the_delta(client, mock_token):
+    """Test known entities are diffed and unknown ones are fetched in one batch."""
+    respx.get(f"{BASE}/v2/sp/keywords").mock(
+        return_value=Response(200, json=[{"keywordId": 3, "bid": 1.0, "state": "enabled"}])
+    )
+    edits = respx.put(f"{BASE}/v2/sp/keywords").mock(
+        side_effect=lambda request: Response(
+            200,
+            json=[
+                {"code": "SUCCESS", "keywordId": i["keywordId"]}
+                for i in json.loads(request.content)
+            ],
+        )
+    )
+    current = {
+        "1": {"keywordId": 1, "bid": 0.5, "state": "enabled"},
+        "2": {"keywordId": 2, "bid": 0.7, "state": "enabled"},
+    }
+    desired = [
+        {"keywordId": "1", "bid": 0.5, "state": "enabled"},
+        {"keywordId": "2", "bid": 0.9, "state": "enabled"},
+        {"keywordId": "3", "bid": 1.0, "state": "paused"},
+        {"keywordId": "4", "bid": 1.0},
+    ]
+
+    result = await client.sp.keywords.sync_desired_state(desired, current)
+
+    assert json.loads(edits.calls[0].request.content) == [
+        {"keywordId": "2", "bid": 0.9},
+        {"keywordId": "3", "state": "paused"},
+    ]
+    assert result.unchanged == ["1"]
+    assert result.missing == [{"keywordId": "4", "bid": 1.0}]
+    assert [r["keywordId"] for r in result.results] == ["2", "3"]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_sync_without_changes_sends_nothing(client, mock_token):
+    """Test no edit is sent when everything is already in the desired state."""
+    edits = respx.put(f"{BASE}/v2/sp/keywords")
+
+    result = await client.sp.keywords.sync_desired_state(
+        [{"keywordId": "1", "bid": 0.5}], {"1": {"keywordId": 1, "bid": 0.5}}
+    )
+
+    assert not edits.called
+    assert result.changes == []
+    assert result.unchanged == ["1"]
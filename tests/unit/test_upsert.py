@@ -0,0 +1,170 @@
+"""Tests for idempotent upserts."""
+
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient
+from aio_amazon_ads.upsert import SP_TARGET_KEY
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def _success(request):
+    return Response(200, json=[{"code": "SUCCESS"} for _ in json.loads(request.content)])
+
+
+def test_target_key_ignores_expression_order_and_case():
+    """Test target expressions match regardless of predicate order and case."""
+    a = {
+        "adGroupId": 1,
+        "expression": [
+            {"type": "asinCategorySameAs", "value": "123"},
+            {"type": "asinBrandSameAs", "value": "456"},
+        ],
+    }
+    b = {
+        "adGroupId": "1",
+        "expression": [
+            {"value": "456", "type": "ASINBRANDSAMEAS"},
+            {"type": "asinCategorySameAs", "value": "123"},
+        ],
+    }
+
+    assert SP_TARGET_KEY(a) == SP_TARGET_KEY(b)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_keyword_upsert_splits_creates_and_edits(client, mock_token):
+    """Test keywords are matched by normalized text and match type within their ad group."""
+    lookup = respx.get(f"{BASE}/v2/sp/keywords").mock(
+        return_value=Response(
+            200,
+            json=[
+                {
+                    "keywordId": 1,
+                    "adGroupId": 10,
+                    "keywordText": "Running Shoes",
+                    "matchType": "exact",
+                    "bid": 0.5,
+                    "state": "enabled",
+                },
+                {
+                    "keywordId": 2,
+                    "adGroupId": 10,
+                    "keywordText": "trail shoes",
+                    "matchType": "exact",
+                    "bid": 0.8,
+                    "state": "enabled",
+                },
+                {
+                    "keywordId": 3,
+                    "adGroupId": 10,
+                    "keywordText": "old shoes",
+                    "matchType": "exact",
+                    "bid": 0.8,
+                    "state": "archived",
+                },
+            ],
+        )
+    )
+    creates = respx.post(f"{BASE}/v2/sp/keywords").mock(side_effect=_success)
+    edits = respx.put(f"{BASE}/v2/sp/keywords").mock(side_effect=_success)
+
+    result = await client.sp.keywords.upsert(
+        [
+            {
+                "campaignId": 5,
+                "adGroupId": 10,
+                "keywordText": "running-shoes",
+                "matchType": "EXACT",
+                "bid": 0.7,
+            },
+            {
+                "campaignId": 5,
+                "adGroupId": 10,
+                "keywordText": "trail shoes",
+                "matchType": "exact",
+                "bid": 0.8,
+            },
+            {
+                "campaignId": 5,
+                "adGroupId": 10,
+                "keywordText": "old shoes",
+                "matchType": "exact",
+                "bid": 0.9,
+            },
+            {
+                "campaignId": 5,
+                "adGroupId": 11,
+                "keywordText": "sandals",
+                "matchType": "broad",
+                "bid": 0.3,
+            },
+        ]
+    )
+
+    assert lookup.calls[0].request.url.params["adGroupIdFilter"] == "10,11"
+    assert json.loads(edits.calls[0].request.content) == [{"keywordId": 1, "bid": 0.7}]
+    assert [k["keywordText"] for k in json.loads(creates.calls[0].request.content)] == [
+        "old shoes",
+        "sandals",
+    ]
+    assert result.unchanged == ["2"]
+    assert len(result.created) == 2
+    assert len(result.edited) == 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_campaign_upsert_uses_given_entities(client, mock_token):
+    """Test known entities skip the lookup and duplicate inputs are merged."""
+    lookup = respx.get(f"{BASE}/v2/sp/campaigns")
+    edits = respx.put(f"{BASE}/v2/sp/campaigns").mock(side_effect=_success)
+    creates = respx.post(f"{BASE}/v2/sp/campaigns")
+
+    result = await client.sp.campaigns.upsert(
+        [{"name": "Shoes", "dailyBudget": 10}, {"name": "Shoes", "state": "paused"}],
+        existing=[{"campaignId": 7, "name": "Shoes", "dailyBudget": 5, "state": "enabled"}],
+    )
+
+    assert not lookup.called
+    assert not creates.called
+    assert json.loads(edits.calls[0].request.content) == [
+        {"campaignId": 7, "dailyBudget": 10, "state": "paused"}
+    ]
+    assert result.creates == []
+
+
+@pytest.mark.asyncio
+async def test_upsert_requires_natural_key(client):
+    """Test services without a natural key reject upserts."""
+    with pytest.raises(TypeError):
+        await client.portfolios.upsert([{"name": "x"}])
+    with pytest.raises(ValueError):
+        await client.sp.keywords.upsert([{"adGroupId": 1, "keywordText": "x"}])
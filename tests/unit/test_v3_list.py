@@ -0,0 +1,136 @@
+"""Tests for the SP v3 POST list endpoints."""
+
+import json
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient
+from aio_amazon_ads.base import v3_list_body
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+@pytest.fixture
+def mock_token():
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+
+
+def test_v3_list_body():
+    """Test filters are wrapped in include lists and None filters dropped."""
+    assert v3_list_body(
+        100,
+        stateFilter="ENABLED,PAUSED",
+        campaignIdFilter=[1, 2],
+        adGroupIdFilter=None,
+    ) == {
+        "maxResults": 100,
+        "stateFilter": {"include": ["ENABLED", "PAUSED"]},
+        "campaignIdFilter": {"include": ["1", "2"]},
+    }
+    with pytest.raises(ValueError):
+        v3_list_body(0)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_campaigns_list_v3_paginates_with_body_token(client, mock_token):
+    """Test v3 campaigns listing posts filters, media types and nextToken in the body."""
+    bodies = []
+    headers = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        headers.append(request.headers)
+        if "nextToken" not in body:
+            return Response(
+                200, json={"campaigns": [{"campaignId": "1"}], "nextToken": "n1", "totalResults": 2}
+            )
+        return Response(200, json={"campaigns": [{"campaignId": "2"}], "totalResults": 2})
+
+    respx.post("https://advertising-api.amazon.com/sp/campaigns/list").mock(side_effect=handler)
+
+    campaigns = [
+        c["campaignId"]
+        async for c in client.sp.campaigns.list_v3(
+            state_filter=["ENABLED", "PAUSED"], campaign_id_filter=["1", "2"], max_results=1
+        )
+    ]
+
+    assert campaigns == ["1", "2"]
+    assert bodies[0] == {
+        "maxResults": 1,
+        "stateFilter": {"include": ["ENABLED", "PAUSED"]},
+        "campaignIdFilter": {"include": ["1", "2"]},
+    }
+    assert bodies[1]["nextToken"] == "n1"
+    assert headers[0]["content-type"] == "application/vnd.spCampaign.v3+json"
+    assert headers[0]["accept"] == "application/vnd.spCampaign.v3+json"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_campaigns_list_v3_keeps_generator_state_filter(client, mock_token):
+    """Test a state filter given as a generator is validated and still sent."""
+    route = respx.post("https://advertising-api.amazon.com/sp/campaigns/list").mock(
+        return_value=Response(200, json={"campaigns": []})
+    )
+
+    async for _ in client.sp.campaigns.list_v3(state_filter=(s for s in ["ENABLED", "PAUSED"])):
+        pass
+
+    body = json.loads(route.calls[0].request.content)
+    assert body["stateFilter"] == {"include": ["ENABLED", "PAUSED"]}
+
+
+@pytest.mark.asyncio
+async def test_campaigns_list_v3_validates_states(client):
+    """Test invalid campaign states are rejected before any request."""
+    with pytest.raises(ValueError):
+        async for _ in client.sp.campaigns.list_v3(state_filter="ENABLED,BROKEN"):
+            pass
+
+
+@respx.mock
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("service", "path", "items_key", "media_type"),
+    [
+        ("ad_groups", "/sp/adGroups/list", "adGroups", "spAdGroup"),
+        ("keywords", "/sp/keywords/list", "keywords", "spKeyword"),
+        ("targets", "/sp/targets/list", "targetingClauses", "spTargetingClause"),
+        ("product_ads", "/sp/productAds/list", "productAds", "spProductAd"),
+        ("negative_keywords", "/sp/negativeKeywords/list", "negativeKeywords", "spNegativeKeyword"),
+    ],
+)
+async def test_list_v3_endpoints(client, mock_token, service, path, items_key, media_type):
+    """Test every SP v3 list mode targets its endpoint with its media type."""
+    route = respx.post(f"https://advertising-api.amazon.com{path}").mock(
+        return_value=Response(200, json={items_key: [{"id": "1"}, {"id": "2"}]})
+    )
+
+    pages = [
+        page async for page in getattr(client.sp, service).list_v3_pages(campaign_id_filter="7,8")
+    ]
+
+    assert [item["id"] for item in pages[0].items] == ["1", "2"]
+    request = route.calls[0].request
+    assert request.headers["content-type"] == f"application/vnd.{media_type}.v3+json"
+    assert json.loads(request.content)["campaignIdFilter"] == {"include": ["7", "8"]}
@@ -0,0 +1,217 @@
+"""Tests for the write-behind buffer."""
+
+import asyncio
+import sys
+
+import pytest
+
+sys.path.insert(0, "src")
+
+import respx
+from httpx import Response
+
+from aio_amazon_ads import AmazonAdsClient, ServerError, ValidationError, WriteBuffer
+
+BASE = "https://advertising-api.amazon.com"
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return AmazonAdsClient(
+        refresh_token="test_refresh_token",
+        profile_id="123456789",
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+    )
+
+
+class RecordingEdit:
+    """Fake bulk edit recording every batch."""
+
+    def __init__(self, error=None):
+        self.batches = []
+        self.error = error
+
+    async def __call__(self, items):
+        self.batches.append(items)
+        if self.error is not None:
+            raise self.error
+        return [{"code": "SUCCESS", "keywordId": item["keywordId"]} for item in items]
+
+
+@pytest.mark.asyncio
+async def test_updates_are_merged_per_entity():
+    """Test field-level merge with last write wins."""
+    edit = RecordingEdit()
+    buffer = WriteBuffer(edit, "keywordId", flush_interval=None)
+
+    await buffer.put({"keywordId": "1", "bid": 0.5})
+    await buffer.put({"keywordId": "2", "bid": 1.0})
+    await buffer.put({"keywordId": "1", "state": "paused"})
+    await buffer.put({"keywordId": "1", "bid": 0.7})
+    assert len(buffer) == 2
+    assert edit.batches == []
+
+    results = await buffer.flush()
+
+    assert edit.batches == [
+        [{"keywordId": "1", "bid": 0.7, "state": "paused"}, {"keywordId": "2", "bid": 1.0}]
+    ]
+    assert [r["keywordId"] for r in results] == ["1", "2"]
+    assert (buffer.received, buffer.sent) == (4, 2)
+    assert await buffer.flush() == []
+
+
+@pytest.mark.asyncio
+async def test_flushes_on_size_and_interval():
+    """Test the size trigger flushes inline and the timer flushes in the background."""
+    edit = RecordingEdit()
+    buffer = WriteBuffer(edit, "keywordId", max_pending=2, flush_interval=0.01)
+
+    await buffer.put({"keywordId": "1", "bid": 0.1})
+    await buffer.put({"keywordId": "2", "bid": 0.2})
+    assert len(edit.batches) == 1
+
+    await buffer.put({"keywordId": "3", "bid": 0.3})
+    await asyncio.sleep(0.05)
+    assert edit.batches[1] == [{"keywordId": "3", "bid": 0.3}]
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_background_errors_surface_on_next_flush():
+    """Test a failed timer flush is raised by the next flush()."""
+    edit = RecordingEdit(error=ValidationError("bad"))
+    buffer = WriteBuffer(edit, "keywordId", flush_interval=0)
+
+    await buffer.put({"keywordId": "1", "bid": 0.1})
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(ValidationError):
+        await buffer.flush()
+    assert await buffer.flush() == []
+
+
+@pytest.mark.asyncio
+async def test_transient_item_failures_are_requeued_under_newer_fields():
+    """Test a throttled update is buffered again without overwriting newer values."""
+    buffer = WriteBuffer(None, "keywordId", flush_interval=None)
+    batches = []
+
+    async def edit(items):
+        batches.append(items)
+        if len(batches) == 1:
+            await buffer.put({"keywordId": "1", "bid": 0.9})
+            return [{"code": "THROTTLED"}, {"code": "SUCCESS", "keywordId": "2"}]
+        return [{"code": "SUCCESS", "keywordId": item["keywordId"]} for item in items]
+
+    buffer._edit = edit
+    await buffer.put({"keywordId": "1", "bid": 0.5, "state": "paused"})
+    await buffer.put({"keywordId": "2", "bid": 1.0})
+
+    await buffer.flush()
+    assert len(buffer) == 1
+    await buffer.close()
+
+    assert batches[1] == [{"keywordId": "1", "bid": 0.9, "state": "paused"}]
+    assert buffer.failed == []
+
+
+@pytest.mark.asyncio
+async def test_permanent_failures_are_reported_not_requeued():
+    """Test rejected updates reach failed and on_failure and are not sent again."""
+    reported = []
+
+    async def edit(items):
+        return [{"code": "INVALID_ARGUMENT", "description": "bid too low"} for _ in items]
+
+    buffer = WriteBuffer(edit, "keywordId", flush_interval=0, on_failure=reported.extend)
+    await buffer.put({"keywordId": "1", "bid": 0.01})
+    await asyncio.sleep(0.01)
+
+    assert len(buffer) == 0
+    assert [item.item for item in buffer.failed] == [{"keywordId": "1", "bid": 0.01}]
+    assert reported == buffer.failed
+    assert buffer.failed[0].code == "INVALID_ARGUMENT"
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_updates_for_close_to_retry():
+    """Test a transient request failure keeps the update and close() sends it again."""
+    edit = RecordingEdit(error=ServerError("unavailable"))
+    buffer = WriteBuffer(edit, "keywordId", flush_interval=None, max_retries=2)
+    await buffer.put({"keywordId": "1", "bid": 0.5})
+
+    results = await buffer.flush()
+    assert results[0]["code"] == "REQUEST_FAILED"
+    assert len(buffer) == 1
+
+    edit.error = None
+    assert await buffer.close() == []
+    assert len(edit.batches) == 2
+    assert edit.batches[-1] == [{"keywordId": "1", "bid": 0.5}]
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_close_retries_until_retries_run_out():
+    """Test close() keeps flushing a failing update and then reports it."""
+    edit = RecordingEdit(error=ServerError("unavailable"))
+    async with WriteBuffer(edit, "keywordId", flush_interval=None, max_retries=2) as buffer:
+        await buffer.put({"keywordId": "1", "bid": 0.5})
+
+    assert len(edit.batches) == 3
+    assert len(buffer) == 0
+    assert [item.result["code"] for item in buffer.failed] == ["REQUEST_FAILED"]
+    assert buffer.failed[0].item == {"keywordId": "1", "bid": 0.5}
+
+
+@pytest.mark.asyncio
+async def test_unmatched_results_are_reported_as_failed():
+    """Test a result list of the wrong length fails every update instead of dropping them."""
+
+    async def edit(items):
+        return [{"code": "SUCCESS"}]
+
+    buffer = WriteBuffer(edit, "keywordId", flush_interval=None)
+    await buffer.put({"keywordId": "1", "bid": 0.5})
+    await buffer.put({"keywordId": "2", "bid": 0.5})
+
+    failed = await buffer.close()
+    assert [item.item["keywordId"] for item in failed] == ["1", "2"]
+    assert all(item.code == "REQUEST_FAILED" for item in failed)
+
+
+@pytest.mark.asyncio
+async def test_put_requires_id():
+    """Test updates without the entity ID are rejected."""
+    buffer = WriteBuffer(RecordingEdit(), "keywordId")
+
+    with pytest.raises(ValueError):
+        await buffer.put({"bid": 0.1})
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_service_write_buffer_flushes_on_exit(client):
+    """Test the service buffer sends one bulk edit when the context exits."""
+    respx.post("https://api.amazon.com/auth/o2/token").mock(
+        return_value=Response(200, json={"access_token": "mock_token", "expires_in": 3600})
+    )
+    route = respx.put(f"{BASE}/v2/sp/keywords").mock(
+        return_value=Response(200, json=[{"code": "SUCCESS", "keywordId": "1"}])
+    )
+
+    async with client.sp.keywords.write_buffer(flush_interval=None) as buffer:
+        for bid in (0.5, 0.6, 0.7):
+            await buffer.put({"keywordId": "1", "bid": bid})
+
+    assert route.call_count == 1
+    assert route.calls[0].request.content == b'[{"keywordId":"1","bid":0.7}]'
+
+
+def test_write_buffer_requires_edit(client):
+    """Test services without edit() have no write buffer."""
+    with pytest.raises(TypeError):
+        client.profiles.write_buffer()